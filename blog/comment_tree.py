@@ -0,0 +1,30 @@
+from collections import defaultdict
+from django.db.models import Count, Q, F, FloatField, ExpressionWrapper
+from .models import Comments
+
+
+def annotate_reactions(queryset):
+    return queryset.annotate(
+        likes_total=Count('postreaction', filter=Q(postreaction__reaction='like')),
+        dislikes_total=Count('postreaction', filter=Q(postreaction__reaction='dislike')),
+    ).annotate(
+        score=ExpressionWrapper(
+            (F('likes_total') + 1.0) / (F('dislikes_total') + 1.0),
+            output_field=FloatField()
+        )
+    )
+
+
+def top_level_comments(blog):
+    return annotate_reactions(Comments.objects.filter(blog=blog, parent=None))
+
+
+def load_replies(blog):
+    replies = annotate_reactions(
+        Comments.objects.filter(blog=blog, parent__isnull=False)
+    ).order_by('created_at')
+
+    children = defaultdict(list)
+    for reply in replies:
+        children[reply.parent_id].append(reply)
+    return children
@@ -1,7 +1,7 @@
 from django.db import models
 from users.models import CustomUser
 from django.utils.text import slugify
-from django.db.models import Q
+from django.db.models import Q, F, FloatField, ExpressionWrapper
 
 class HashTags(models.Model):
     name = models.CharField(max_length=100, unique=True)
@@ -25,13 +25,31 @@ class Blog(models.Model):
     image = models.ImageField(upload_to="blog-images/", null=True, blank=True)
     hashtags = models.ManyToManyField('HashTags', related_name="posts", blank=True)
     tags = models.ManyToManyField(Tag, related_name='posts', blank=True)
+    likes_count = models.IntegerField(default=0)
+    dislikes_count = models.IntegerField(default=0)
+    score = models.FloatField(default=1.0)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-score', '-blog_id'], name='blog_score_idx'),
+        ]
 
     def __str__(self):
         return self.blog_title
+
+    @classmethod
+    def apply_reaction(cls, blog_id, likes=0, dislikes=0):
+        cls.objects.filter(blog_id=blog_id).update(
+            likes_count=F('likes_count') + likes,
+            dislikes_count=F('dislikes_count') + dislikes,
+            score=ExpressionWrapper(
+                (F('likes_count') + likes + 1.0) / (F('dislikes_count') + dislikes + 1.0),
+                output_field=FloatField()
+            )
+        )
     
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -46,12 +64,12 @@ class Blog(models.Model):
 
     @property 
     def like_count(self):
-        return PostReaction.objects.filter(blog=self, reaction='like').count()
+        return self.likes_count
 
 
     @property
     def dislike_count(self):
-        return PostReaction.objects.filter(blog=self, reaction='dislike').count()
+        return self.dislikes_count
 
 
 
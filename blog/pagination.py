@@ -0,0 +1,11 @@
+from officekhaja.pagination import KeysetPagination
+
+
+class CommentCursorPagination(KeysetPagination):
+    page_size = 10
+    ordering = ('-score', '-comment_id')
+
+
+class BlogFeedPagination(KeysetPagination):
+    page_size = 10
+    ordering = ('-score', '-blog_id')
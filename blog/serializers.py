@@ -1,9 +1,11 @@
-import re, math, string
+import math
 from rest_framework import serializers
-from collections import Counter
+from django.db import transaction
 from users.serializers import UserSerializer
-from nltk.corpus import stopwords
 from .models import Blog, Comments,  HashTags, BlogMetadata, Tag, PostReaction
+from .trending import record_hashtags
+from .utils import extract_hashtags, bulk_attach
+from .tasks import generate_blog_metadata
 
 class HashTagSerializer(serializers.ModelSerializer):
     class Meta:
@@ -21,13 +23,21 @@ class CommentSerializer(serializers.ModelSerializer):
         read_only_fields = ['comment_id', 'likes', 'dislikes', 'user','blog', 'created_at', 'replies']
 
     def get_likes(self, obj):
+        if hasattr(obj, 'likes_total'):
+            return obj.likes_total
         return obj.like_count()
 
     def get_dislikes(self, obj):
+        if hasattr(obj, 'dislikes_total'):
+            return obj.dislikes_total
         return obj.dislike_count()
 
     def get_replies(self, obj):
-        serializer = CommentSerializer(obj.replies.all(), many=True)
+        replies = self.context.get('replies')
+        if replies is None:
+            serializer = CommentSerializer(obj.replies.all(), many=True)
+        else:
+            serializer = CommentSerializer(replies.get(obj.comment_id, []), many=True, context=self.context)
         return serializer.data
 
     def create(self, validated_data):
@@ -62,11 +72,11 @@ class BlogSerializer(serializers.ModelSerializer):
         model = Blog
         fields = [
             'blog_id', 'blog_title', 'blog_description',
-            'tags', 'hashtags', 'metadata', 'comments', 'likes', 'dislikes',
-            'user', 'image', 'created_at', 'slug'
+            'tags', 'hashtags', 'metadata', 'comments', 'likes', 'dislikes', 'score',
+            'user', 'image', 'created_at', 'updated_at', 'slug'
 
         ]
-        read_only_fields = ['blog_id', 'created_at', 'likes', 'dislikes', 'user', 'slug', 'metadata']
+        read_only_fields = ['blog_id', 'created_at', 'updated_at', 'likes', 'dislikes', 'score', 'user', 'slug', 'metadata']
 
     def get_likes(self, obj):
         return obj.like_count
@@ -74,91 +84,59 @@ class BlogSerializer(serializers.ModelSerializer):
     def get_dislikes(self, obj):
         return obj.dislike_count    
 
-    def extract_hashtags(self, description):
-        if not isinstance(description, str):
-            description = str(description)
-        raw_tags = re.findall(r"#(\w+)", description or "")
-        return list(set(tag.lower() for tag in raw_tags))
-
-    def extract_tags(self, description):
-        if not isinstance(description, str):
-            description = str(description)
-        clean_text = re.sub(r"#\w+", "", description)
-        words = re.findall(r"\b\w+\b", clean_text.lower())
-        stopword = set(stopwords.words('english'))
-        keywords = [w for w in words if w not in stopword]
-        top_keywords = [w for w, _ in Counter(keywords).most_common(10)]
-        return top_keywords
-
-
     def create(self, validated_data):
         user = self.context['request'].user
         validated_data['user'] = user
 
         description = validated_data.get("blog_description", "")
-
-        hashtags_list = self.extract_hashtags(description)
-        tags_list = self.extract_tags(description)
+        hashtags_list = extract_hashtags(description)
 
         blog = super().create(validated_data)
 
-        for tag in hashtags_list:
-            hashtag_obj, _ = HashTags.objects.get_or_create(name=tag)
-            blog.hashtags.add(hashtag_obj)
-
-        for tag in tags_list:
-            tag_obj, _ = Tag.objects.get_or_create(name=tag)
-            blog.tags.add(tag_obj)
+        bulk_attach(blog, 'hashtags', HashTags, hashtags_list)
+        record_hashtags(blog.created_at, added=hashtags_list)
 
         word_count = len(description.split())
-        reading_time = math.ceil(word_count / 200) if word_count else None
-        summary = description[:150] if description else ""
-
-        metadata = BlogMetadata.objects.create(
+        BlogMetadata.objects.create(
             blog=blog,
             author=user,
-            summary=summary,
-            reading_time=reading_time,
+            summary=description[:150] if description else "",
+            reading_time=math.ceil(word_count / 200) if word_count else None,
             published_at=blog.created_at
         )
-        metadata.seo_keywords = ",".join(tags_list + hashtags_list)
-        metadata.save() 
-        metadata.tags.set(blog.tags.all())
 
+        transaction.on_commit(lambda: generate_blog_metadata.delay(blog.blog_id))
         return blog
 
     def update(self, instance, validated_data):
         description = validated_data.get("blog_description", instance.blog_description)
-
-        hashtags_list = self.extract_hashtags(description)
-        tags_list = self.extract_tags(description)
+        hashtags_list = extract_hashtags(description)
 
         instance = super().update(instance, validated_data)
 
+        previous_hashtags = set(instance.hashtags.values_list('name', flat=True))
         instance.hashtags.clear()
-        for tag in hashtags_list:
-            hashtag_obj, _ = HashTags.objects.get_or_create(name=tag)
-            instance.hashtags.add(hashtag_obj)
-
-        instance.tags.clear()
-        for tag in tags_list:
-            tag_obj, _ = Tag.objects.get_or_create(name=tag)
-            instance.tags.add(tag_obj)
-
-        metadata, created = BlogMetadata.objects.get_or_create(blog=instance, defaults={
-            'author': instance.user,
-            'summary': description[:150] if description else "",
-            'reading_time': math.ceil(len(description.split()) / 100) if description else None,
-            'published_at': instance.created_at
-        })
-
-        if not created:
-            metadata.summary = description[:150] if description else ""
-            metadata.reading_time = math.ceil(len(description.split()) / 100) if description else None
-            metadata.tags.set(instance.tags.all())
-            metadata.seo_keywords = ",".join(tags_list + hashtags_list)
-            metadata.save()
+        bulk_attach(instance, 'hashtags', HashTags, hashtags_list)
+        record_hashtags(
+            instance.created_at,
+            added=set(hashtags_list) - previous_hashtags,
+            removed=previous_hashtags - set(hashtags_list)
+        )
 
+        summary = description[:150] if description else ""
+        reading_time = math.ceil(len(description.split()) / 100) if description else None
+        BlogMetadata.objects.update_or_create(
+            blog=instance,
+            defaults={'summary': summary, 'reading_time': reading_time},
+            create_defaults={
+                'author': instance.user,
+                'summary': summary,
+                'reading_time': reading_time,
+                'published_at': instance.created_at
+            }
+        )
+
+        transaction.on_commit(lambda: generate_blog_metadata.delay(instance.blog_id, replace=True))
         return instance
 
     
@@ -197,10 +175,18 @@ class PostReactionSerializer(serializers.ModelSerializer):
         if existing:
             if existing.reaction == reaction_type:
                 existing.delete()
+                if blog_id:
+                    Blog.apply_reaction(blog_id.blog_id, **{f"{reaction_type}s": -1})
                 raise serializers.ValidationError(f"{reaction_type.capitalize()} removed (toggle off).")
             else:
+                previous = existing.reaction
                 existing.reaction = reaction_type
                 existing.save()
+                if blog_id:
+                    Blog.apply_reaction(blog_id.blog_id, **{f"{previous}s": -1, f"{reaction_type}s": 1})
                 return existing
-            
-        return PostReaction.objects.create(reaction=reaction_type, **filter_kwargs)     
\ No newline at end of file
+
+        reaction = PostReaction.objects.create(reaction=reaction_type, **filter_kwargs)
+        if blog_id:
+            Blog.apply_reaction(blog_id.blog_id, **{f"{reaction_type}s": 1})
+        return reaction     
\ No newline at end of file
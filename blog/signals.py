@@ -0,0 +1,16 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Blog
+from .utils import bump_blog_version
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=Blog)
+@receiver(post_delete, sender=Blog)
+def blog_changed(sender, instance, **kwargs):
+    try:
+        bump_blog_version()
+    except Exception as e:
+        logger.error(f"Exception in blog_changed: {e}")
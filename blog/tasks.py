@@ -0,0 +1,79 @@
+from celery import shared_task
+from django.db.models import Count, F, FloatField, ExpressionWrapper, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from .models import Blog, BlogMetadata, PostReaction, Tag
+from .trending import rebuild_trending_hashtags
+from .utils import extract_hashtags, extract_tags, bulk_attach
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _reaction_count(reaction):
+    counts = (
+        PostReaction.objects.filter(blog=OuterRef('pk'), reaction=reaction)
+        .order_by()
+        .values('blog')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    return Coalesce(Subquery(counts), Value(0))
+
+
+@shared_task
+def recompute_blog_scores():
+    try:
+        Blog.objects.update(
+            likes_count=_reaction_count('like'),
+            dislikes_count=_reaction_count('dislike'),
+        )
+        updated = Blog.objects.update(
+            score=ExpressionWrapper(
+                (F('likes_count') + 1.0) / (F('dislikes_count') + 1.0),
+                output_field=FloatField()
+            )
+        )
+        logger.info(f"Recomputed scores for {updated} blogs")
+        return updated
+    except Exception as e:
+        logger.error(f"Error in recompute_blog_scores: {e}", exc_info=True)
+        return 0
+
+
+@shared_task
+def rebuild_trending():
+    try:
+        buckets = rebuild_trending_hashtags()
+        logger.info(f"Rebuilt {buckets} trending hashtag buckets")
+        return buckets
+    except Exception as e:
+        logger.error(f"Error in rebuild_trending: {e}", exc_info=True)
+        return 0
+
+
+@shared_task
+def generate_blog_metadata(blog_id, replace=False):
+    try:
+        blog = Blog.objects.select_related('metadata').filter(blog_id=blog_id).first()
+        if not blog:
+            return False
+
+        tags_list = extract_tags(blog.blog_description)
+        hashtags_list = extract_hashtags(blog.blog_description)
+        metadata = getattr(blog, 'metadata', None)
+
+        if replace:
+            blog.tags.clear()
+            if metadata:
+                metadata.tags.clear()
+
+        bulk_attach(blog, 'tags', Tag, tags_list)
+        if metadata:
+            bulk_attach(metadata, 'tags', Tag, tags_list)
+            BlogMetadata.objects.filter(pk=metadata.pk).update(
+                seo_keywords=",".join(tags_list + hashtags_list)[:255]
+            )
+        return True
+    except Exception as e:
+        logger.error(f"Error in generate_blog_metadata for blog {blog_id}: {e}", exc_info=True)
+        return False
@@ -0,0 +1,98 @@
+from django.core.cache import cache
+from django.utils import timezone
+from datetime import datetime, time, timedelta
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    redis_instance = cache.client.get_client(write=True)
+except Exception as e:
+    logger.error(f"Redis connection error: {e}")
+    redis_instance = None
+
+TRENDING_WINDOWS = {
+    '24h': 1,
+    '7d': 7,
+    '30d': 30,
+}
+BUCKET_TTL = 60 * 60 * 24 * 31
+UNION_TTL = 60
+
+
+def window_days(days):
+    # A rolling window of N days reaches back into the bucket N days ago.
+    today = timezone.localdate()
+    return [today - timedelta(days=offset) for offset in range(days + 1)]
+
+
+def window_start(days):
+    return timezone.make_aware(datetime.combine(window_days(days)[-1], time.min))
+
+
+def bucket_key(day):
+    return f"trending:hashtags:{day.strftime('%Y%m%d')}"
+
+
+def record_hashtags(created_at, added=(), removed=()):
+    if not redis_instance or not (added or removed):
+        return
+    key = bucket_key(timezone.localdate(created_at))
+    try:
+        pipe = redis_instance.pipeline()
+        for name in added:
+            pipe.zincrby(key, 1, name)
+        for name in removed:
+            pipe.zincrby(key, -1, name)
+        pipe.zremrangebyscore(key, '-inf', 0)
+        pipe.expire(key, BUCKET_TTL)
+        pipe.execute()
+    except Exception as e:
+        logger.error(f"Error recording trending hashtags: {e}")
+
+
+def get_trending_hashtags(window='7d', limit=10):
+    if not redis_instance:
+        return None
+    days = TRENDING_WINDOWS[window]
+    today = timezone.localdate()
+    union_key = f"trending:hashtags:union:{window}:{today.strftime('%Y%m%d')}"
+    try:
+        if not redis_instance.exists(union_key):
+            keys = [bucket_key(day) for day in window_days(days)]
+            pipe = redis_instance.pipeline()
+            pipe.zunionstore(union_key, keys)
+            pipe.expire(union_key, UNION_TTL)
+            pipe.execute()
+        top = redis_instance.zrevrange(union_key, 0, limit - 1, withscores=True)
+    except Exception as e:
+        logger.error(f"Error reading trending hashtags: {e}")
+        return None
+    return [
+        (name.decode() if isinstance(name, bytes) else name, int(count))
+        for name, count in top
+    ]
+
+
+def rebuild_trending_hashtags(days=30):
+    if not redis_instance:
+        return 0
+    from .models import Blog
+
+    since = window_start(days)
+    buckets = {}
+    rows = Blog.hashtags.through.objects.filter(
+        blog__created_at__gte=since
+    ).values_list('blog__created_at', 'hashtags__name')
+    for created_at, name in rows.iterator():
+        bucket = buckets.setdefault(bucket_key(timezone.localdate(created_at)), {})
+        bucket[name] = bucket.get(name, 0) + 1
+
+    pipe = redis_instance.pipeline()
+    for day in window_days(days):
+        pipe.delete(bucket_key(day))
+    for key, counts in buckets.items():
+        pipe.zadd(key, counts)
+        pipe.expire(key, BUCKET_TTL)
+    pipe.execute()
+    return len(buckets)
@@ -0,0 +1,69 @@
+import re
+from collections import Counter
+from functools import lru_cache
+from nltk.corpus import stopwords
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.utils import timezone
+
+BLOG_VERSION_KEY = "blog:version"
+BLOG_LAST_MODIFIED_KEY = "blog:last_modified"
+
+
+@lru_cache(maxsize=None)
+def get_stopwords():
+    return frozenset(stopwords.words('english'))
+
+
+def extract_hashtags(description):
+    if not isinstance(description, str):
+        description = str(description)
+    raw_tags = re.findall(r"#(\w+)", description or "")
+    return list(set(tag.lower() for tag in raw_tags))
+
+
+def extract_tags(description):
+    if not isinstance(description, str):
+        description = str(description)
+    clean_text = re.sub(r"#\w+", "", description)
+    words = re.findall(r"\b\w+\b", clean_text.lower())
+    stopword = get_stopwords()
+    keywords = [w for w in words if w not in stopword]
+    return [w for w, _ in Counter(keywords).most_common(10)]
+
+
+def bulk_attach(instance, field_name, model, names):
+    if not names:
+        return
+    model.objects.bulk_create([model(name=name) for name in names], ignore_conflicts=True)
+    ids = model.objects.filter(name__in=names).values_list('pk', flat=True)
+
+    field = instance._meta.get_field(field_name)
+    through = field.remote_field.through
+    source = f"{field.m2m_field_name()}_id"
+    target = f"{field.m2m_reverse_field_name()}_id"
+    through.objects.bulk_create(
+        [through(**{source: instance.pk, target: pk}) for pk in ids],
+        ignore_conflicts=True
+    )
+
+
+def bump_blog_version():
+    try:
+        cache.incr(BLOG_VERSION_KEY)
+    except ValueError:
+        cache.set(BLOG_VERSION_KEY, 1, timeout=None)
+    cache.set(BLOG_LAST_MODIFIED_KEY, timezone.now(), timeout=None)
+
+
+def get_blog_version():
+    cached = cache.get_many([BLOG_VERSION_KEY, BLOG_LAST_MODIFIED_KEY])
+    if len(cached) == 2:
+        return cached[BLOG_VERSION_KEY], cached[BLOG_LAST_MODIFIED_KEY]
+
+    from .models import Blog
+    stats = Blog.objects.aggregate(total=Count('pk'), last_modified=Max('updated_at'))
+    last_modified = stats['last_modified'] or timezone.now()
+    cache.add(BLOG_VERSION_KEY, stats['total'], timeout=None)
+    cache.add(BLOG_LAST_MODIFIED_KEY, last_modified, timeout=None)
+    return stats['total'], last_modified
@@ -1,17 +1,25 @@
 from rest_framework.views import APIView
+from officekhaja.replicas import ReplicaReadMixin
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from orders.permissions import IsAdminOrReadOnly
-from django.utils import timezone
-from datetime import timedelta
-from django.db.models import Count, F, Q
-from khaja.pagination import MenuInfiniteScrollPagination
+from django.utils.decorators import method_decorator
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import condition
+from django.http import StreamingHttpResponse
+from django.core.serializers.json import DjangoJSONEncoder
+import json
+from django.db.models import Count
+from .pagination import CommentCursorPagination, BlogFeedPagination
+from .comment_tree import top_level_comments, load_replies
+from .trending import TRENDING_WINDOWS, get_trending_hashtags, window_start
+from .utils import get_blog_version
 from .models import Blog, Comments, HashTags
 from .serializers import BlogSerializer, CommentSerializer, PostReactionSerializer
 
 
-class BlogView(APIView):
+class BlogView(ReplicaReadMixin, APIView):
     def get_permissions(self):
         if self.request.method == 'GET':
             permission_classes = [AllowAny]
@@ -36,13 +44,8 @@ class BlogView(APIView):
         latest_serializer = BlogSerializer(latest_posts, many=True)
 
         remaining_blogs = blogs.exclude(blog_id__in=latest_posts.values_list('blog_id', flat=True))
-        remaining_blogs = remaining_blogs.annotate(
-            likes_total=Count('postreaction', filter=Q(postreaction__reaction='like')),
-            dislikes_total=Count('postreaction', filter=Q(postreaction__reaction='dislike')),
-            ratio=(F('likes_total') + 1.0) / (F('dislikes_total') + 1.0),
-        ).order_by('-ratio')
 
-        paginator = MenuInfiniteScrollPagination()
+        paginator = BlogFeedPagination()
         page = paginator.paginate_queryset(remaining_blogs, request)
         serializer = BlogSerializer(page, many=True)
 
@@ -60,7 +63,7 @@ class BlogView(APIView):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
-class BlogDetailView(APIView):
+class BlogDetailView(ReplicaReadMixin, APIView):
     def get_permissions(self):
         if self.request.method == 'GET':
             permission_classes = [AllowAny]
@@ -94,24 +97,25 @@ class BlogDetailView(APIView):
         return Response("Blog successfully deleted", status=status.HTTP_204_NO_CONTENT)
 
 
-class CommentView(APIView):
+class CommentView(ReplicaReadMixin, APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, slug):
         blog = Blog.objects.filter(slug=slug).first()
         if not blog:
             return Response(f"Blog not found with slug {slug}")
-        comments = Comments.objects.filter(blog=blog, parent=None)
+        comments = top_level_comments(blog)
+        user_comment = comments.filter(user=request.user).order_by('created_at').first()
+        if user_comment:
+            comments = comments.exclude(comment_id=user_comment.comment_id)
 
-        user_comment = next((c for c in comments if c.user == request.user), None)
-        other_comments = [c for c in comments if c != user_comment]
-        other_comments.sort(
-            key=lambda c: (c.like_count() + 1) / (c.dislike_count() + 1),
-            reverse=True
-        )
-        sorted_comments = [user_comment] + other_comments if user_comment else other_comments
-        serializer = CommentSerializer(sorted_comments, many=True)
-        return Response({'comments': serializer.data}, status=status.HTTP_200_OK)
+        paginator = CommentCursorPagination()
+        page = paginator.paginate_queryset(comments, request)
+        if user_comment and not paginator.has_previous:
+            page = [user_comment] + page
+
+        serializer = CommentSerializer(page, many=True, context={'replies': load_replies(blog)})
+        return paginator.get_paginated_response({'comments': serializer.data})
 
 
     def post(self, request, slug):
@@ -179,32 +183,68 @@ class PostReactionView(APIView):
 class TrendingHashtagsView(APIView):
     permission_classes=[IsAuthenticated]
     def get(self, request):
-        one_week_ago = timezone.now() - timedelta(days=7)
-
-        hashtags = (
-                HashTags.objects.filter(posts__created_at__gte=one_week_ago)
-                .annotate(usage_count=Count("posts"))
-                .order_by("-usage_count")[:10]
+        window = request.query_params.get('window', '7d')
+        if window not in TRENDING_WINDOWS:
+            return Response(
+                {"error": f"Invalid window. Choose from: {', '.join(TRENDING_WINDOWS)}"},
+                status=status.HTTP_400_BAD_REQUEST
             )
 
-        total_count = sum(tag.usage_count for tag in hashtags)
+        hashtags = get_trending_hashtags(window)
+        if hashtags is None:
+            # Same whole-day buckets the Redis union reads.
+            since = window_start(TRENDING_WINDOWS[window])
+            hashtags = (
+                    HashTags.objects.filter(posts__created_at__gte=since)
+                    .annotate(usage_count=Count("posts"))
+                    .order_by("-usage_count")
+                    .values_list("name", "usage_count")[:10]
+                )
+
+        total_count = sum(count for _, count in hashtags)
         data = [
             {
-                "hashtag": tag.name,
-                "count": tag.usage_count,
-                "percentage": round((tag.usage_count / total_count) * 100, 2) if total_count else 0
+                "hashtag": name,
+                "count": count,
+                "percentage": round((count / total_count) * 100, 2) if total_count else 0
             }
-            for tag in hashtags
+            for name, count in hashtags
         ]
 
         return Response(data)
 
 
+def sitemap_etag(request, *args, **kwargs):
+    version, last_modified = get_blog_version()
+    lastmod = 'lastmod' if request.GET.get('lastmod') else 'slugs'
+    return f"{version}-{last_modified.timestamp()}-{lastmod}"
+
+
+def sitemap_last_modified(request, *args, **kwargs):
+    return get_blog_version()[1]
+
+
+def stream_json_array(rows):
+    yield "["
+    for index, row in enumerate(rows):
+        yield ("," if index else "") + json.dumps(row, cls=DjangoJSONEncoder)
+    yield "]"
+
+
 class SlugView(APIView):
+    throttle_scope = 'sitemap'
+
     permission_classes = [AllowAny]
 
+    @method_decorator(gzip_page)
+    @method_decorator(condition(etag_func=sitemap_etag, last_modified_func=sitemap_last_modified))
     def get(self, request):
-        blog = Blog.objects.all()
-        serializer  = BlogSerializer(blog, many=True)
-        slugs = [blogs['slug'] for blogs in serializer.data]
-        return Response(slugs, status=status.HTTP_200_OK)
\ No newline at end of file
+        blogs = Blog.objects.order_by()
+        if request.query_params.get('lastmod'):
+            rows = (
+                {"slug": slug, "updated_at": updated_at}
+                for slug, updated_at in blogs.values_list('slug', 'updated_at').iterator()
+            )
+        else:
+            rows = blogs.values_list('slug', flat=True).iterator()
+        return StreamingHttpResponse(stream_json_array(rows), content_type='application/json')
\ No newline at end of file
@@ -1,8 +1,12 @@
+from urllib.parse import parse_qs
+from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
+from django.conf import settings
 from channels.middleware import BaseMiddleware
 from django.contrib.auth.models import AnonymousUser
 from rest_framework_simplejwt.tokens import AccessToken
-from users.models import CustomUser
+from users.authentication import get_cached_user
+from officekhaja.ratelimit import consume
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,12 +16,7 @@ class JWTAuthMiddleware(BaseMiddleware):
 
     async def __call__(self, scope, receive, send):
         query_string = scope.get("query_string", b"").decode()
-        token = None
-        
-        for param in query_string.split("&"):
-            if param.startswith("token="):
-                token = param.split("=")[1]
-                break
+        token = parse_qs(query_string).get("token", [None])[0]
 
         if token:
             try:
@@ -35,11 +34,37 @@ class JWTAuthMiddleware(BaseMiddleware):
 
     @database_sync_to_async
     def get_user(self, user_id):
-        try:
-            return CustomUser.objects.get(id=user_id)
-        except CustomUser.DoesNotExist:
+        user = get_cached_user(user_id)
+        if user is None or not user.is_active:
             return AnonymousUser()
+        return user
+
+
+class RateLimitMiddleware(BaseMiddleware):
+    scope_name = 'websocket'
+
+    async def __call__(self, scope, receive, send):
+        policy = settings.RATE_LIMIT_POLICIES.get(self.scope_name)
+        if policy and scope["type"] == "websocket":
+            user = scope.get("user")
+            if user is not None and user.is_authenticated:
+                ident = f"user:{user.pk}"
+            else:
+                ident = f"ip:{(scope.get('client') or ['unknown'])[0]}"
+
+            allowed, _ = await sync_to_async(consume)(
+                self.scope_name, ident, policy['capacity'], policy['per_seconds']
+            )
+            if not allowed:
+                message = await receive()
+                if message["type"] == "websocket.connect":
+                    # Closing before accept is a 403 handshake rejection; accept so the client sees 4429.
+                    await send({"type": "websocket.accept"})
+                    await send({"type": "websocket.close", "code": 4429, "reason": "rate limited"})
+                return
+
+        return await super().__call__(scope, receive, send)
 
 
 def JWTAuthMiddlewareStack(inner):
-    return JWTAuthMiddleware(inner)
\ No newline at end of file
+    return JWTAuthMiddleware(RateLimitMiddleware(inner))
\ No newline at end of file
@@ -32,6 +32,11 @@ class Message(models.Model):
     message = models.TextField()
     timestamp = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['conversation', '-timestamp', '-mid'], name='message_conversation_idx'),
+        ]
+
     def __str__(self):
         return self.message
     
\ No newline at end of file
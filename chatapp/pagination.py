@@ -1,8 +1,6 @@
-from rest_framework.pagination import CursorPagination
+from officekhaja.pagination import KeysetPagination
 
 
-class MessageInfiniteScrollPagination(CursorPagination):
-    page_size = 15  
-    ordering =  ('-timestamp', '-conversation_id') 
-    cursor_query_param = 'cursor'
-
+class MessageInfiniteScrollPagination(KeysetPagination):
+    page_size = 15
+    ordering = ('-timestamp', '-mid')
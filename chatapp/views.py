@@ -111,8 +111,6 @@ class MessageView(APIView):
         if search_query:
             messages = messages.filter(Q(message__icontains=search_query))
         
-        messages = messages.order_by("-timestamp")
-        
         pagination = MessageInfiniteScrollPagination()
         paginated = pagination.paginate_queryset(messages, request)
         serializer = MessageSerializer(paginated, many=True)
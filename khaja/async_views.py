@@ -0,0 +1,50 @@
+from rest_framework import status
+from rest_framework.request import Request
+from officekhaja.async_views import AsyncAPIView, json_response
+from .models import Type, MealCategory
+from .pagination import MealsPagination
+from .loaders import meal_queryset, ameal_context
+from .views import available_meals, parse_delivery_date, delivery_slots_for, slot_options
+from .serializers import MealSerializer, TypeSerializer, MealCategorySerializer
+
+
+class AsyncTypeListView(AsyncAPIView):
+    async def get(self, request):
+        types = [meal_type async for meal_type in Type.objects.all()]
+        return json_response(TypeSerializer(types, many=True).data)
+
+
+class AsyncMealCategoryListView(AsyncAPIView):
+    async def get(self, request):
+        categories = [category async for category in MealCategory.objects.all()]
+        return json_response(MealCategorySerializer(categories, many=True).data)
+
+
+class AsyncDeliveryTimeSlotListView(AsyncAPIView):
+    async def get(self, request):
+        delivery_date, error = parse_delivery_date(request.GET.get("date"))
+        if error:
+            return json_response({"error": error}, status=400)
+
+        slots = [slot async for slot in delivery_slots_for(delivery_date)]
+        return json_response(slot_options(slots, delivery_date))
+
+
+class AsyncMealListView(AsyncAPIView):
+    throttle_scope = 'meals'
+
+    async def get(self, request):
+        paginator = MealsPagination()
+        page_queryset = paginator.get_page_queryset(available_meals(request.GET), Request(request))
+        meals = paginator.build_page([meal async for meal in page_queryset])
+        serializer = MealSerializer(meals, many=True, context=await ameal_context(meals))
+        return json_response(paginator.get_paginated_response(serializer.data).data)
+
+
+class AsyncMealDetailView(AsyncAPIView):
+    async def get(self, request, slug):
+        meal = await meal_queryset().filter(slug=slug).afirst()
+        if meal is None:
+            return json_response({"error": "Meal not found"}, status=status.HTTP_404_NOT_FOUND)
+        serializer = MealSerializer(meal, context=await ameal_context([meal]))
+        return json_response(serializer.data)
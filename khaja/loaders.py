@@ -0,0 +1,48 @@
+from django.db.models import Prefetch
+from .models import Ingredient, Meals, CustomMeal
+
+MEAL_DETAIL_RELATED = ('type', 'meal_category', 'nutrition', 'meal_ingredients')
+CUSTOM_MEAL_RELATED = ('type', 'meal_category', 'meals', 'delivery_time_slot', 'subscription_plan__plan')
+
+
+def meal_queryset(queryset=None):
+    if queryset is None:
+        queryset = Meals.objects.all()
+    return queryset.select_related(*MEAL_DETAIL_RELATED)
+
+
+def custom_meal_queryset(queryset=None, prefix=''):
+    if queryset is None:
+        queryset = CustomMeal.objects.all()
+    return queryset.select_related(*(f'{prefix}{related}' for related in CUSTOM_MEAL_RELATED)).prefetch_related(
+        Prefetch(f'{prefix}meals__meals', queryset=Meals.objects.select_related('nutrition'))
+    )
+
+
+def ingredient_ids(meals):
+    ids = set()
+    for meal in meals:
+        meal_ingredients = getattr(meal, 'meal_ingredients', None)
+        if meal_ingredients:
+            ids.update(meal_ingredients.ingredient_ids)
+    return ids
+
+
+def ingredient_map(meals):
+    ids = ingredient_ids(meals)
+    return Ingredient.objects.in_bulk(ids) if ids else {}
+
+
+async def aingredient_map(meals):
+    ids = ingredient_ids(meals)
+    return await Ingredient.objects.ain_bulk(ids) if ids else {}
+
+
+def meal_context(meals, **context):
+    context['ingredients'] = ingredient_map(meals)
+    return context
+
+
+async def ameal_context(meals, **context):
+    context['ingredients'] = await aingredient_map(meals)
+    return context
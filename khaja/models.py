@@ -95,6 +95,9 @@ class Meals(models.Model):
 
     class Meta:
         verbose_name_plural = "Meals"
+        indexes = [
+            models.Index(fields=['name', 'meal_id'], name='meal_name_idx'),
+        ]
     
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -237,3 +240,7 @@ class CustomMeal(models.Model):
     class Meta:
         verbose_name_plural = "Custom Meals"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-combo_id'], name='custom_meal_user_idx'),
+            models.Index(fields=['-created_at', '-combo_id'], name='custom_meal_created_idx'),
+        ]
@@ -1,12 +1,11 @@
-from rest_framework.pagination import CursorPagination
+from officekhaja.pagination import KeysetPagination
 
 
-class MenuInfiniteScrollPagination(CursorPagination):
-    page_size = 10  
-    ordering =  ('created_at') 
-    cursor_query_param = 'cursor'
+class MenuInfiniteScrollPagination(KeysetPagination):
+    page_size = 10
+    ordering = ('-created_at', '-pk')
 
-class MealsPagination(CursorPagination):
-    page_size = 15 
-    ordering = ('name')
-    cursor_query_param = 'cursor'
+
+class MealsPagination(KeysetPagination):
+    page_size = 15
+    ordering = ('name', 'pk')
@@ -78,7 +78,14 @@ class MealSerializer(serializers.ModelSerializer):
 
     def get_ingredients(self, obj):
         if hasattr(obj, 'meal_ingredients'):
-            ingredients = obj.meal_ingredients.get_ingredients()
+            preloaded = self.context.get('ingredients')
+            if preloaded is not None:
+                ingredients = sorted(
+                    (preloaded[i] for i in obj.meal_ingredients.ingredient_ids if i in preloaded),
+                    key=lambda ingredient: ingredient.name
+                )
+            else:
+                ingredients = obj.meal_ingredients.get_ingredients()
             return IngredientSerializer(ingredients, many=True).data
         return []
 
@@ -1,3 +1,18 @@
-from django.test import TestCase
+from officekhaja.testing import QueryBudgetTestCase
+from users.models import CustomUser
+from .models import Meals, CustomMeal
 
-# Create your tests here.
+
+class MealQueryBudgetTests(QueryBudgetTestCase):
+    def test_meal_list(self):
+        self.assertWithinQueryBudget('khaja:meals')
+        self.assertWithinQueryBudget('khaja:meals', data={'type': 'veg'})
+
+    def test_meal_detail(self):
+        meal = Meals.objects.filter(is_available=True).first()
+        self.assertWithinQueryBudget('khaja:meal-detail', slug=meal.slug)
+
+    def test_custom_meal_list(self):
+        user = CustomUser.objects.get(pk=CustomMeal.objects.values_list('user_id', flat=True).first())
+        self.client.force_authenticate(user)
+        self.assertWithinQueryBudget('khaja:my-custom-meals')
@@ -1,4 +1,5 @@
 from rest_framework.views import APIView
+from officekhaja.replicas import ReplicaReadMixin
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated, AllowAny
@@ -8,6 +9,7 @@ from django.db import transaction
 from .models import (Meals, CustomMeal, Combo, Ingredient, DeliveryTimeSlot,
                      MealIngredient, Type, MealCategory)
 from .pagination import MenuInfiniteScrollPagination, MealsPagination
+from .loaders import meal_queryset, meal_context, custom_meal_queryset
 from users.models import CustomUser, UserSubscription, Subscription
 from users.views import check_subscription
 from django.utils import timezone
@@ -22,11 +24,51 @@ from .serializers import (
     MealIngredientSerializer, TypeSerializer, MealCategorySerializer
 )
 
+
+def available_meals(params):
+    queryset = meal_queryset(Meals.objects.filter(is_available=True))
+    category = params.get('category', None)
+    meal_type = params.get('type', None)
+    if category:
+        queryset = queryset.filter(meal_category__slug=category)
+    if meal_type and meal_type.upper() != 'BOTH':
+        queryset = queryset.filter(type__slug=meal_type)
+    return queryset
+
+
+def parse_delivery_date(date_str):
+    if not date_str:
+        return None, "date query param required"
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date(), None
+    except ValueError:
+        return None, "Invalid date format (YYYY-MM-DD)"
+
+
+def delivery_slots_for(delivery_date):
+    slots = DeliveryTimeSlot.objects.filter(is_active=True)
+    if delivery_date == timezone.localdate():
+        slots = slots.filter(start_time__gt=timezone.localtime().time())
+    return slots
+
+
+def slot_options(slots, delivery_date):
+    formatted_date = delivery_date.strftime("%d %b %Y")
+    return [
+        {
+            "slot_id": slot.slot_id,
+            "formatted_label": f"{formatted_date} ({slot.start_time.strftime('%H:%M')} - {slot.end_time.strftime('%H:%M')})",
+            "time_range": f"{slot.start_time.strftime('%H:%M')} - {slot.end_time.strftime('%H:%M')}"
+        }
+        for slot in slots
+    ]
+
+
 @extend_schema(
     request=TypeSerializer,
     responses={200: TypeSerializer}
 )
-class TypeListView(APIView):
+class TypeListView(ReplicaReadMixin, APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
@@ -38,37 +80,15 @@ class TypeListView(APIView):
     request=DeliveryTimeSlotSerializer,
     responses={200: DeliveryTimeSlotSerializer}
 )
-class DeliveryTimeSlotListView(APIView):
+class DeliveryTimeSlotListView(ReplicaReadMixin, APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
-        date_str = request.query_params.get("date")
-        if not date_str:
-            return Response({"error": "date query param required"}, status=400)
-
-        try:
-            delivery_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        except ValueError:
-            return Response({"error": "Invalid date format (YYYY-MM-DD)"}, status=400)
-
-        today = timezone.localdate()
-        now_time = timezone.localtime().time()
-
-        slots = DeliveryTimeSlot.objects.filter(is_active=True)
-
-        if delivery_date == today:
-            slots = slots.filter(start_time__gt=now_time)
-
-        formatted_date = delivery_date.strftime("%d %b %Y")
-        data = [
-            {
-                "slot_id": slot.slot_id,
-                "formatted_label": f"{formatted_date} ({slot.start_time.strftime('%H:%M')} - {slot.end_time.strftime('%H:%M')})",
-                "time_range": f"{slot.start_time.strftime('%H:%M')} - {slot.end_time.strftime('%H:%M')}"
-            }
-            for slot in slots   
-        ]
+        delivery_date, error = parse_delivery_date(request.query_params.get("date"))
+        if error:
+            return Response({"error": error}, status=400)
 
+        data = slot_options(delivery_slots_for(delivery_date), delivery_date)
         return Response(data, status=200)
 
 
@@ -76,7 +96,7 @@ class DeliveryTimeSlotListView(APIView):
     request=MealCategorySerializer,
     responses={200: MealCategorySerializer}
 )
-class MealCategoryListView(APIView):
+class MealCategoryListView(ReplicaReadMixin, APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
@@ -88,7 +108,7 @@ class MealCategoryListView(APIView):
     request=IngredientSerializer,
     responses={200: IngredientSerializer}
 )
-class IngredientView(APIView):
+class IngredientView(ReplicaReadMixin, APIView):
     def get_permissions(self):
         if self.request.method in ['GET']:
             permission_classes = [AllowAny]
@@ -144,7 +164,9 @@ class IngredientView(APIView):
     request=MealSerializer,
     responses={200: MealSerializer}
 )
-class MealListView(APIView):
+class MealListView(ReplicaReadMixin, APIView):
+    throttle_scope = 'meals'
+
     def get_permissions(self):
         if self.request.method in ['GET']:
             permission_classes = [AllowAny]
@@ -153,20 +175,10 @@ class MealListView(APIView):
         return [permission() for permission in permission_classes]
 
     def get(self, request):
-        category = request.query_params.get('category', None)
-        meal_type = request.query_params.get('type', None)
-        
-        queryset = Meals.objects.filter(is_available=True)
-        
-        if category:
-            queryset = queryset.filter(meal_category__slug=category)
-        if meal_type:
-            if meal_type.upper() != 'BOTH':
-                queryset = queryset.filter(type__slug=meal_type)
-        
+        queryset = available_meals(request.query_params)
         paginator = MealsPagination()
         paginated_qs = paginator.paginate_queryset(queryset, request=request)
-        serializer = MealSerializer(paginated_qs, many=True)
+        serializer = MealSerializer(paginated_qs, many=True, context=meal_context(paginated_qs))
          
         return paginator.get_paginated_response(serializer.data)
     
@@ -193,7 +205,7 @@ class MealListView(APIView):
     request=MealSerializer,
     responses={200: MealSerializer}
 )
-class MealDetailView(APIView):
+class MealDetailView(ReplicaReadMixin, APIView):
     def get_permissions(self):
         if self.request.method in ['GET']:
             permission_classes = [AllowAny]
@@ -203,10 +215,10 @@ class MealDetailView(APIView):
 
     def get(self, request, slug):
         try:
-            meal = get_object_or_404(Meals, slug=slug)
+            meal = get_object_or_404(meal_queryset(), slug=slug)
         except Http404:
             return Response({"error": "Meal not found"}, status=status.HTTP_404_NOT_FOUND)
-        serializer = MealSerializer(meal)
+        serializer = MealSerializer(meal, context=meal_context([meal]))
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def put(self, request, slug):
@@ -247,7 +259,7 @@ class MealDetailView(APIView):
     request=MealIngredientSerializer,
     responses={200: MealIngredientSerializer}
 )
-class MealIngredientsView(APIView):
+class MealIngredientsView(ReplicaReadMixin, APIView):
     def get_permissions(self):
         if self.request.method in ['GET']:
             permission_classes = [AllowAny]
@@ -289,7 +301,7 @@ class MealIngredientsView(APIView):
     request=NutritionSerializer,
     responses={200: NutritionSerializer}
 )
-class NutritionView(APIView):
+class NutritionView(ReplicaReadMixin, APIView):
     def get_permissions(self):
         if self.request.method in ['GET']:
             permission_classes = [AllowAny]
@@ -600,7 +612,7 @@ class CustomMealListView(APIView):
         return [permission() for permission in permission_classes]
 
     def get(self, request):
-        custom_meals = CustomMeal.objects.filter(user=request.user, is_active=True)
+        custom_meals = custom_meal_queryset(CustomMeal.objects.filter(user=request.user, is_active=True))
         type = request.query_params.get('type', None)
         category = request.query_params.get('category',None)
         if type:
@@ -0,0 +1,207 @@
+"""
+Replays the browse -> custom meal -> cart -> checkout flow and websocket chat
+traffic against a running server seeded with `manage.py seed_data`.
+
+    pip install -r loadtest/requirements.txt
+    python loadtest/run.py --users 50 --chat-users 20 --duration 120
+
+Raise RATE_LIMIT_POLICIES on the target server first, otherwise most requests
+will be throttled.
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+
+import httpx
+import websockets
+
+
+class Stats:
+    def __init__(self):
+        self.timings = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, name, elapsed, ok):
+        self.timings[name].append(elapsed * 1000)
+        if not ok:
+            self.errors[name] += 1
+
+    def percentile(self, values, pct):
+        values = sorted(values)
+        return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+    def summary(self):
+        return {
+            name: {
+                'count': len(values),
+                'errors': self.errors[name],
+                'p50': self.percentile(values, 50),
+                'p95': self.percentile(values, 95),
+                'p99': self.percentile(values, 99),
+            }
+            for name, values in sorted(self.timings.items())
+        }
+
+    def report(self):
+        print(f"{'endpoint':<45} {'count':>7} {'errors':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        for name, row in self.summary().items():
+            print(f"{name:<45} {row['count']:>7} {row['errors']:>7} {row['p50']:>9.1f} {row['p95']:>9.1f} {row['p99']:>9.1f}")
+
+
+class VirtualUser:
+    def __init__(self, client, stats, manifest, account, rng):
+        self.client = client
+        self.stats = stats
+        self.manifest = manifest
+        self.account = account
+        self.rng = rng
+        self.headers = {}
+
+    async def call(self, method, name, url, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=self.headers, **kwargs)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            response, ok = None, False
+        self.stats.record(f"{method} {name}", time.perf_counter() - start, ok)
+        return response if ok else None
+
+    async def login(self):
+        response = await self.call('POST', '/api/auth/login/', '/api/auth/login/', json={
+            'phone_number': self.account['phone_number'],
+            'password': self.manifest['password'],
+        })
+        if response is None:
+            return None
+        access = response.json()['tokens']['access']
+        self.headers = {'Authorization': f"Bearer {access}"}
+        return access
+
+    async def browse(self):
+        response = await self.call('GET', '/api/khaja/meals/', '/api/khaja/meals/')
+        await self.call('GET', '/api/khaja/categories/', '/api/khaja/categories/')
+        await self.call('GET', '/api/khaja/delivery-slots/', '/api/khaja/delivery-slots/')
+        meals = response.json().get('results', []) if response else []
+        for meal in self.rng.sample(meals, min(len(meals), 3)):
+            await self.call('GET', '/api/khaja/meals/<slug>/', f"/api/khaja/meals/{meal['slug']}/")
+        return meals
+
+    async def build_custom_meal(self):
+        url = '/api/khaja/create-meal/'
+        ok = await self.call('PATCH', f"{url}?step=1", f"{url}?step=1", json={
+            'type': self.rng.choice(self.manifest['types']),
+            'category': self.rng.choice(self.manifest['categories']),
+            'servings': self.rng.randint(1, 4),
+            'preferences': 'load test',
+        })
+        if ok is None:
+            return None
+        response = await self.call('GET', f"{url}?step=2", f"{url}?step=2")
+        meals = response.json().get('meals', []) if response else []
+        if not meals:
+            return None
+        meal_ids = [meal['meal_id'] for meal in self.rng.sample(meals, min(len(meals), 3))]
+        if await self.call('PATCH', f"{url}?step=2", f"{url}?step=2", json={'meal_ids': meal_ids}) is None:
+            return None
+        response = await self.call('POST', f"{url}?step=3", f"{url}?step=3", json={
+            'delivery_date': (date.today() + timedelta(days=1)).isoformat(),
+            'delivery_time_slot': self.rng.choice(self.manifest['delivery_slots']),
+        })
+        return response.json().get('combo_id') if response else None
+
+    async def checkout(self, meals, custom_meal_id):
+        if custom_meal_id:
+            await self.call('POST', '/api/orders/cart/', '/api/orders/cart/', json={'custom_meal_id': custom_meal_id})
+        for meal in self.rng.sample(meals, min(len(meals), 2)):
+            await self.call('POST', '/api/orders/cart/', '/api/orders/cart/', json={'meal_id': meal['meal_id'], 'quantity': 1})
+        await self.call('GET', '/api/orders/cart/', '/api/orders/cart/')
+        await self.call('POST', '/api/orders/orders/create/', '/api/orders/orders/create/', json={})
+        await self.call('GET', '/api/orders/orders/', '/api/orders/orders/')
+
+    async def run(self, deadline):
+        if await self.login() is None:
+            return
+        while time.monotonic() < deadline:
+            meals = await self.browse()
+            custom_meal_id = await self.build_custom_meal() if self.account['subscribed'] else None
+            if self.account['subscribed']:
+                await self.checkout(meals, custom_meal_id)
+            await asyncio.sleep(self.rng.uniform(0.5, 2.0))
+
+
+async def chat_user(base_url, ws_url, stats, manifest, account, rng, deadline):
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        user = VirtualUser(client, stats, manifest, account, rng)
+        token = await user.login()
+    if token is None:
+        return
+
+    url = f"{ws_url}/ws/chat/{account['conversation_id']}/?token={token}"
+    start = time.perf_counter()
+    try:
+        async with websockets.connect(url) as websocket:
+            stats.record("WS connect", time.perf_counter() - start, True)
+            while time.monotonic() < deadline:
+                start = time.perf_counter()
+                await websocket.send(json.dumps({'type': 'chat_message', 'text': 'load test'}))
+                ok = False
+                try:
+                    while True:
+                        message = json.loads(await asyncio.wait_for(websocket.recv(), timeout=10))
+                        if message.get('type') == 'chat_message':
+                            ok = True
+                            break
+                except asyncio.TimeoutError:
+                    pass
+                stats.record("WS chat_message", time.perf_counter() - start, ok)
+                await asyncio.sleep(rng.uniform(0.5, 3.0))
+    except (OSError, websockets.WebSocketException):
+        stats.record("WS connect", time.perf_counter() - start, False)
+
+
+async def main(args):
+    with open(args.manifest) as f:
+        manifest = json.load(f)
+    rng = random.Random(args.seed)
+    stats = Stats()
+    deadline = time.monotonic() + args.duration
+
+    accounts = manifest['users']
+    shoppers = rng.sample(accounts, min(args.users, len(accounts)))
+    chatters = [account for account in accounts if account['conversation_id']]
+    chatters = rng.sample(chatters, min(args.chat_users, len(chatters)))
+
+    limits = httpx.Limits(max_connections=args.users)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=30, limits=limits) as client:
+        tasks = [
+            VirtualUser(client, stats, manifest, account, random.Random(rng.random())).run(deadline)
+            for account in shoppers
+        ]
+        tasks += [
+            chat_user(args.base_url, args.ws_url, stats, manifest, account, random.Random(rng.random()), deadline)
+            for account in chatters
+        ]
+        await asyncio.gather(*tasks)
+
+    stats.report()
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(stats.summary(), f, indent=2)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="OfficeKhaja lunch-rush load test")
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--ws-url', default='ws://localhost:8000')
+    parser.add_argument('--manifest', default='loadtest/manifest.json')
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--chat-users', type=int, default=20)
+    parser.add_argument('--duration', type=int, default=60)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help="Write the percentile summary to this file")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,21 @@
+from rest_framework.request import Request
+from officekhaja.async_views import AsyncAPIView, json_response
+from .models import Notification
+from .serializers import NotificationSerializer
+from .pagination import NotificationPagination
+
+
+class AsyncNotificationView(AsyncAPIView):
+    authentication_required = True
+    read_from_replica = False
+
+    async def get(self, request):
+        notificaton = Notification.objects.filter(user=request.user)
+        read = request.GET.get('type', None)
+        if read:
+            notificaton = notificaton.filter(is_read=read)
+        paginator = NotificationPagination()
+        page_queryset = paginator.get_page_queryset(notificaton, Request(request))
+        page = paginator.build_page([notification async for notification in page_queryset])
+        serializer = NotificationSerializer(page, many=True)
+        return json_response(paginator.get_paginated_response(serializer.data).data)
@@ -1,4 +1,6 @@
+from asgiref.sync import sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
+from .presence import mark_connected, mark_disconnected
 import json
 
 class NotificationConsumer(AsyncWebsocketConsumer):
@@ -7,9 +9,13 @@ class NotificationConsumer(AsyncWebsocketConsumer):
         self.group_name = f"user_{self.user.id}"
         await self.channel_layer.group_add(self.group_name, self.channel_name)
         await self.accept()
+        if self.user.is_authenticated:
+            await sync_to_async(mark_connected)(self.user.id)
 
     async def disconnect(self, close_code):
         await self.channel_layer.group_discard(self.group_name, self.channel_name)
+        if self.user.is_authenticated:
+            await sync_to_async(mark_disconnected)(self.user.id)
 
     async def notify(self, event):
         await self.send(text_data=json.dumps({
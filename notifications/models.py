@@ -10,5 +10,10 @@ class Notification(models.Model):
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-nid'], name='notification_user_idx'),
+        ]
+
     def __str__(self):
         return self.notification
\ No newline at end of file
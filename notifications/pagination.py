@@ -0,0 +1,6 @@
+from officekhaja.pagination import KeysetPagination
+
+
+class NotificationPagination(KeysetPagination):
+    page_size = 20
+    ordering = ('-created_at', '-nid')
@@ -0,0 +1,41 @@
+from django.core.cache import cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    redis_instance = cache.client.get_client(write=True)
+except Exception as e:
+    logger.error(f"Redis connection error: {e}")
+    redis_instance = None
+
+# user id -> number of open notification sockets
+NOTIFICATION_CONNECTIONS_KEY = "notification_connections"
+
+RELEASE_SCRIPT = """
+local count = redis.call('HINCRBY', KEYS[1], ARGV[1], -1)
+if count <= 0 then
+    redis.call('HDEL', KEYS[1], ARGV[1])
+end
+return count
+"""
+
+release = redis_instance.register_script(RELEASE_SCRIPT) if redis_instance else None
+
+
+def mark_connected(user_id):
+    if not redis_instance:
+        return
+    try:
+        redis_instance.hincrby(NOTIFICATION_CONNECTIONS_KEY, user_id, 1)
+    except Exception as e:
+        logger.error(f"Error tracking notification socket for user {user_id}: {e}")
+
+
+def mark_disconnected(user_id):
+    if not release:
+        return
+    try:
+        release(keys=[NOTIFICATION_CONNECTIONS_KEY], args=[user_id])
+    except Exception as e:
+        logger.error(f"Error releasing notification socket for user {user_id}: {e}")
@@ -1,7 +1,9 @@
 from django.urls import path
+from officekhaja.async_views import route
 from .views import NotificationView
+from .async_views import AsyncNotificationView
 
 urlpatterns = [
-    path('notification/', NotificationView.as_view(), name="notifications"),
+    path('notification/', route('notifications', NotificationView, AsyncNotificationView), name="notifications"),
     path('notification/<int:id>/', NotificationView.as_view(), name="read-notification")
 ]
\ No newline at end of file
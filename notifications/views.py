@@ -7,6 +7,7 @@ from django.http import Http404
 from django.shortcuts import get_object_or_404
 from .models import Notification
 from .serializers import NotificationSerializer
+from .pagination import NotificationPagination
 
 
 class NotificationView(APIView):
@@ -17,8 +18,10 @@ class NotificationView(APIView):
         read = request.query_params.get('type', None)
         if read:
             notificaton = notificaton.filter(is_read=read)
-        serializer = NotificationSerializer(notificaton, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        paginator = NotificationPagination()
+        queryset = paginator.paginate_queryset(notificaton, request)
+        serializer = NotificationSerializer(queryset, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
     def put(self, request, id):
         try:
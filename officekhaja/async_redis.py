@@ -0,0 +1,20 @@
+from django.conf import settings
+from redis.asyncio import Redis
+from weakref import WeakKeyDictionary
+from .request_metrics import AsyncInstrumentedConnection
+import asyncio
+
+_clients = WeakKeyDictionary()
+
+
+def get_async_redis():
+    # redis.asyncio connections are bound to the loop that opened them, so keep one client per loop.
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = Redis.from_url(
+            settings.CACHES['default']['LOCATION'],
+            connection_class=AsyncInstrumentedConnection,
+        )
+        _clients[loop] = client
+    return client
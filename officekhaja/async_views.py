@@ -0,0 +1,121 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotAuthenticated
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.throttling import BaseThrottle
+from users.authentication import CachedJWTAuthentication
+from .ratelimit import aconsume
+from .renderers import UJSONRenderer
+from .replicas import REPLICA_ALIAS, ais_pinned, read_alias, replica_configured
+
+renderer = UJSONRenderer()
+
+
+def json_response(data, status=status.HTTP_200_OK, headers=None):
+    return HttpResponse(
+        renderer.render(data), status=status,
+        content_type=renderer.media_type, headers=headers,
+    )
+
+
+def exception_response(exc, headers=None):
+    # Same body shape as rest_framework.views.exception_handler.
+    data = exc.detail if isinstance(exc.detail, (list, dict)) else {"detail": exc.detail}
+    return json_response(data, status=exc.status_code, headers=headers)
+
+
+class AsyncAPIView(View):
+    """
+    Read-only counterpart of an APIView for the ASGI stack.
+
+    DRF views are sync-only, so this runs the same JWT authentication, token
+    bucket throttles and replica routing natively async and renders with the
+    same renderer. Methods without an async handler fall through to
+    `sync_view` so a route can be switched without losing its writes.
+    """
+    authentication_required = False
+    throttle_scope = None
+    read_from_replica = True
+    sync_view = None
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def authenticate(self, request):
+        result = await CachedJWTAuthentication().aauthenticate(request)
+        request.user = result[0] if result else AnonymousUser()
+        if self.authentication_required and not request.user.is_authenticated:
+            raise NotAuthenticated()
+
+    def throttle_scopes(self, request):
+        scopes = ['user' if request.user.is_authenticated else 'anon']
+        if self.throttle_scope:
+            scopes.append(f"endpoint:{self.throttle_scope}")
+        return scopes
+
+    async def throttle(self, request):
+        if request.user.is_authenticated:
+            ident = f"user:{request.user.pk}"
+        else:
+            ident = f"ip:{BaseThrottle().get_ident(request)}"
+        for scope in self.throttle_scopes(request):
+            policy = settings.RATE_LIMIT_POLICIES.get(scope)
+            if policy is None:
+                continue
+            allowed, retry_after = await aconsume(scope, ident, policy['capacity'], policy['per_seconds'])
+            if not allowed:
+                return json_response(
+                    {"detail": "Request was throttled."},
+                    status=status.HTTP_429_TOO_MANY_REQUESTS,
+                    headers={'Retry-After': str(retry_after)},
+                )
+        return None
+
+    async def use_replica(self, request):
+        return (
+            self.read_from_replica and replica_configured()
+            and request.method in SAFE_METHODS and not await ais_pinned(request.user)
+        )
+
+    async def dispatch(self, request, *args, **kwargs):
+        handler = getattr(self, request.method.lower(), None) if request.method.lower() in self.http_method_names else None
+        if handler is None:
+            if self.sync_view is not None:
+                return await sync_to_async(self.sync_view)(request, *args, **kwargs)
+            return await self.http_method_not_allowed(request, *args, **kwargs)
+
+        try:
+            await self.authenticate(request)
+        except APIException as exc:
+            headers = {'WWW-Authenticate': CachedJWTAuthentication().authenticate_header(request)}
+            return exception_response(exc, headers=headers)
+
+        throttled = await self.throttle(request)
+        if throttled is not None:
+            return throttled
+
+        token = read_alias.set(REPLICA_ALIAS) if await self.use_replica(request) else None
+        try:
+            return await handler(request, *args, **kwargs)
+        except APIException as exc:
+            return exception_response(exc)
+        finally:
+            if token is not None:
+                read_alias.reset(token)
+
+
+def route(name, sync_view, async_view):
+    """
+    Picks the async view for routes listed in ASYNC_VIEWS; everything else,
+    and every non-GET method on an async route, stays on the DRF view.
+    """
+    sync_callable = sync_view.as_view()
+    if name not in settings.ASYNC_VIEWS:
+        return sync_callable
+    return async_view.as_view(sync_view=sync_callable)
@@ -0,0 +1,139 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.backends.signals import connection_created
+from .request_metrics import RequestMetrics, current_metrics, record_query
+from .async_redis import get_async_redis
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+try:
+    redis_instance = cache.client.get_client(write=True)
+except Exception as e:
+    logger.error(f"Redis connection error: {e}")
+    redis_instance = None
+
+REQUEST_METRICS_KEY = "metrics:requests"
+METRIC_FIELDS = ['requests', 'queries', 'db_seconds', 'cache_calls', 'seconds']
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def view_name(request):
+    match = getattr(request, 'resolver_match', None)
+    return match.view_name if match and match.view_name else 'unresolved'
+
+
+def queue_metrics(pipe, name, metrics):
+    pipe.hincrby(REQUEST_METRICS_KEY, f"{name}|requests", 1)
+    pipe.hincrby(REQUEST_METRICS_KEY, f"{name}|queries", metrics.queries)
+    pipe.hincrbyfloat(REQUEST_METRICS_KEY, f"{name}|db_seconds", metrics.db_time)
+    pipe.hincrby(REQUEST_METRICS_KEY, f"{name}|cache_calls", metrics.cache_calls)
+    pipe.hincrbyfloat(REQUEST_METRICS_KEY, f"{name}|seconds", metrics.total_time)
+    return pipe
+
+
+def record_metrics(name, metrics):
+    if not redis_instance or not getattr(settings, 'REQUEST_METRICS_ENABLED', True):
+        return
+    try:
+        queue_metrics(redis_instance.pipeline(transaction=False), name, metrics).execute()
+    except Exception as e:
+        logger.error(f"Error recording request metrics: {e}")
+
+
+async def arecord_metrics(name, metrics):
+    if not getattr(settings, 'REQUEST_METRICS_ENABLED', True):
+        return
+    try:
+        await queue_metrics(get_async_redis().pipeline(transaction=False), name, metrics).execute()
+    except Exception as e:
+        logger.error(f"Error recording request metrics: {e}")
+
+
+def request_metrics():
+    if not redis_instance:
+        return {}
+    views = {}
+    for field, value in redis_instance.hgetall(REQUEST_METRICS_KEY).items():
+        name, _, metric = field.decode().rpartition("|")
+        views.setdefault(name, {})[metric] = float(value)
+    return views
+
+
+def check_budget(name, metrics):
+    budget = getattr(settings, 'QUERY_BUDGETS', {}).get(name)
+    if budget is None or metrics.queries <= budget:
+        return
+    message = f"{name} ran {metrics.queries} queries, budget is {budget}"
+    if getattr(settings, 'QUERY_BUDGET_STRICT', False):
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+def instrument_connection(connection, **kwargs):
+    # Queries are counted against the request in current_metrics, which follows the
+    # request into sync_to_async threads, so every thread's connections carry the wrapper.
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+connection_created.connect(instrument_connection)
+
+
+def attach_metrics(response, metrics):
+    response['Server-Timing'] = metrics.server_timing()
+    response.request_metrics = metrics
+
+
+class InstrumentationMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        # Connections opened before this module was imported never sent connection_created.
+        for connection in connections.all(initialized_only=True):
+            instrument_connection(connection)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.total_time = time.perf_counter() - start
+            current_metrics.reset(token)
+
+        name = view_name(request)
+        attach_metrics(response, metrics)
+        record_metrics(name, metrics)
+        check_budget(name, metrics)
+        return response
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.total_time = time.perf_counter() - start
+            current_metrics.reset(token)
+
+        name = view_name(request)
+        attach_metrics(response, metrics)
+        await arecord_metrics(name, metrics)
+        check_budget(name, metrics)
+        return response
@@ -0,0 +1,83 @@
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from orders.permissions import IsStaff
+from .ratelimit import rejection_counts
+from .instrumentation import request_metrics
+from .profiling import list_profiles, load_profile
+from .renderers import UJSONRenderer, PlainTextRenderer
+import io
+import marshal
+import pstats
+
+REQUEST_METRICS = [
+    ('requests', 'http_requests_total', "Requests handled per view."),
+    ('queries', 'http_request_db_queries_total', "Database queries run per view."),
+    ('db_seconds', 'http_request_db_seconds_total', "Time spent in the database per view."),
+    ('cache_calls', 'http_request_cache_round_trips_total', "Redis round trips per view."),
+    ('seconds', 'http_request_seconds_total', "Total request time per view."),
+]
+
+# pstats.SortKey values plus the unambiguous abbreviations sort_stats accepts.
+PROFILE_SORT_KEYS = frozenset(pstats.Stats().get_sort_arg_defs())
+
+
+class MetricsView(APIView):
+    permission_classes = [IsStaff]
+    throttle_classes = []
+
+    def get(self, request):
+        lines = [
+            "# HELP ratelimit_rejected_total Requests rejected by the token bucket limiter.",
+            "# TYPE ratelimit_rejected_total counter",
+        ]
+        for scope, count in sorted(rejection_counts().items()):
+            lines.append(f'ratelimit_rejected_total{{scope="{scope}"}} {count}')
+
+        views = request_metrics()
+        for field, metric, description in REQUEST_METRICS:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} counter")
+            for name, values in sorted(views.items()):
+                value = values.get(field, 0)
+                lines.append(f'{metric}{{view="{name}"}} {value:g}')
+        return HttpResponse("\n".join(lines) + "\n", content_type="text/plain; version=0.0.4")
+
+
+class ProfileListView(APIView):
+    permission_classes = [IsStaff]
+    throttle_classes = []
+
+    def get(self, request):
+        return Response({'profiles': list_profiles()}, status=status.HTTP_200_OK)
+
+
+class ProfileDownloadView(APIView):
+    permission_classes = [IsStaff]
+    throttle_classes = []
+    renderer_classes = [UJSONRenderer, PlainTextRenderer]
+
+    def get(self, request, profile_id):
+        sort = request.query_params.get('sort', 'cumulative')
+        if sort not in PROFILE_SORT_KEYS:
+            return Response(
+                {'error': f"Invalid sort. Choose from: {', '.join(key.value for key in pstats.SortKey)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = load_profile(profile_id)
+        if data is None:
+            return Response({'error': 'Profile not found or expired'}, status=status.HTTP_404_NOT_FOUND)
+
+        if request.query_params.get('format') == 'text':
+            output = io.StringIO()
+            stats = pstats.Stats(stream=output)
+            stats.stats = marshal.loads(data)
+            stats.get_top_level_stats()
+            stats.sort_stats(sort).print_stats(50)
+            return HttpResponse(output.getvalue(), content_type="text/plain")
+
+        response = HttpResponse(data, content_type="application/octet-stream")
+        response['Content-Disposition'] = f'attachment; filename="{profile_id}.prof"'
+        return response
@@ -0,0 +1,179 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+import datetime
+import json
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # DjangoJSONEncoder truncates to milliseconds, which would skip rows on a microsecond key.
+        if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination over a composite (key, ..., pk) ordering.
+
+    The cursor carries the full position of the boundary row, so every page is
+    a range scan on the matching index instead of an OFFSET past ties.
+    Querysets are split into get_page_queryset()/build_page() so async views can
+    evaluate the page slice themselves.
+    """
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    ordering = ('-created_at', '-pk')
+    invalid_cursor_message = _('Invalid cursor')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_queryset = self.get_page_queryset(queryset, request, view)
+        return self.build_page(list(page_queryset))
+
+    def get_page_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.fields = self.resolve_fields(queryset)
+        self.reverse, position = self.decode_cursor(request)
+        self.has_cursor = position is not None
+
+        ordering = self.ordering if not self.reverse else [self.flip(field) for field in self.ordering]
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.seek(ordering, position))
+        return queryset[:self.page_size + 1]
+
+    def build_page(self, rows):
+        has_more = len(rows) > self.page_size
+        page = rows[:self.page_size]
+        if self.reverse:
+            page.reverse()
+            self.has_next, self.has_previous = self.has_cursor, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.has_cursor
+        self.page = page
+        return page
+
+    def get_page_size(self, request):
+        try:
+            requested = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(requested, self.max_page_size))
+
+    def resolve_fields(self, queryset):
+        fields = {}
+        for name in (field.lstrip('-') for field in self.ordering):
+            if name == 'pk':
+                fields[name] = queryset.model._meta.pk
+            elif name in queryset.query.annotations:
+                fields[name] = queryset.query.annotations[name].output_field
+            else:
+                try:
+                    fields[name] = queryset.model._meta.get_field(name)
+                except FieldDoesNotExist:
+                    raise ValueError(f"Cannot paginate {queryset.model.__name__} on unknown field '{name}'")
+        return fields
+
+    @staticmethod
+    def flip(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    def seek(self, ordering, position):
+        """
+        Rows strictly after `position` in `ordering`, expanded lexicographically:
+        (a > x) OR (a = x AND b > y) ... The leading bound on the first key lets
+        the database start an index range scan at the cursor.
+        """
+        lookups = []
+        for field in ordering:
+            name = field.lstrip('-')
+            lookups.append((name, 'lt' if field.startswith('-') else 'gt'))
+
+        condition = Q()
+        for index, (name, lookup) in enumerate(lookups):
+            branch = Q(**{prior: position[prior] for prior, _ in lookups[:index]})
+            branch &= Q(**{f'{name}__{lookup}': position[name]})
+            condition |= branch
+        first, lookup = lookups[0]
+        return Q(**{f'{first}__{lookup}e': position[first]}) & condition
+
+    def position_from_instance(self, instance):
+        return {name: getattr(instance, name) for name in self.fields}
+
+    def encode_cursor(self, instance, reverse=False):
+        payload = {'r': int(reverse), 'p': self.position_from_instance(instance)}
+        encoded = urlsafe_b64encode(json.dumps(payload, cls=CursorEncoder).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return False, None
+        try:
+            payload = json.loads(urlsafe_b64decode(encoded.encode()).decode())
+            position = {
+                name: field.to_python(payload['p'][name])
+                for name, field in self.fields.items()
+            }
+            return bool(payload['r']), position
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'The pagination cursor value.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Number of results to return per page.',
+                'schema': {'type': 'integer'},
+            },
+        ]
@@ -0,0 +1,172 @@
+from asgiref.sync import async_to_sync, iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.urls import Resolver404, resolve
+from django.utils import timezone
+from users.authentication import CachedJWTAuthentication
+import cProfile
+import logging
+import marshal
+import random
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+try:
+    redis_instance = cache.client.get_client(write=True)
+except Exception as e:
+    logger.error(f"Redis connection error: {e}")
+    redis_instance = None
+
+PROFILES_INDEX_KEY = "profiles:index"
+
+
+def profile_key(profile_id):
+    return f"profile:{profile_id}"
+
+
+def profile_meta_key(profile_id):
+    return f"profile:{profile_id}:meta"
+
+
+def store_profile(profiler, meta):
+    profiler.create_stats()
+    ttl = settings.PROFILING_TTL
+    profile_id = uuid.uuid4().hex
+    meta['id'] = profile_id
+    cache.set_many({
+        profile_key(profile_id): marshal.dumps(profiler.stats),
+        profile_meta_key(profile_id): meta,
+    }, timeout=ttl)
+    if redis_instance:
+        now = time.time()
+        pipe = redis_instance.pipeline()
+        pipe.zadd(PROFILES_INDEX_KEY, {profile_id: now})
+        pipe.zremrangebyscore(PROFILES_INDEX_KEY, '-inf', now - ttl)
+        pipe.expire(PROFILES_INDEX_KEY, ttl)
+        pipe.execute()
+    return profile_id
+
+
+def list_profiles(limit=50):
+    if not redis_instance:
+        return []
+    ids = [
+        raw.decode() for raw in
+        redis_instance.zrevrangebyscore(PROFILES_INDEX_KEY, '+inf', time.time() - settings.PROFILING_TTL, start=0, num=limit)
+    ]
+    metas = cache.get_many([profile_meta_key(profile_id) for profile_id in ids])
+    return [metas[profile_meta_key(profile_id)] for profile_id in ids if profile_meta_key(profile_id) in metas]
+
+
+def load_profile(profile_id):
+    return cache.get(profile_key(profile_id))
+
+
+def resolves_to_async_view(request):
+    try:
+        match = resolve(request.path_info, getattr(request, 'urlconf', None))
+    except Resolver404:
+        return False
+    return iscoroutinefunction(match.func)
+
+
+class ProfilingMiddleware:
+    """
+    cProfile only sees the thread it was enabled on. Under ASGI, async views are
+    profiled on the event loop thread, so the profile also contains whatever
+    other requests the loop interleaves meanwhile. Sync views are profiled on a
+    worker thread that drives the rest of the chain through async_to_sync, and
+    thread-sensitive sync code, including the view, runs back on that thread.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.authenticator = CachedJWTAuthentication()
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def requested_by_staff(self, request):
+        if request.META.get('HTTP_X_PROFILE') != '1':
+            return False
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated:
+            try:
+                result = self.authenticator.authenticate(request)
+            except Exception:
+                return False
+            user = result[0] if result else None
+        return bool(user and user.is_staff)
+
+    def should_profile(self, request):
+        if self.requested_by_staff(request):
+            return 'header'
+        if random.random() < settings.PROFILING_SAMPLE_RATE:
+            return 'sample'
+        return None
+
+    def profiled(self, get_response, request):
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            response = get_response(request)
+        finally:
+            profiler.disable()
+        return profiler, response, time.perf_counter() - start
+
+    def save(self, request, response, profiler, duration, trigger, mode):
+        try:
+            match = getattr(request, 'resolver_match', None)
+            profile_id = store_profile(profiler, {
+                'path': request.path,
+                'method': request.method,
+                'view': match.view_name if match else None,
+                'status': response.status_code,
+                'duration_ms': round(duration * 1000, 2),
+                'trigger': trigger,
+                'mode': mode,
+                'captured_at': timezone.now().isoformat(),
+            })
+            response['X-Profile-Id'] = profile_id
+        except Exception as e:
+            logger.error(f"Error storing profile: {e}")
+        return response
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        trigger = self.should_profile(request)
+        if not trigger:
+            return self.get_response(request)
+
+        profiler, response, duration = self.profiled(self.get_response, request)
+        return self.save(request, response, profiler, duration, trigger, 'sync')
+
+    async def __acall__(self, request):
+        trigger = await sync_to_async(self.should_profile)(request)
+        if not trigger:
+            return await self.get_response(request)
+
+        if resolves_to_async_view(request):
+            profiler = cProfile.Profile()
+            start = time.perf_counter()
+            profiler.enable()
+            try:
+                response = await self.get_response(request)
+            finally:
+                profiler.disable()
+            duration, mode = time.perf_counter() - start, 'async'
+        else:
+            profiler, response, duration = await sync_to_async(self.profiled)(
+                async_to_sync(self.get_response), request
+            )
+            mode = 'sync'
+        return await sync_to_async(self.save)(request, response, profiler, duration, trigger, mode)
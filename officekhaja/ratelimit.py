@@ -0,0 +1,91 @@
+from django.core.cache import cache
+from weakref import WeakKeyDictionary
+from .async_redis import get_async_redis
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+try:
+    redis_instance = cache.client.get_client(write=True)
+except Exception as e:
+    logger.error(f"Redis connection error: {e}")
+    redis_instance = None
+
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1])
+local ts = tonumber(bucket[2])
+if tokens == nil then
+    tokens = capacity
+    ts = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = math.ceil((cost - tokens) / rate)
+    redis.call('HINCRBY', KEYS[2], ARGV[5], 1)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, retry_after}
+"""
+
+REJECTED_KEY = "ratelimit:rejected"
+
+token_bucket = redis_instance.register_script(TOKEN_BUCKET_SCRIPT) if redis_instance else None
+async_token_buckets = WeakKeyDictionary()
+
+
+def bucket_key(scope, ident):
+    return f"ratelimit:{scope}:{ident}"
+
+
+def consume(scope, ident, capacity, per_seconds, cost=1):
+    if not token_bucket:
+        return True, 0
+    try:
+        allowed, retry_after = token_bucket(
+            keys=[bucket_key(scope, ident), REJECTED_KEY],
+            args=[capacity, capacity / per_seconds, time.time(), cost, scope]
+        )
+    except Exception as e:
+        logger.error(f"Rate limit check failed for {scope}: {e}")
+        return True, 0
+    return bool(allowed), int(retry_after)
+
+
+async def aconsume(scope, ident, capacity, per_seconds, cost=1):
+    try:
+        client = get_async_redis()
+        script = async_token_buckets.get(client)
+        if script is None:
+            script = async_token_buckets[client] = client.register_script(TOKEN_BUCKET_SCRIPT)
+        allowed, retry_after = await script(
+            keys=[bucket_key(scope, ident), REJECTED_KEY],
+            args=[capacity, capacity / per_seconds, time.time(), cost, scope]
+        )
+    except Exception as e:
+        logger.error(f"Rate limit check failed for {scope}: {e}")
+        return True, 0
+    return bool(allowed), int(retry_after)
+
+
+def rejection_counts():
+    if not redis_instance:
+        return {}
+    return {
+        scope.decode(): int(count)
+        for scope, count in redis_instance.hgetall(REJECTED_KEY).items()
+    }
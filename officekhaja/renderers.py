@@ -0,0 +1,49 @@
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+import ujson
+
+encoder = JSONEncoder()
+
+
+class UJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+
+        ret = ujson.dumps(
+            data,
+            ensure_ascii=self.ensure_ascii,
+            escape_forward_slashes=False,
+            indent=indent or 0,
+            default=encoder.default,
+        )
+
+        if not self.ensure_ascii:
+            ret = ret.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+        return ret.encode()
+
+
+class PlainTextRenderer(UJSONRenderer):
+    # Lets ?format=text through content negotiation; views return the text
+    # as an HttpResponse and only error bodies are rendered here, as JSON.
+    media_type = 'text/plain'
+    format = 'text'
+
+
+class UJSONParser(JSONParser):
+    renderer_class = UJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            return ujson.loads(stream.read().decode(encoding))
+        except ValueError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,131 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+import logging
+
+logger = logging.getLogger(__name__)
+
+REPLICA_ALIAS = 'replica'
+PRIMARY_ALIAS = 'default'
+
+read_alias = ContextVar('read_alias', default=None)
+
+
+def replica_configured():
+    return settings.REPLICA_READS_ENABLED and REPLICA_ALIAS in settings.DATABASES
+
+
+def pin_key(user_id):
+    return f"replica:pin:{user_id}"
+
+
+def pin_to_primary(user_id):
+    try:
+        cache.set(pin_key(user_id), 1, timeout=settings.REPLICA_PIN_SECONDS)
+    except Exception as e:
+        logger.error(f"Error pinning user {user_id} to primary: {e}")
+
+
+def is_pinned(user):
+    if not user or not user.is_authenticated:
+        return False
+    try:
+        return bool(cache.get(pin_key(user.pk)))
+    except Exception:
+        # Without the pin store we cannot guarantee read-your-writes, so stay on the primary.
+        return True
+
+
+async def ais_pinned(user):
+    if not user or not user.is_authenticated:
+        return False
+    try:
+        return bool(await cache.aget(pin_key(user.pk)))
+    except Exception:
+        return True
+
+
+@contextmanager
+def read_from_replica():
+    token = read_alias.set(REPLICA_ALIAS if replica_configured() else None)
+    try:
+        yield
+    finally:
+        read_alias.reset(token)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY_ALIAS
+
+
+class ReplicaReadMixin:
+    """
+    Serves safe requests from the replica once authentication and permission
+    checks have run on the primary, unless the user wrote recently.
+    """
+    read_from_replica = True
+    _read_alias_token = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if (
+            self.read_from_replica and replica_configured()
+            and request.method in SAFE_METHODS and not is_pinned(request.user)
+        ):
+            self._read_alias_token = read_alias.set(REPLICA_ALIAS)
+
+    def dispatch(self, request, *args, **kwargs):
+        # Reset here rather than in finalize_response, which an uncaught exception skips,
+        # so a failed request cannot leave the worker thread reading from the replica.
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            if self._read_alias_token is not None:
+                read_alias.reset(self._read_alias_token)
+                self._read_alias_token = None
+
+
+def pin_writer(request, response):
+    if request.method in SAFE_METHODS or response.status_code >= 400 or not replica_configured():
+        return
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        pin_to_primary(user.pk)
+
+
+class ReplicaPinMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        response = self.get_response(request)
+        pin_writer(request, response)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if request.method not in SAFE_METHODS:
+            # request.user may still be the lazy session user, which can only be resolved synchronously.
+            await sync_to_async(pin_writer)(request, response)
+        return response
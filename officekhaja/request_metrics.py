@@ -0,0 +1,52 @@
+from contextvars import ContextVar
+from redis.asyncio.connection import Connection as AsyncConnection
+from redis.connection import Connection
+import time
+
+current_metrics = ContextVar('current_metrics', default=None)
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.cache_calls = 0
+        self.total_time = 0.0
+
+    def db_wrapper(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - start
+
+    def server_timing(self):
+        return ", ".join([
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries"',
+            f'cache;desc="{self.cache_calls} round trips"',
+            f'total;dur={self.total_time * 1000:.1f}',
+        ])
+
+
+def record_query(execute, sql, params, many, context):
+    metrics = current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    return metrics.db_wrapper(execute, sql, params, many, context)
+
+
+class InstrumentedConnection(Connection):
+    def send_packed_command(self, command, check_health=True):
+        metrics = current_metrics.get()
+        if metrics is not None:
+            metrics.cache_calls += 1
+        return super().send_packed_command(command, check_health)
+
+
+class AsyncInstrumentedConnection(AsyncConnection):
+    async def send_packed_command(self, command, check_health=True):
+        metrics = current_metrics.get()
+        if metrics is not None:
+            metrics.cache_calls += 1
+        return await super().send_packed_command(command, check_health)
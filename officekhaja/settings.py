@@ -12,8 +12,10 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 
 import os
 from pathlib import Path
+from celery.schedules import crontab
 from dotenv import load_dotenv
-from decouple import Config
+from decouple import Config, Csv
+from officekhaja.request_metrics import InstrumentedConnection
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -25,7 +27,7 @@ config = Config(repository='officekhaja/.env')
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = config('SECRET_KEY')
 
-DEBUG = True
+DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
 
 ALLOWED_HOSTS = ['*']
 
@@ -57,12 +59,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'officekhaja.instrumentation.InstrumentationMiddleware',
+    'officekhaja.profiling.ProfilingMiddleware',
     'corsheaders.middleware.CorsMiddleware', 
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'officekhaja.replicas.ReplicaPinMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -100,6 +105,8 @@ CHANNEL_LAYERS = {
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
+DB_POOL_ENABLED = config('DB_POOL_ENABLED', default=True, cast=bool)
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -108,9 +115,58 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD'),
         'HOST': config('DB_HOST'),
         'PORT': config('DB_PORT', default='3306'),
+        'CONN_HEALTH_CHECKS': True,
+        'CONN_MAX_AGE': 0 if DB_POOL_ENABLED else config('DB_CONN_MAX_AGE', default=60, cast=int),
     }
 }
 
+# Pool sizes are per process: workers x DB_POOL_MAX_SIZE must stay below Postgres max_connections.
+if DB_POOL_ENABLED:
+    from psycopg_pool import ConnectionPool
+
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+            'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+            'timeout': config('DB_POOL_TIMEOUT', default=10, cast=float),
+            'max_idle': 300,
+            'max_lifetime': 1800,
+            'check': ConnectionPool.check_connection,
+        },
+    }
+
+# Reads from views marked with ReplicaReadMixin go to the replica; writers are pinned
+# to the primary for REPLICA_PIN_SECONDS. Tests mirror the replica onto the default database;
+# REPLICA_READS_ENABLED=False sends every read back to the primary.
+DB_REPLICA_HOST = config('DB_REPLICA_HOST', default='')
+if DB_REPLICA_HOST:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': config('DB_REPLICA_NAME', default=DATABASES['default']['NAME']),
+        'HOST': DB_REPLICA_HOST,
+        'PORT': config('DB_REPLICA_PORT', default=DATABASES['default']['PORT']),
+        'OPTIONS': dict(DATABASES['default'].get('OPTIONS', {})),
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['officekhaja.replicas.ReplicaRouter']
+REPLICA_PIN_SECONDS = 15
+REPLICA_READS_ENABLED = config('REPLICA_READS_ENABLED', default=True, cast=bool)
+
+
+PASSWORD_HASHERS = [
+    'users.hashers.ConfigurableArgon2PasswordHasher',
+    'users.hashers.ConfigurableBCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+ARGON2_PARAMS = {
+    'time_cost': int(os.getenv('ARGON2_TIME_COST', 2)),
+    'memory_cost': int(os.getenv('ARGON2_MEMORY_COST', 19456)),
+    'parallelism': int(os.getenv('ARGON2_PARALLELISM', 1)),
+}
+BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', 12))
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -142,26 +198,33 @@ USE_TZ = True
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ],
+    'DEFAULT_THROTTLE_CLASSES': [
+        'officekhaja.throttling.UserTokenBucketThrottle',
+        'officekhaja.throttling.AnonTokenBucketThrottle',
+        'officekhaja.throttling.EndpointTokenBucketThrottle',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
+        'officekhaja.renderers.UJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'officekhaja.renderers.UJSONParser',
         'rest_framework.parsers.FormParser',
         'rest_framework.parsers.MultiPartParser',
     ],
-    'DATETIME_FORMAT': '%Y-%m-%dT%H:%M:%S.%fZ',
-    'DATE_FORMAT': '%Y-%m-%d',
+    'DATETIME_FORMAT': 'iso-8601',
+    'DATE_FORMAT': 'iso-8601',
 }
 
+if DEBUG:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].append('rest_framework.renderers.BrowsableAPIRenderer')
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/6.0/howto/static-files/
 
@@ -177,7 +240,7 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME':  timedelta(days=int(os.getenv("ACCESS_TOKEN_LIFETIME"))),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
-    'UPDATE_LAST_LOGIN': True,
+    'UPDATE_LAST_LOGIN': False,
     
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
@@ -218,6 +281,9 @@ CACHES = {
         "LOCATION": "redis://127.0.0.1:6379/1",
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "CONNECTION_POOL_KWARGS": {
+                "connection_class": InstrumentedConnection,
+            },
         }
     }
 }
@@ -239,6 +305,76 @@ CELERY_TIMEZONE = 'Asia/Kathmandu'
 
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 
+CELERY_BEAT_SCHEDULE = {
+    'recompute-blog-scores': {
+        'task': 'blog.tasks.recompute_blog_scores',
+        'schedule': crontab(minute=30, hour=3),
+    },
+    'rebuild-trending-hashtags': {
+        'task': 'blog.tasks.rebuild_trending',
+        'schedule': crontab(minute=45, hour=3),
+    },
+    'expire-subscriptions': {
+        'task': 'users.tasks.expire_subscriptions',
+        'schedule': crontab(minute=5, hour=0),
+    },
+    'refresh-admin-statistics': {
+        'task': 'orders.tasks.refresh_admin_statistics',
+        'schedule': crontab(minute='*/5'),
+    },
+    'flush-login-events': {
+        'task': 'users.tasks.flush_login_events',
+        'schedule': crontab(),
+    },
+    'subscription-renewal-reminders': {
+        'task': 'users.tasks.send_renewal_reminders',
+        'schedule': crontab(minute=0, hour=8),
+    },
+    'archive-orders': {
+        'task': 'orders.tasks.archive_orders',
+        'schedule': crontab(minute=15, hour=2),
+    },
+}
+
+SUBSCRIPTION_REMINDER_DAYS = [3, 1]
+
+ORDER_ARCHIVE_AFTER_DAYS = int(os.getenv('ORDER_ARCHIVE_AFTER_DAYS', 90))
+ORDER_ARCHIVE_BATCH_SIZE = 500
+
+REQUEST_METRICS_ENABLED = True
+QUERY_BUDGET_STRICT = False
+QUERY_BUDGETS = {
+    'khaja:meals': 6,
+    'khaja:meal-detail': 8,
+    'khaja:my-custom-meals': 6,
+    'orders:my-orders': 8,
+    'orders:order-detail': 8,
+    'orders:my-cart': 6,
+}
+
+PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'False').lower() == 'true'
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', 0))
+PROFILING_TTL = 60 * 60
+
+RATE_LIMIT_POLICIES = {
+    'user': {'capacity': 120, 'per_seconds': 60},
+    'anon': {'capacity': 60, 'per_seconds': 60},
+    'websocket': {'capacity': 10, 'per_seconds': 60},
+    'endpoint:meals': {'capacity': 30, 'per_seconds': 10},
+    'endpoint:sitemap': {'capacity': 10, 'per_seconds': 60},
+    'endpoint:order_create': {'capacity': 5, 'per_seconds': 60},
+}
+
+# Route names served by the native async views (officekhaja.async_views.route) under ASGI.
+ASYNC_VIEWS = config('ASYNC_VIEWS', default='', cast=Csv())
+
+OTP_TTL = 300
+OTP_MAX_ATTEMPTS = 5
+OTP_RATE_LIMITS = {
+    'email': {'capacity': 3, 'per_seconds': 600},
+    'ip': {'capacity': 10, 'per_seconds': 600},
+}
+
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = 'smtp.gmail.com'
 EMAIL_PORT = 587
@@ -0,0 +1,30 @@
+from io import StringIO
+from tempfile import NamedTemporaryFile
+from django.conf import settings
+from django.core.management import call_command
+from django.test.utils import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+# Enough rows per page and per related set for an N+1 to blow the budget.
+SEED_OPTIONS = {'users': 20, 'meals': 40, 'ingredients': 30, 'orders': 200, 'blogs': 0}
+
+
+# Budgets count the queries of one database; TestCase data is not visible on the replica mirror anyway.
+@override_settings(REQUEST_METRICS_ENABLED=False, REPLICA_READS_ENABLED=False)
+class QueryBudgetTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with NamedTemporaryFile(suffix='.json') as manifest:
+            call_command('seed_data', manifest=manifest.name, stdout=StringIO(), **SEED_OPTIONS)
+
+    def assertWithinQueryBudget(self, url_name, *args, method='get', data=None, **kwargs):
+        budget = settings.QUERY_BUDGETS.get(url_name)
+        if budget is None:
+            self.fail(f"{url_name} has no entry in QUERY_BUDGETS")
+        response = getattr(self.client, method)(reverse(url_name, args=args, kwargs=kwargs), data)
+        self.assertLess(response.status_code, 400, response.content)
+        metrics = response.request_metrics
+        if metrics.queries > budget:
+            self.fail(f"{url_name} ran {metrics.queries} queries, budget is {budget}")
+        return response
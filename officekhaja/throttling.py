@@ -0,0 +1,54 @@
+from django.conf import settings
+from rest_framework.throttling import BaseThrottle
+from .ratelimit import consume
+
+
+class TokenBucketThrottle(BaseThrottle):
+    scope = None
+
+    def get_scope(self, request, view):
+        return self.scope
+
+    def get_ident(self, request):
+        if request.user and request.user.is_authenticated:
+            return f"user:{request.user.pk}"
+        return f"ip:{super().get_ident(request)}"
+
+    def allow_request(self, request, view):
+        self.retry_after = None
+        scope = self.get_scope(request, view)
+        policy = settings.RATE_LIMIT_POLICIES.get(scope) if scope else None
+        if policy is None:
+            return True
+
+        allowed, self.retry_after = consume(
+            scope, self.get_ident(request), policy['capacity'], policy['per_seconds']
+        )
+        return allowed
+
+    def wait(self):
+        return self.retry_after
+
+
+class UserTokenBucketThrottle(TokenBucketThrottle):
+    scope = 'user'
+
+    def allow_request(self, request, view):
+        if not (request.user and request.user.is_authenticated):
+            return True
+        return super().allow_request(request, view)
+
+
+class AnonTokenBucketThrottle(TokenBucketThrottle):
+    scope = 'anon'
+
+    def allow_request(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return True
+        return super().allow_request(request, view)
+
+
+class EndpointTokenBucketThrottle(TokenBucketThrottle):
+    def get_scope(self, request, view):
+        throttle_scope = getattr(view, 'throttle_scope', None)
+        return f"endpoint:{throttle_scope}" if throttle_scope else None
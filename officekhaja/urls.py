@@ -11,6 +11,7 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from .metrics import MetricsView, ProfileListView, ProfileDownloadView
 
 # DRF Spectacular
 from drf_spectacular.views import (
@@ -32,6 +33,10 @@ urlpatterns = [
     # path('api/noti/', include('notifications.urls')),
     # path('api/chat/', include('chatapp.urls')),
 
+    path('metrics/', MetricsView.as_view(), name='metrics'),
+    path('metrics/profiles/', ProfileListView.as_view(), name='profiles'),
+    path('metrics/profiles/<str:profile_id>/', ProfileDownloadView.as_view(), name='profile-download'),
+
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/schema/swagger-ui/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'), 
     path('api/schema/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
@@ -5,7 +5,8 @@ from .admin_views import (
     AdminSubscriptionManagementView, AdminSubscriptionDetailView,
     AdminUserSubscriptionListView, AdminUserSubscriptionDetailView,
     AdminMealAvailabilityView, AdminCustomMealListView,
-    AdminCustomMealDetailView, AdminStatisticsView
+    AdminCustomMealDetailView, AdminStatisticsView,
+    AdminOrderRollupView, AdminSlotRollupView, AdminMealRollupView
 )
 
 urlpatterns = [
@@ -27,4 +28,7 @@ urlpatterns = [
     path('custom-meals/<int:combo_id>/', AdminCustomMealDetailView.as_view(), name='admin-custom-meal-detail'),
     
     path('statistics/', AdminStatisticsView.as_view(), name='admin-statistics'),
+    path('rollups/orders/', AdminOrderRollupView.as_view(), name='admin-rollup-orders'),
+    path('rollups/slots/', AdminSlotRollupView.as_view(), name='admin-rollup-slots'),
+    path('rollups/meals/', AdminMealRollupView.as_view(), name='admin-rollup-meals'),
 ]
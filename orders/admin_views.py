@@ -8,30 +8,37 @@ from django.core.mail import send_mail
 from django.conf import settings
 from django.http import Http404
 from django.utils import timezone
+from django.utils.dateparse import parse_date
+from datetime import timedelta
 from django.db.models import Count, Sum, Q
 from orders.permissions import IsStaff
-from orders.models import Order, OrderItem, ComboOrderItem
+from orders.models import Order, OrderItem, ComboOrderItem, DailyOrderRollup, DailySlotRollup, DailyMealRollup
 from khaja.models import Meals, CustomMeal, Combo, Nutrition, Ingredient, MealIngredient
 from users.models import CustomUser, Subscription, UserSubscription
-from orders.serializers import OrderSerializer, OrderItemSerializer, ComboOrderItemSerializer
+from orders.serializers import OrderSerializer, OrderSummarySerializer, OrderItemSerializer, ComboOrderItemSerializer
 from .permissions import IsAdminOrReadOnly
 from khaja.serializers import (
     MealSerializer, CustomMealSerializer, NutritionSerializer, 
     ComboSerializer, IngredientSerializer, MealIngredientSerializer
 )
-from users.serializers import UserSerializer, SubscriptionSerializer, UserSubscriptionSerializer
+from users.serializers import UserSerializer, UserListSerializer, SubscriptionSerializer, UserSubscriptionSerializer
+from users.pagination import UserDirectoryPagination
 from khaja.pagination import MenuInfiniteScrollPagination
+from .pagination import OrderPagination
+from .loaders import order_summary_queryset, order_detail_queryset, order_context
+from .statistics import get_statistics
 
 
 class AdminUserListView(APIView):
     permission_classes = [IsAuthenticated, IsStaff]
 
     def get(self, request):
-        users = CustomUser.objects.all().order_by('-created_at')
+        users = CustomUser.objects.only(*UserListSerializer.Meta.fields)
         
         user_type = request.query_params.get('user_type')
         is_active = request.query_params.get('is_active')
         status_filter = request.query_params.get('status')
+        search = request.query_params.get('search', '').strip()
         
         if user_type:
             users = users.filter(user_type=user_type.upper())
@@ -39,10 +46,18 @@ class AdminUserListView(APIView):
             users = users.filter(is_active=is_active.lower() == 'true')
         if status_filter is not None:
             users = users.filter(status=status_filter.lower() == 'true')
+        if search:
+            users = users.filter(
+                Q(first_name__icontains=search) |
+                Q(last_name__icontains=search) |
+                Q(email__icontains=search) |
+                Q(phone_number__icontains=search) |
+                Q(organization_name__icontains=search)
+            )
         
-        paginator = MenuInfiniteScrollPagination()
+        paginator = UserDirectoryPagination()
         queryset = paginator.paginate_queryset(users, request)
-        serializer = UserSerializer(queryset, many=True)
+        serializer = UserListSerializer(queryset, many=True)
         return paginator.get_paginated_response(serializer.data)
 
     def post(self, request):
@@ -94,7 +109,7 @@ class AdminOrderListView(APIView):
     permission_classes = [IsAuthenticated, IsStaff]
 
     def get(self, request):
-        orders = Order.objects.all().order_by('-created_at')
+        orders = order_summary_queryset()
 
         status_filter = request.query_params.get('status')
         user_id = request.query_params.get('user_id')
@@ -110,9 +125,9 @@ class AdminOrderListView(APIView):
         if date_to:
             orders = orders.filter(created_at__date__lte=date_to)
         
-        paginator = MenuInfiniteScrollPagination()
+        paginator = OrderPagination()
         queryset = paginator.paginate_queryset(orders, request)
-        serializer = OrderSerializer(queryset, many=True)
+        serializer = OrderSummarySerializer(queryset, many=True)
         return paginator.get_paginated_response(serializer.data)
 
 
@@ -121,10 +136,10 @@ class AdminOrderDetailView(APIView):
 
     def get(self, request, order_id):
         try:
-            order = get_object_or_404(Order, id=order_id)
+            order = get_object_or_404(order_detail_queryset(), pk=order_id)
         except Http404:
             return Response(f"Corresponding order with id {order_id} not found.", status=status.HTTP_404_NOT_FOUND)
-        serializer = OrderSerializer(order)
+        serializer = OrderSerializer(order, context=order_context([order]))
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def patch(self, request, order_id):
@@ -219,7 +234,7 @@ class AdminUserSubscriptionListView(APIView):
     permission_classes = [IsAuthenticated, IsStaff]
 
     def get(self, request):
-        subscriptions = UserSubscription.objects.all().order_by('-created_at')
+        subscriptions = UserSubscription.objects.all()
         is_active = request.query_params.get('is_active')
         plan_type = request.query_params.get('plan_type')
         
@@ -302,7 +317,7 @@ class AdminCustomMealListView(APIView):
     permission_classes = [IsAuthenticated, IsStaff]
 
     def get(self, request):
-        custom_meals = CustomMeal.objects.all().order_by('-created_at')
+        custom_meals = CustomMeal.objects.all()
         user_id = request.query_params.get('user_id')
         category = request.query_params.get('category')
         is_active = request.query_params.get('is_active')
@@ -347,59 +362,101 @@ class AdminStatisticsView(APIView):
     permission_classes = [IsAuthenticated, IsAdminOrReadOnly]
 
     def get(self, request):
-        
-        total_users = CustomUser.objects.count()
-        active_users = CustomUser.objects.filter(is_active=True).count()
-        subscribed_users = CustomUser.objects.filter(status=True).count()
-
-        total_orders = Order.objects.count()
-        pending_orders = Order.objects.filter(status='PENDING').count()
-        processing_orders = Order.objects.filter(status='PROCESSING').count()
-        delivering_orders = Order.objects.filter(status='DELIVERING').count()
-        delivered_orders = Order.objects.filter(status='DELIVERED').count()
-        cancelled_orders = Order.objects.filter(status='CANCELLED').count()
-
-        total_revenue = Order.objects.filter(
-            status__in=['DELIVERED']
-        ).aggregate(total=Sum('total_price'))['total'] or 0
-        total_meals = Meals.objects.count()
-        veg_meals = Meals.objects.filter(type__slug='veg').count()
-        non_veg_meals = Meals.objects.filter(type__slug='non-veg').count()
-        total_custom_meals = CustomMeal.objects.count()
-        active_custom_meals = CustomMeal.objects.filter(is_active=True).count()
-        active_subscriptions = UserSubscription.objects.filter(is_active=True).count()
-        expired_subscriptions = UserSubscription.objects.filter(is_active=False).count()
-        
-        statistics = {
-            'users': {
-                'total': total_users,
-                'active': active_users,
-                'subscribed': subscribed_users,
-            },
-            'orders': {
-                'total': total_orders,
-                'pending': pending_orders,
-                'processing': processing_orders,
-                'delivering': delivering_orders,
-                'delivered': delivered_orders,
-                'cancelled': cancelled_orders,
-            },
-            'revenue': {
-                'total': str(total_revenue),
-            },
-            'meals': {
-                'total': total_meals,
-                'veg': veg_meals,
-                'non_veg': non_veg_meals,
-            },
-            'custom_meals': {
-                'total': total_custom_meals,
-                'active': active_custom_meals,
-            },
-            'subscriptions': {
-                'active': active_subscriptions,
-                'expired': expired_subscriptions,
-            }
-        }
-        
-        return Response(statistics, status=status.HTTP_200_OK)
\ No newline at end of file
+        statistics = get_statistics()
+        return Response(statistics, status=status.HTTP_200_OK)
+
+
+def rollup_range(request, default_days=30):
+    today = timezone.localdate()
+    date_from = request.query_params.get('from')
+    date_to = request.query_params.get('to')
+    date_from = parse_date(date_from) if date_from else today - timedelta(days=default_days - 1)
+    date_to = parse_date(date_to) if date_to else today
+    return date_from, date_to
+
+
+class AdminOrderRollupView(APIView):
+    permission_classes = [IsAuthenticated, IsStaff]
+
+    def get(self, request):
+        date_from, date_to = rollup_range(request)
+        if not date_from or not date_to:
+            return Response({"error": "Dates must be in YYYY-MM-DD format"}, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = DailyOrderRollup.objects.filter(day__range=(date_from, date_to)).values('day', 'status', 'orders', 'revenue')
+        days = {}
+        for row in rows:
+            day = days.setdefault(row['day'], {'day': row['day'], 'orders': 0, 'revenue': 0, 'statuses': {}})
+            day['statuses'][row['status']] = {'orders': row['orders'], 'revenue': str(row['revenue'])}
+            day['orders'] += row['orders']
+            if row['status'] == 'DELIVERED':
+                day['revenue'] += row['revenue']
+        for day in days.values():
+            day['revenue'] = str(day['revenue'])
+
+        return Response({
+            'from': date_from,
+            'to': date_to,
+            'days': list(days.values())
+        }, status=status.HTTP_200_OK)
+
+
+class AdminSlotRollupView(APIView):
+    permission_classes = [IsAuthenticated, IsStaff]
+
+    def get(self, request):
+        date_from, date_to = rollup_range(request)
+        if not date_from or not date_to:
+            return Response({"error": "Dates must be in YYYY-MM-DD format"}, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = DailySlotRollup.objects.filter(
+            day__range=(date_from, date_to)
+        ).values('day', 'slot_id', 'slot__display_name', 'items', 'quantity')
+        return Response({
+            'from': date_from,
+            'to': date_to,
+            'slots': [
+                {
+                    'day': row['day'],
+                    'slot_id': row['slot_id'],
+                    'slot': row['slot__display_name'],
+                    'items': row['items'],
+                    'quantity': row['quantity'],
+                }
+                for row in rows
+            ]
+        }, status=status.HTTP_200_OK)
+
+
+class AdminMealRollupView(APIView):
+    permission_classes = [IsAuthenticated, IsStaff]
+
+    def get(self, request):
+        date_from, date_to = rollup_range(request)
+        if not date_from or not date_to:
+            return Response({"error": "Dates must be in YYYY-MM-DD format"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            limit = min(int(request.query_params.get('limit', 20)), 100)
+        except ValueError:
+            limit = 20
+
+        rows = (
+            DailyMealRollup.objects.filter(day__range=(date_from, date_to))
+            .values('meal_id', 'meal__name')
+            .annotate(total_items=Sum('items'), total_quantity=Sum('quantity'))
+            .order_by('-total_quantity')[:limit]
+        )
+        return Response({
+            'from': date_from,
+            'to': date_to,
+            'meals': [
+                {
+                    'meal_id': row['meal_id'],
+                    'name': row['meal__name'],
+                    'items': row['total_items'],
+                    'quantity': row['total_quantity'],
+                }
+                for row in rows
+            ]
+        }, status=status.HTTP_200_OK)
@@ -0,0 +1,72 @@
+from django.db import transaction
+from .models import Order, ArchivedOrder
+from . import rollups
+
+ARCHIVE_STATUSES = ('DELIVERED', 'CANCELLED')
+
+
+def snapshot_order_items(order):
+    return [
+        {
+            'uuid': item.uuid,
+            'meals_id': item.meals_id,
+            'meal_name': item.meals.name if item.meals else None,
+            'meal_type': item.meal_type,
+            'meal_category': item.meal_category,
+            'price': item.meals.price if item.meals else None,
+            'quantity': item.quantity,
+        }
+        for item in order.order_items.all()
+    ]
+
+
+def snapshot_combo_items(order):
+    return [
+        {
+            'uuid': item.uuid,
+            'combo_id': item.combo_id,
+            'delivery_from_date': item.delivery_from_date,
+            'delivery_to_date': item.delivery_to_date,
+            'delivery_time_slot_id': item.delivery_time_slot_id,
+            'quantity': item.quantity,
+            'preferences': item.preferences,
+            'price_snapshot': item.price_snapshot,
+        }
+        for item in order.combo_items.all()
+    ]
+
+
+def to_archive(order):
+    return ArchivedOrder(
+        uuid=order.uuid,
+        user_id=order.user_id,
+        created_at=order.created_at,
+        updated_at=order.updated_at,
+        subtotal=order.subtotal,
+        tax=order.tax,
+        delivery_charge=order.delivery_charge,
+        total_price=order.total_price,
+        status=order.status,
+        payment_method=order.payment_method,
+        delivery_address=order.delivery_address,
+        order_items=snapshot_order_items(order),
+        combo_items=snapshot_combo_items(order),
+    )
+
+
+def archive_batch(cutoff, batch_size):
+    # Archived orders keep contributing to the daily rollups, so the deletes must not decrement them.
+    with transaction.atomic():
+        pks = list(
+            Order.objects.select_for_update(skip_locked=True)
+            .filter(status__in=ARCHIVE_STATUSES, created_at__lt=cutoff)
+            .order_by('created_at')
+            .values_list('pk', flat=True)[:batch_size]
+        )
+        if not pks:
+            return 0
+        orders = Order.objects.filter(pk__in=pks).prefetch_related('order_items__meals', 'combo_items')
+        ArchivedOrder.objects.bulk_create([to_archive(order) for order in orders], ignore_conflicts=True)
+        with rollups.suspend():
+            Order.objects.filter(pk__in=pks).delete()
+    return len(pks)
@@ -0,0 +1,49 @@
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Subquery, Value
+from django.db.models.functions import Coalesce
+from khaja.loaders import MEAL_DETAIL_RELATED, custom_meal_queryset, ingredient_map as meal_ingredient_map
+from .models import Order, OrderItem, ComboOrderItem
+
+
+def _item_count(model):
+    counts = (
+        model.objects.filter(order=OuterRef('pk'))
+        .order_by().values('order').annotate(total=Count('pk')).values('total')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def order_summary_queryset(queryset=None):
+    if queryset is None:
+        queryset = Order.objects.all()
+    return queryset.select_related('user').annotate(
+        item_count=_item_count(OrderItem),
+        combo_count=_item_count(ComboOrderItem),
+    )
+
+
+def order_detail_queryset(queryset=None):
+    if queryset is None:
+        queryset = Order.objects.all()
+    return queryset.select_related('user').prefetch_related(
+        Prefetch(
+            'order_items',
+            queryset=OrderItem.objects.select_related(
+                *(f'meals__{related}' for related in MEAL_DETAIL_RELATED)
+            )
+        ),
+        Prefetch(
+            'combo_items',
+            queryset=custom_meal_queryset(ComboOrderItem.objects.select_related('combo__user'), prefix='combo__')
+        ),
+    )
+
+
+def ingredient_map(orders):
+    return meal_ingredient_map(
+        item.meals for order in orders for item in order.order_items.all() if item.meals
+    )
+
+
+def order_context(orders, **context):
+    context['ingredients'] = ingredient_map(orders)
+    return context
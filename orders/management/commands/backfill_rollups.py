@@ -0,0 +1,112 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils.dateparse import parse_date
+from django.utils import timezone
+from collections import Counter
+from orders.models import Order, ArchivedOrder, OrderItem, ComboOrderItem, DailyOrderRollup, DailySlotRollup, DailyMealRollup
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily order, slot and meal rollups from order history"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--from', dest='date_from', help="First day to rebuild (YYYY-MM-DD)")
+        parser.add_argument('--to', dest='date_to', help="Last day to rebuild (YYYY-MM-DD)")
+
+    def parse(self, value, name):
+        if value is None:
+            return None
+        day = parse_date(value)
+        if day is None:
+            raise CommandError(f"Invalid --{name} date: {value}")
+        return day
+
+    def in_range(self, queryset, field, date_from, date_to):
+        if date_from:
+            queryset = queryset.filter(**{f"{field}__gte": date_from})
+        if date_to:
+            queryset = queryset.filter(**{f"{field}__lte": date_to})
+        return queryset
+
+    def handle(self, *args, **options):
+        date_from = self.parse(options['date_from'], 'from')
+        date_to = self.parse(options['date_to'], 'to')
+
+        order_totals = Counter()
+        order_revenue = Counter()
+        for model in [Order, ArchivedOrder]:
+            rows = (
+                self.in_range(model.objects.all(), 'created_at__date', date_from, date_to)
+                .annotate(day=TruncDate('created_at'))
+                .values('day', 'status')
+                .annotate(orders=Count('pk'), revenue=Sum('total_price'))
+                .order_by()
+            )
+            for row in rows.iterator():
+                order_totals[row['day'], row['status']] += row['orders']
+                order_revenue[row['day'], row['status']] += row['revenue'] or 0
+
+        meal_items, meal_quantity = Counter(), Counter()
+        slot_items, slot_quantity = Counter(), Counter()
+        meals = (
+            self.in_range(OrderItem.objects.filter(meals__isnull=False), 'order__created_at__date', date_from, date_to)
+            .exclude(order__status='CANCELLED')
+            .annotate(day=TruncDate('order__created_at'))
+            .values('day', 'meals_id')
+            .annotate(items=Count('pk'), total_quantity=Sum('quantity'))
+            .order_by()
+        )
+        for row in meals.iterator():
+            meal_items[row['day'], row['meals_id']] += row['items']
+            meal_quantity[row['day'], row['meals_id']] += row['total_quantity']
+        slots = (
+            self.in_range(ComboOrderItem.objects.all(), 'order__created_at__date', date_from, date_to)
+            .exclude(order__status='CANCELLED')
+            .annotate(day=TruncDate('order__created_at'))
+            .values('day', 'delivery_time_slot_id')
+            .annotate(items=Count('pk'), total_quantity=Sum('quantity'))
+            .order_by()
+        )
+        for row in slots.iterator():
+            slot_items[row['day'], row['delivery_time_slot_id']] += row['items']
+            slot_quantity[row['day'], row['delivery_time_slot_id']] += row['total_quantity']
+
+        archived = (
+            self.in_range(ArchivedOrder.objects.exclude(status='CANCELLED'), 'created_at__date', date_from, date_to)
+            .values_list('created_at', 'order_items', 'combo_items')
+        )
+        for created_at, order_items, combo_items in archived.iterator():
+            day = timezone.localdate(created_at)
+            for item in order_items:
+                if item['meals_id']:
+                    meal_items[day, item['meals_id']] += 1
+                    meal_quantity[day, item['meals_id']] += item['quantity']
+            for item in combo_items:
+                slot_items[day, item['delivery_time_slot_id']] += 1
+                slot_quantity[day, item['delivery_time_slot_id']] += item['quantity']
+
+        with transaction.atomic():
+            for model in [DailyOrderRollup, DailyMealRollup, DailySlotRollup]:
+                self.in_range(model.objects.all(), 'day', date_from, date_to).delete()
+
+            created = DailyOrderRollup.objects.bulk_create([
+                DailyOrderRollup(day=day, status=status, orders=count, revenue=order_revenue[day, status])
+                for (day, status), count in order_totals.items()
+            ], batch_size=1000)
+            self.stdout.write(f"Order rollups: {len(created)}")
+
+            created = DailyMealRollup.objects.bulk_create([
+                DailyMealRollup(day=day, meal_id=meal_id, items=count, quantity=meal_quantity[day, meal_id])
+                for (day, meal_id), count in meal_items.items()
+            ], batch_size=1000)
+            self.stdout.write(f"Meal rollups: {len(created)}")
+
+            created = DailySlotRollup.objects.bulk_create([
+                DailySlotRollup(day=day, slot_id=slot_id, items=count, quantity=slot_quantity[day, slot_id])
+                for (day, slot_id), count in slot_items.items()
+            ], batch_size=1000)
+            self.stdout.write(f"Slot rollups: {len(created)}")
+
+        self.stdout.write(self.style.SUCCESS("Rollups rebuilt"))
@@ -0,0 +1,128 @@
+import asyncio
+import statistics
+import time
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncRequestFactory, override_settings
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+from khaja.models import Meals
+from khaja.views import MealListView, MealDetailView, TypeListView, MealCategoryListView, DeliveryTimeSlotListView
+from khaja.async_views import (
+    AsyncMealListView, AsyncMealDetailView, AsyncTypeListView,
+    AsyncMealCategoryListView, AsyncDeliveryTimeSlotListView
+)
+from notifications.views import NotificationView
+from notifications.async_views import AsyncNotificationView
+from users.models import CustomUser
+from .benchmark_db_connections import percentile
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare requests per second of one ASGI worker serving the catalog and notification "
+        "endpoints through the DRF views (run in the sync thread, as Django does under ASGI) "
+        "and through the native async views, after checking both return the same payload"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--route', action='append', help="Routes to run (default: all)")
+        parser.add_argument('--duration', type=float, default=10, help="Seconds per route and mode")
+        parser.add_argument('--concurrency', type=int, default=50, help="Requests in flight on the worker's event loop")
+        parser.add_argument('--email', help="User for the notifications route; skipped when omitted")
+
+    def routes(self, options):
+        meal = Meals.objects.filter(is_available=True).order_by('pk').first()
+        routes = {
+            'types': ('/api/khaja/types/', {}, TypeListView, AsyncTypeListView),
+            'categories': ('/api/khaja/categories/', {}, MealCategoryListView, AsyncMealCategoryListView),
+            'delivery-slots': (
+                f'/api/khaja/delivery-slots/?date={timezone.localdate():%Y-%m-%d}', {},
+                DeliveryTimeSlotListView, AsyncDeliveryTimeSlotListView
+            ),
+            'meals': ('/api/khaja/meals/', {}, MealListView, AsyncMealListView),
+        }
+        if meal:
+            routes['meal-detail'] = (
+                f'/api/khaja/meals/{meal.slug}/', {'slug': meal.slug}, MealDetailView, AsyncMealDetailView
+            )
+        if options['email']:
+            user = CustomUser.objects.filter(email=options['email']).first()
+            if user is None:
+                raise CommandError(f"No user with email {options['email']}")
+            routes['notifications'] = (
+                '/api/noti/notification/', {}, NotificationView, AsyncNotificationView, str(AccessToken.for_user(user))
+            )
+        return routes
+
+    def handlers(self, route):
+        path, kwargs, sync_view, async_view, *token = route
+        factory = AsyncRequestFactory()
+        headers = {'Authorization': f'Bearer {token[0]}'} if token else {}
+        sync_callable = sync_view.as_view()
+        async_callable = async_view.as_view()
+
+        def call_sync():
+            response = sync_callable(factory.get(path, headers=headers), **kwargs)
+            response.render()
+            return response
+
+        async def run_sync():
+            return await sync_to_async(call_sync)()
+
+        async def run_async():
+            return await async_callable(factory.get(path, headers=headers), **kwargs)
+
+        return {'sync': run_sync, 'async': run_async}
+
+    async def load(self, handler, duration, concurrency):
+        deadline = time.perf_counter() + duration
+        errors = []
+
+        async def client():
+            samples = []
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                response = await handler()
+                samples.append((time.perf_counter() - start) * 1000)
+                if response.status_code >= 400:
+                    errors.append(response.status_code)
+            return samples
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(client() for _ in range(concurrency)))
+        return time.perf_counter() - start, [sample for samples in results for sample in samples], errors
+
+    async def benchmark(self, name, route, options):
+        handlers = self.handlers(route)
+        sync_response, async_response = await handlers['sync'](), await handlers['async']()
+        if (sync_response.status_code, sync_response.content) != (async_response.status_code, async_response.content):
+            raise CommandError(f"{name}: sync and async payloads differ")
+
+        self.stdout.write(f"{name} ({len(sync_response.content)} bytes)")
+        for mode, handler in handlers.items():
+            elapsed, samples, errors = await self.load(handler, options['duration'], options['concurrency'])
+            if not samples:
+                self.stdout.write(f"  {mode:<5} no samples")
+                continue
+            self.stdout.write(
+                f"  {mode:<5} {len(samples) / elapsed:8.1f} req/s  "
+                f"p50 {statistics.median(samples):7.2f} ms  "
+                f"p95 {percentile(samples, 0.95):7.2f} ms  "
+                f"p99 {percentile(samples, 0.99):7.2f} ms  "
+                f"errors {len(errors)}"
+            )
+
+    def handle(self, *args, **options):
+        routes = self.routes(options)
+        selected = options['route'] or list(routes)
+        unknown = set(selected) - set(routes)
+        if unknown:
+            raise CommandError(f"Unknown routes: {', '.join(sorted(unknown))}")
+
+        # Keep the token bucket round trips in the measurement without throttling the load.
+        policies = {scope: {'capacity': 10 ** 9, 'per_seconds': 1} for scope in settings.RATE_LIMIT_POLICIES}
+        with override_settings(RATE_LIMIT_POLICIES=policies):
+            for name in selected:
+                asyncio.run(self.benchmark(name, routes[name], options))
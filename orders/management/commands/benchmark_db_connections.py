@@ -0,0 +1,124 @@
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from channels.db import database_sync_to_async
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, close_old_connections
+from django.db.backends.signals import connection_created
+
+MODES = {
+    'reconnect': {'CONN_MAX_AGE': 0, 'pool': None},
+    'persistent': {'CONN_MAX_AGE': 60, 'pool': None},
+    'pool': {'CONN_MAX_AGE': 0, 'pool': {'min_size': 2, 'max_size': 10, 'timeout': 10}},
+}
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class Command(BaseCommand):
+    help = "Measure database connects per second and query latency for each connection mode under HTTP and chat load"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--mode', choices=list(MODES), action='append', help="Modes to run (default: all)")
+        parser.add_argument('--duration', type=float, default=10, help="Seconds per mode")
+        parser.add_argument('--http-workers', type=int, default=8, help="Threads simulating sync request workers")
+        parser.add_argument('--chat-users', type=int, default=50, help="Concurrent consumers issuing database_sync_to_async calls")
+        parser.add_argument('--query', default="SELECT 1")
+
+    def configure(self, mode):
+        alias = f'benchmark_{mode}'
+        settings_dict = {**connections.settings['default'], 'CONN_MAX_AGE': MODES[mode]['CONN_MAX_AGE']}
+        options = {key: value for key, value in settings_dict.get('OPTIONS', {}).items() if key != 'pool'}
+        if MODES[mode]['pool']:
+            options['pool'] = MODES[mode]['pool']
+        settings_dict['OPTIONS'] = options
+        connections.settings[alias] = settings_dict
+        return alias
+
+    def run_query(self, alias, query):
+        start = time.perf_counter()
+        with connections[alias].cursor() as cursor:
+            cursor.execute(query)
+            cursor.fetchall()
+        return (time.perf_counter() - start) * 1000
+
+    def http_worker(self, alias, query, deadline):
+        samples = []
+        while time.perf_counter() < deadline:
+            close_old_connections()
+            samples.append(self.run_query(alias, query))
+            close_old_connections()
+        connections[alias].close()
+        return samples
+
+    async def chat_load(self, alias, query, deadline, users):
+        fetch = database_sync_to_async(self.run_query)
+
+        async def consumer():
+            samples = []
+            while time.perf_counter() < deadline:
+                samples.append(await fetch(alias, query))
+            return samples
+
+        results = await asyncio.gather(*(consumer() for _ in range(users)))
+        return [sample for samples in results for sample in samples]
+
+    def benchmark(self, mode, options):
+        alias = self.configure(mode)
+        connects = []
+
+        def count(sender, connection, **kwargs):
+            if connection.alias == alias:
+                connects.append(1)
+
+        connection_created.connect(count)
+        deadline = time.perf_counter() + options['duration']
+        start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=options['http_workers']) as executor:
+                futures = [
+                    executor.submit(self.http_worker, alias, options['query'], deadline)
+                    for _ in range(options['http_workers'])
+                ]
+                chat = asyncio.run(self.chat_load(alias, options['query'], deadline, options['chat_users']))
+                http = [sample for future in futures for sample in future.result()]
+        finally:
+            connection_created.disconnect(count)
+
+        elapsed = time.perf_counter() - start
+        wrapper = connections[alias]
+        pool = getattr(wrapper, 'pool', None) if MODES[mode]['pool'] else None
+        # With a pool, connection_created fires per checkout; the pool tracks physical connects.
+        physical = pool.get_stats().get('connections_num', 0) if pool else len(connects)
+        if pool:
+            wrapper.close_pool()
+        wrapper.close()
+        return elapsed, physical, http, chat
+
+    def report(self, label, samples, elapsed):
+        if not samples:
+            self.stdout.write(f"  {label:<5} no samples")
+            return
+        self.stdout.write(
+            f"  {label:<5} {len(samples) / elapsed:8.1f} q/s  "
+            f"p50 {statistics.median(samples):7.2f} ms  "
+            f"p95 {percentile(samples, 0.95):7.2f} ms  "
+            f"p99 {percentile(samples, 0.99):7.2f} ms"
+        )
+
+    def handle(self, *args, **options):
+        if connections.settings['default']['ENGINE'] != 'django.db.backends.postgresql':
+            raise CommandError("The connection benchmark requires the PostgreSQL backend")
+
+        for mode in options['mode'] or list(MODES):
+            elapsed, physical, http, chat = self.benchmark(mode, options)
+            self.stdout.write(f"{mode} ({elapsed:.1f}s, {options['http_workers']} http workers, {options['chat_users']} chat users)")
+            self.stdout.write(f"  connects {physical} ({physical / elapsed:.1f}/s)")
+            self.report('http', http, elapsed)
+            self.report('chat', chat, elapsed)
@@ -0,0 +1,61 @@
+import time
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.parsers import JSONParser
+from io import BytesIO
+from officekhaja.renderers import UJSONRenderer, UJSONParser
+from orders.models import Order
+from orders.serializers import OrderSerializer
+from khaja.models import Meals, CustomMeal
+from khaja.serializers import MealSerializer, CustomMealSerializer
+
+LEGACY_FORMATS = {
+    'DATETIME_FORMAT': '%Y-%m-%dT%H:%M:%S.%fZ',
+    'DATE_FORMAT': '%Y-%m-%d',
+}
+
+
+class Command(BaseCommand):
+    help = "Compare serialization and JSON rendering cost of the legacy and ujson pipelines"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=200, help="Rows loaded per serializer")
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def timed(self, func, repeat):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = func()
+        return (time.perf_counter() - start) * 1000 / repeat, result
+
+    def run_pipeline(self, serializer_class, instances, renderer, parser, repeat):
+        serialize_ms, data = self.timed(lambda: serializer_class(instances, many=True).data, repeat)
+        render_ms, content = self.timed(lambda: renderer.render(data), repeat)
+        parse_ms, _ = self.timed(lambda: parser.parse(BytesIO(content)), repeat)
+        return serialize_ms, render_ms, parse_ms, len(content)
+
+    def handle(self, *args, **options):
+        limit, repeat = options['limit'], options['repeat']
+        suites = [
+            ('OrderSerializer', OrderSerializer, Order.objects.all()[:limit]),
+            ('MealSerializer', MealSerializer, Meals.objects.all()[:limit]),
+            ('CustomMealSerializer', CustomMealSerializer, CustomMeal.objects.all()[:limit]),
+        ]
+        legacy_settings = {**settings.REST_FRAMEWORK, **LEGACY_FORMATS}
+
+        for name, serializer_class, queryset in suites:
+            instances = list(queryset)
+            if not instances:
+                self.stdout.write(f"{name}: no rows, skipped")
+                continue
+
+            with override_settings(REST_FRAMEWORK=legacy_settings):
+                before = self.run_pipeline(serializer_class, instances, JSONRenderer(), JSONParser(), repeat)
+            after = self.run_pipeline(serializer_class, instances, UJSONRenderer(), UJSONParser(), repeat)
+
+            self.stdout.write(f"{name} ({len(instances)} rows, {repeat} runs)")
+            for label, old, new in zip(['serialize', 'render', 'parse'], before, after):
+                self.stdout.write(f"  {label:<10} before {old:8.2f} ms  after {new:8.2f} ms  x{old / new if new else 0:.2f}")
+            self.stdout.write(f"  payload    before {before[3]} bytes  after {after[3]} bytes")
@@ -0,0 +1,64 @@
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.http import HttpResponse
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework_simplejwt.tokens import AccessToken
+from officekhaja.replicas import REPLICA_ALIAS, PRIMARY_ALIAS, ReplicaPinMiddleware, pin_key, replica_configured
+from users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = "Verify that replica-marked views read from the replica and that writers are pinned to the primary"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--email', required=True, help="User the requests are made as")
+        parser.add_argument('--path', default='/api/khaja/meals/', help="Replica-marked endpoint to read")
+
+    def dispatch(self, method, path, user, get_response=None):
+        # The bearer token authenticates routes served by the async views.
+        request = getattr(APIRequestFactory(), method)(path, HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+        force_authenticate(request, user=user)
+        # force_authenticate only reaches DRF views; ReplicaPinMiddleware reads request.user.
+        request.user = user
+        if get_response is None:
+            match = resolve(path)
+            view = async_to_sync(match.func) if iscoroutinefunction(match.func) else match.func
+            get_response = lambda req: view(req, *match.args, **match.kwargs)
+        with CaptureQueriesContext(connections[PRIMARY_ALIAS]) as primary, \
+                CaptureQueriesContext(connections[REPLICA_ALIAS]) as replica:
+            response = ReplicaPinMiddleware(get_response)(request)
+        return response, len(primary), len(replica)
+
+    def read(self, label, user, path, expect_replica):
+        response, primary, replica = self.dispatch('get', path, user)
+        ok = response.status_code < 400 and (replica > 0) == expect_replica
+        self.stdout.write(f"{label:<24} status {response.status_code}  primary {primary}  replica {replica}  {'ok' if ok else 'FAIL'}")
+        return ok
+
+    def handle(self, *args, **options):
+        if not replica_configured():
+            raise CommandError("No replica database configured; set DB_REPLICA_HOST")
+        user = CustomUser.objects.filter(email=options['email']).first()
+        if user is None:
+            raise CommandError(f"No user with email {options['email']}")
+
+        path = options['path']
+        cache.delete(pin_key(user.pk))
+        results = [self.read("read before write", user, path, expect_replica=True)]
+
+        response, _, _ = self.dispatch('post', path, user, get_response=lambda req: HttpResponse(status=201))
+        pinned = bool(cache.get(pin_key(user.pk)))
+        self.stdout.write(f"{'write pins user':<24} status {response.status_code}  pinned {pinned}  {'ok' if pinned else 'FAIL'}")
+        results.append(pinned)
+
+        results.append(self.read("read after write", user, path, expect_replica=False))
+        cache.delete(pin_key(user.pk))
+        results.append(self.read("read after pin expiry", user, path, expect_replica=True))
+
+        if not all(results):
+            raise CommandError("Replica routing check failed")
+        self.stdout.write(self.style.SUCCESS("Replica routing verified"))
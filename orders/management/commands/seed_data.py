@@ -0,0 +1,338 @@
+import json
+import os
+import random
+from contextlib import contextmanager
+from datetime import time, timedelta
+from decimal import Decimal
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from blog.models import Blog, Comments, PostReaction
+from blog.tasks import recompute_blog_scores
+from blog.utils import bump_blog_version
+from chatapp.models import Conversation, Message
+from khaja.models import (
+    Type, MealCategory, DeliveryTimeSlot, Meals, Ingredient, MealIngredient,
+    Nutrition, Combo, CustomMeal
+)
+from orders.models import Order, OrderItem, ComboOrderItem, Cart, CartItem
+from users.models import CustomUser, Subscription, UserSubscription
+
+EMAIL_DOMAIN = "loadtest.local"
+SLUG_PREFIX = "loadtest-"
+PASSWORD = "loadtest-password"
+
+TYPES = [("veg", "Veg"), ("non-veg", "Non Veg")]
+CATEGORIES = [("breakfast", "Breakfast"), ("lunch", "Lunch"), ("dinner", "Dinner"), ("snacks", "Snacks")]
+SLOTS = [
+    ("morning", "Morning", time(7, 0), time(9, 0)),
+    ("lunch-rush", "Lunch Rush", time(12, 0), time(14, 0)),
+    ("evening", "Evening", time(17, 0), time(19, 0)),
+]
+PLANS = [("WEEKLY", Decimal("1500.00"), 7), ("MONTHLY", Decimal("5500.00"), 30)]
+TAX_RATE = Decimal("0.13")
+DELIVERY_CHARGE = Decimal("50.00")
+
+
+@contextmanager
+def backdated(*models):
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now_add', False)
+    ]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+class Command(BaseCommand):
+    help = "Seed deterministic synthetic data for load tests and benchmarks"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--users', type=int, default=500)
+        parser.add_argument('--meals', type=int, default=120)
+        parser.add_argument('--ingredients', type=int, default=80)
+        parser.add_argument('--orders', type=int, default=3000)
+        parser.add_argument('--blogs', type=int, default=100)
+        parser.add_argument('--days', type=int, default=30, help="Spread history over this many past days")
+        parser.add_argument('--flush', action='store_true', help="Remove previously seeded rows first")
+        parser.add_argument('--manifest', default='loadtest/manifest.json', help="Where to write credentials for the load harness")
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.now = timezone.now()
+        self.days = options['days']
+
+        if options['flush']:
+            self.flush()
+
+        with transaction.atomic(), backdated(CustomUser, Order, CustomMeal, Blog, Comments, Message, Conversation):
+            self.reference_data()
+            ingredients = self.seed_ingredients(options['ingredients'])
+            meals = self.seed_meals(options['meals'], ingredients)
+            users = self.seed_users(options['users'])
+            custom_meals = self.seed_custom_meals(users, meals)
+            self.seed_carts(users, meals)
+            self.seed_orders(options['orders'], users, meals, custom_meals)
+            conversations = self.seed_conversations(users)
+            self.seed_blogs(options['blogs'], users)
+
+        call_command('backfill_rollups', stdout=self.stdout)
+        recompute_blog_scores()
+        bump_blog_version()
+        self.write_manifest(options['manifest'], users, conversations)
+        self.stdout.write(self.style.SUCCESS("Seed data created"))
+
+    def past(self):
+        return self.now - timedelta(seconds=self.rng.randint(0, self.days * 86400))
+
+    def flush(self):
+        Combo.objects.filter(meals__slug__startswith=SLUG_PREFIX).delete()
+        CustomUser.objects.filter(email__endswith=f"@{EMAIL_DOMAIN}").delete()
+        Meals.objects.filter(slug__startswith=SLUG_PREFIX).delete()
+        Ingredient.objects.filter(slug__startswith=SLUG_PREFIX).delete()
+        self.stdout.write("Removed previously seeded rows")
+
+    def reference_data(self):
+        self.types = [Type.objects.get_or_create(slug=slug, defaults={'type_name': name})[0] for slug, name in TYPES]
+        self.categories = [
+            MealCategory.objects.get_or_create(slug=slug, defaults={'category': name})[0]
+            for slug, name in CATEGORIES
+        ]
+        self.slots = [
+            DeliveryTimeSlot.objects.get_or_create(
+                start_time=start, end_time=end, defaults={'slug': slug, 'name': display, 'display_name': display}
+            )[0]
+            for slug, display, start, end in SLOTS
+        ]
+        self.plans = [
+            Subscription.objects.get_or_create(subscription=name, defaults={'rate': rate, 'duration_days': days})[0]
+            for name, rate, days in PLANS
+        ]
+
+    def seed_ingredients(self, count):
+        ingredients = Ingredient.objects.bulk_create([
+            Ingredient(name=f"{SLUG_PREFIX}ingredient-{i}", slug=f"{SLUG_PREFIX}ingredient-{i}", category=self.rng.choice(["grain", "vegetable", "protein", "spice"]))
+            for i in range(count)
+        ])
+        self.stdout.write(f"Ingredients: {len(ingredients)}")
+        return ingredients
+
+    def seed_meals(self, count, ingredients):
+        meals = Meals.objects.bulk_create([
+            Meals(
+                slug=f"{SLUG_PREFIX}meal-{i}",
+                name=f"Load Test Meal {i}",
+                description="Synthetic meal for load testing",
+                type=self.rng.choice(self.types),
+                meal_category=self.rng.choice(self.categories),
+                price=Decimal(self.rng.randrange(80, 600)),
+                weight=self.rng.randrange(150, 700),
+                is_available=self.rng.random() > 0.1,
+            )
+            for i in range(count)
+        ])
+        MealIngredient.objects.bulk_create([
+            MealIngredient(meal=meal, ingredient_ids=[i.id for i in self.rng.sample(ingredients, min(len(ingredients), 6))])
+            for meal in meals
+        ])
+        Nutrition.objects.bulk_create([
+            Nutrition(
+                meal_id=meal,
+                energy=Decimal(self.rng.randrange(150, 900)),
+                protein=Decimal(self.rng.randrange(5, 60)),
+                carbs=Decimal(self.rng.randrange(10, 120)),
+                fats=Decimal(self.rng.randrange(2, 50)),
+                sugar=Decimal(self.rng.randrange(0, 30)),
+            )
+            for meal in meals
+        ])
+        self.stdout.write(f"Meals: {len(meals)}")
+        return meals
+
+    def seed_users(self, count):
+        password = make_password(PASSWORD)
+        users = CustomUser.objects.bulk_create([
+            CustomUser(
+                phone_number=f"98{i:08d}",
+                email=f"user{i}@{EMAIL_DOMAIN}",
+                password=password,
+                first_name=f"Load{i}",
+                last_name="Tester",
+                user_type="ORGANIZATION" if i % 10 == 0 else "INDIVIDUAL",
+                organization_name=f"Load Test Org {i}" if i % 10 == 0 else None,
+                street_address=f"{i} Test Street",
+                is_active=True,
+                created_at=self.past(),
+            )
+            for i in range(count)
+        ], batch_size=1000)
+
+        subscribed = [user for user in users if self.rng.random() < 0.8]
+        today = timezone.localdate()
+        subscriptions = []
+        for user in subscribed:
+            plan = self.rng.choice(self.plans)
+            activated = today - timedelta(days=self.rng.randrange(0, plan.duration_days))
+            subscriptions.append(UserSubscription(
+                user=user, plan=plan, activated_from=activated,
+                expires_on=activated + timedelta(days=plan.duration_days), is_active=True,
+            ))
+        UserSubscription.objects.bulk_create(subscriptions, batch_size=1000)
+        CustomUser.objects.filter(id__in=[user.id for user in subscribed]).update(status=True)
+        self.subscriptions = {subscription.user_id: subscription for subscription in subscriptions}
+        self.stdout.write(f"Users: {len(users)} ({len(subscriptions)} subscribed)")
+        return users
+
+    def seed_custom_meals(self, users, meals):
+        owners = [user for user in users if user.id in self.subscriptions]
+        owners = self.rng.sample(owners, len(owners) // 2)
+        combos = Combo.objects.bulk_create([Combo() for _ in owners])
+        self.combo_meals = {combo.cid: self.rng.sample(meals, 3) for combo in combos}
+        Combo.meals.through.objects.bulk_create([
+            Combo.meals.through(combo_id=cid, meals_id=meal.meal_id)
+            for cid, combo_meals in self.combo_meals.items()
+            for meal in combo_meals
+        ])
+        custom_meals = CustomMeal.objects.bulk_create([
+            CustomMeal(
+                user=user,
+                meals=combo,
+                type=self.rng.choice(self.types),
+                meal_category=self.rng.choice(self.categories),
+                no_of_servings=self.rng.randint(1, 4),
+                subscription_plan=self.subscriptions[user.id],
+                delivery_time_slot=self.rng.choice(self.slots),
+                delivery_date=timezone.localdate() + timedelta(days=self.rng.randint(1, 7)),
+                delivery_address=user.street_address,
+                created_at=self.past(),
+            )
+            for user, combo in zip(owners, combos)
+        ])
+        self.stdout.write(f"Custom meals: {len(custom_meals)}")
+        return custom_meals
+
+    def seed_carts(self, users, meals):
+        carts = Cart.objects.bulk_create([Cart(user=user) for user in users if self.rng.random() < 0.3])
+        CartItem.objects.bulk_create([
+            CartItem(cart=cart, meals=meal, quantity=self.rng.randint(1, 3))
+            for cart in carts
+            for meal in self.rng.sample(meals, self.rng.randint(1, 4))
+        ])
+        self.stdout.write(f"Carts: {len(carts)}")
+
+    def seed_orders(self, count, users, meals, custom_meals):
+        statuses = [status for status, _ in Order.STATUS_CHOICES]
+        weights = [5, 5, 5, 5, 80]
+        custom_by_user = {custom_meal.user_id: custom_meal for custom_meal in custom_meals}
+        combo_prices = {
+            custom_meal.combo_id: sum(meal.price for meal in self.combo_meals[custom_meal.meals_id]) * custom_meal.no_of_servings
+            for custom_meal in custom_meals
+        }
+
+        orders, items, combo_items = [], [], []
+        for _ in range(count):
+            user = self.rng.choice(users)
+            order = Order(
+                user=user,
+                created_at=self.past(),
+                status=self.rng.choices(statuses, weights)[0],
+                payment_method=user.payment_method,
+                delivery_address=user.street_address,
+            )
+            subtotal = Decimal("0")
+            for meal in self.rng.sample(meals, self.rng.randint(1, 3)):
+                quantity = self.rng.randint(1, 3)
+                items.append(OrderItem(
+                    order=order, meals=meal, meal_type=meal.type.type_name,
+                    meal_category=meal.meal_category.category, quantity=quantity,
+                ))
+                subtotal += meal.price * quantity
+            custom_meal = custom_by_user.get(user.id)
+            if custom_meal and self.rng.random() < 0.3:
+                price = combo_prices[custom_meal.combo_id]
+                combo_items.append(ComboOrderItem(
+                    order=order, combo=custom_meal,
+                    delivery_from_date=custom_meal.delivery_date,
+                    delivery_to_date=custom_meal.delivery_date + timedelta(days=6),
+                    delivery_time_slot=custom_meal.delivery_time_slot,
+                    price_snapshot=price,
+                ))
+                subtotal += price
+            order.subtotal = subtotal
+            order.tax = (subtotal * TAX_RATE).quantize(Decimal("0.01"))
+            order.delivery_charge = DELIVERY_CHARGE
+            order.total_price = order.subtotal + order.tax + order.delivery_charge
+            orders.append(order)
+
+        Order.objects.bulk_create(orders, batch_size=1000)
+        OrderItem.objects.bulk_create(items, batch_size=1000)
+        ComboOrderItem.objects.bulk_create(combo_items, batch_size=1000)
+        self.stdout.write(f"Orders: {len(orders)} ({len(items)} items, {len(combo_items)} combo items)")
+
+    def seed_conversations(self, users):
+        conversations = Conversation.objects.bulk_create([
+            Conversation(user=user, slug=f"{SLUG_PREFIX}chat-{user.id}", created_at=self.past())
+            for user in users if self.rng.random() < 0.4
+        ])
+        Message.objects.bulk_create([
+            Message(
+                conversation=conversation, sender_id=conversation.user_id,
+                message=f"Load test message {n}", is_read=self.rng.random() < 0.7, timestamp=self.past(),
+            )
+            for conversation in conversations
+            for n in range(self.rng.randint(1, 15))
+        ], batch_size=1000)
+        self.stdout.write(f"Conversations: {len(conversations)}")
+        return conversations
+
+    def seed_blogs(self, count, users):
+        blogs = Blog.objects.bulk_create([
+            Blog(
+                blog_title=f"Load Test Blog {i}",
+                slug=f"{SLUG_PREFIX}blog-{i}",
+                blog_description=" ".join(self.rng.choice(["khaja", "lunch", "office", "healthy", "meal", "spicy"]) for _ in range(200)),
+                user=self.rng.choice(users),
+                created_at=self.past(),
+            )
+            for i in range(count)
+        ])
+        comments = Comments.objects.bulk_create([
+            Comments(comment=f"Comment {n}", user=self.rng.choice(users), blog=blog, created_at=self.past())
+            for blog in blogs
+            for n in range(self.rng.randint(0, 10))
+        ], batch_size=1000)
+        reactions = []
+        for blog in blogs:
+            for user in self.rng.sample(users, min(len(users), self.rng.randint(0, 30))):
+                reactions.append(PostReaction(user=user, blog=blog, reaction=self.rng.choice(["like", "like", "dislike"])))
+        PostReaction.objects.bulk_create(reactions, batch_size=1000)
+        self.stdout.write(f"Blogs: {len(blogs)} ({len(comments)} comments, {len(reactions)} reactions)")
+
+    def write_manifest(self, path, users, conversations):
+        conversation_by_user = {conversation.user_id: str(conversation.cid) for conversation in conversations}
+        manifest = {
+            'password': PASSWORD,
+            'users': [
+                {
+                    'phone_number': user.phone_number,
+                    'subscribed': user.id in self.subscriptions,
+                    'conversation_id': conversation_by_user.get(user.id),
+                }
+                for user in users
+            ],
+            'delivery_slots': [slot.slot_id for slot in self.slots],
+            'types': [meal_type.slug for meal_type in self.types],
+            'categories': [category.slug for category in self.categories],
+        }
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        self.stdout.write(f"Manifest written to {path}")
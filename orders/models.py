@@ -1,5 +1,7 @@
 # orders/models.py
 from django.db import models
+from django.db.models import Q
+from django.core.serializers.json import DjangoJSONEncoder
 from khaja.models import Meals, Combo, CustomMeal, DeliveryTimeSlot
 from users.models import CustomUser
 from decimal import Decimal
@@ -33,6 +35,15 @@ class Order(models.Model):
     payment_method = models.CharField(max_length=255, choices=PAYMENT_METHOD)
     delivery_address = models.TextField()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-uuid'], name='order_user_created_idx'),
+            models.Index(fields=['-created_at', '-uuid'], name='order_created_idx'),
+            models.Index(fields=['user', 'status', '-created_at', '-uuid'], name='order_user_status_idx'),
+            models.Index(fields=['status', '-created_at', '-uuid'], name='order_status_created_idx'),
+            models.Index(fields=['-created_at', '-uuid'], condition=~Q(status='CANCELLED'), name='order_open_created_idx'),
+        ]
+
     def calculate_pricing(self):
         subtotal = sum(item.get_total_price() for item in self.combo_items.all())
         subtotal += sum(item.get_total_price() for item in self.order_items.all())
@@ -49,6 +60,15 @@ class Order(models.Model):
         self.total_price = total_price
         self.save()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.snapshot_rollup_state()
+        return instance
+
+    def snapshot_rollup_state(self):
+        self._rollup_state = (self.__dict__.get('status'), self.__dict__.get('total_price'))
+
     def __str__(self):
         return f"Order #{self.uuid} by {self.user.first_name if self.user.user_type == "INDIVIDUALS" else self.user.organization_name}"
 
@@ -96,6 +116,9 @@ class ComboOrderItem(models.Model):
     
     class Meta:
         ordering = ['delivery_from_date']
+        indexes = [
+            models.Index(fields=['delivery_from_date', 'uuid'], name='combo_item_delivery_idx'),
+        ]
 
 
 class Cart(models.Model):
@@ -135,6 +158,9 @@ class CartItem(models.Model):
 
     class Meta:
         ordering = ['-added_at']
+        indexes = [
+            models.Index(fields=['cart', '-added_at', '-id'], name='cart_item_added_idx'),
+        ]
 
     def get_price_per_item(self):
         if self.custom_meal:
@@ -153,3 +179,68 @@ class CartItem(models.Model):
             return f"{self.meals.name} x {self.quantity}"
         return f"Empty cart item"
 
+
+
+class ArchivedOrder(models.Model):
+    uuid = models.UUIDField(primary_key=True, editable=False)
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='archived_orders')
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    subtotal = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    tax = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    delivery_charge = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    total_price = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    payment_method = models.CharField(max_length=255, choices=Order.PAYMENT_METHOD)
+    delivery_address = models.TextField()
+    order_items = models.JSONField(default=list, encoder=DjangoJSONEncoder)
+    combo_items = models.JSONField(default=list, encoder=DjangoJSONEncoder)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-uuid'], name='archived_order_user_idx'),
+            models.Index(fields=['status', '-created_at'], name='archived_order_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"Archived order #{self.uuid}"
+
+
+class DailyOrderRollup(models.Model):
+    day = models.DateField()
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    orders = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        ordering = ['day', 'status']
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'status'], name='unique_daily_order_rollup')
+        ]
+
+
+class DailySlotRollup(models.Model):
+    day = models.DateField()
+    slot = models.ForeignKey(DeliveryTimeSlot, on_delete=models.CASCADE)
+    items = models.IntegerField(default=0)
+    quantity = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ['day', 'slot']
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'slot'], name='unique_daily_slot_rollup')
+        ]
+
+
+class DailyMealRollup(models.Model):
+    day = models.DateField()
+    meal = models.ForeignKey(Meals, on_delete=models.CASCADE)
+    items = models.IntegerField(default=0)
+    quantity = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ['day', 'meal']
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'meal'], name='unique_daily_meal_rollup')
+        ]
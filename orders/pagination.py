@@ -1,13 +1,16 @@
-from rest_framework.pagination import CursorPagination
+from officekhaja.pagination import KeysetPagination
 
 
-class MenuInfiniteScrollPagination(CursorPagination):
-    page_size = 10  
-    ordering =  ('added_at') 
-    cursor_query_param = 'cursor'
+class CartItemPagination(KeysetPagination):
+    page_size = 10
+    ordering = ('-added_at', '-pk')
 
-class MealsPagination(CursorPagination):
-    page_size = 10  
-    ordering = ('name')
-    cursor_query_param = 'cursor'
 
+class OrderPagination(KeysetPagination):
+    page_size = 10
+    ordering = ('-created_at', '-pk')
+
+
+class ComboOrderItemPagination(KeysetPagination):
+    page_size = 20
+    ordering = ('delivery_from_date', 'pk')
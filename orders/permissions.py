@@ -1,10 +1,11 @@
 from rest_framework import permissions
 from rest_framework.exceptions import PermissionDenied
+from users.subscription import has_active_subscription
 
 class IsSubscribedUser(permissions.BasePermission):
     def has_permission(self, request, view):
         if request.user and request.user.is_authenticated:
-            if request.user.status:
+            if has_active_subscription(request.user):
                 return True
             else:
                 raise PermissionDenied(detail="Your subscription plan is not renewed or you are not subscribed")
@@ -0,0 +1,91 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from .models import OrderItem, ComboOrderItem, DailyOrderRollup, DailySlotRollup, DailyMealRollup
+import logging
+
+logger = logging.getLogger(__name__)
+
+CANCELLED = "CANCELLED"
+
+suspended = ContextVar('rollups_suspended', default=False)
+
+
+@contextmanager
+def suspend():
+    token = suspended.set(True)
+    try:
+        yield
+    finally:
+        suspended.reset(token)
+
+
+def order_day(order):
+    return timezone.localdate(order.created_at)
+
+
+def bump(model, lookup, **deltas):
+    changes = {field: F(field) + value for field, value in deltas.items()}
+    if model.objects.filter(**lookup).update(**changes):
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(**lookup, **deltas)
+    except IntegrityError:
+        model.objects.filter(**lookup).update(**changes)
+
+
+def bump_meal(day, meal_id, quantity, sign):
+    bump(DailyMealRollup, {'day': day, 'meal_id': meal_id}, items=sign, quantity=sign * quantity)
+
+
+def bump_slot(day, slot_id, quantity, sign):
+    bump(DailySlotRollup, {'day': day, 'slot_id': slot_id}, items=sign, quantity=sign * quantity)
+
+
+def apply_items(order, sign):
+    day = order_day(order)
+    meals = OrderItem.objects.filter(order=order, meals__isnull=False).values_list('meals_id', 'quantity')
+    for meal_id, quantity in meals:
+        bump_meal(day, meal_id, quantity, sign)
+    slots = ComboOrderItem.objects.filter(order=order).values_list('delivery_time_slot_id', 'quantity')
+    for slot_id, quantity in slots:
+        bump_slot(day, slot_id, quantity, sign)
+
+
+def order_saved(order, created):
+    if not created and not hasattr(order, '_rollup_state'):
+        logger.warning(f"Order {order.pk} saved without a loaded rollup state; run backfill_rollups to reconcile")
+        return
+
+    day = order_day(order)
+    old_status, old_total = (None, 0) if created else order._rollup_state
+    new_status, new_total = order.status, order.total_price or 0
+
+    if old_status == new_status:
+        if old_total != new_total:
+            bump(DailyOrderRollup, {'day': day, 'status': new_status}, revenue=new_total - (old_total or 0))
+    else:
+        if old_status is not None:
+            bump(DailyOrderRollup, {'day': day, 'status': old_status}, orders=-1, revenue=-(old_total or 0))
+        bump(DailyOrderRollup, {'day': day, 'status': new_status}, orders=1, revenue=new_total)
+        if old_status is not None and CANCELLED in (old_status, new_status):
+            apply_items(order, -1 if new_status == CANCELLED else 1)
+
+    order.snapshot_rollup_state()
+
+
+def order_deleted(order):
+    bump(DailyOrderRollup, {'day': order_day(order), 'status': order.status}, orders=-1, revenue=-(order.total_price or 0))
+
+
+def item_changed(item, sign):
+    order = item.order
+    if order.status == CANCELLED:
+        return
+    if isinstance(item, ComboOrderItem):
+        bump_slot(order_day(order), item.delivery_time_slot_id, item.quantity, sign)
+    elif item.meals_id:
+        bump_meal(order_day(order), item.meals_id, item.quantity, sign)
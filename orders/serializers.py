@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from orders.models import Order, OrderItem, ComboOrderItem, Cart, CartItem
+from orders.models import Order, ArchivedOrder, OrderItem, ComboOrderItem, Cart, CartItem
 from khaja.models import CustomMeal, Meals
 from khaja.serializers import CustomMealSerializer, MealSerializer, CustomMealListSerializer, MealListSerializer
 from django.utils import timezone
@@ -43,10 +43,31 @@ class ComboOrderItemSerializer(serializers.ModelSerializer):
         ]
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSummarySerializer(serializers.ModelSerializer):
+    user_name = serializers.SerializerMethodField()
+    item_count = serializers.IntegerField(read_only=True)
+    combo_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Order
+        fields = [
+            'uuid', 'user', 'user_name', 'created_at', 'updated_at',
+            'total_price', 'status', 'payment_method',
+            'item_count', 'combo_count'
+        ]
+        read_only_fields = fields
+
+    def get_user_name(self, obj):
+        if obj.user.user_type == "ORGANIZATIONS":
+            return obj.user.organization_name
+        return f"{obj.user.first_name} {obj.user.last_name}"
+
+
+class OrderSerializer(OrderSummarySerializer):
     order_items = OrderItemSerializer(many=True, read_only=True)
     combo_items = ComboOrderItemSerializer(many=True, read_only=True)
-    user_name = serializers.SerializerMethodField()
+    item_count = None
+    combo_count = None
 
     class Meta:
         model = Order
@@ -60,11 +81,18 @@ class OrderSerializer(serializers.ModelSerializer):
             'id', 'user', 'created_at', 'updated_at',
             'subtotal', 'tax', 'delivery_charge', 'total_price'
         ]
-    
-    def get_user_name(self, obj):
-        if obj.user.user_type == "ORGANIZATIONS":
-            return obj.user.organization_name
-        return f"{obj.user.first_name} {obj.user.last_name}"
+
+
+class ArchivedOrderSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ArchivedOrder
+        fields = [
+            'uuid', 'user', 'created_at', 'updated_at', 'archived_at',
+            'subtotal', 'tax', 'delivery_charge', 'total_price',
+            'status', 'payment_method', 'delivery_address',
+            'order_items', 'combo_items'
+        ]
+        read_only_fields = fields
     
 
 class CartItemSerializer(serializers.ModelSerializer):
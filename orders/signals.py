@@ -1,10 +1,44 @@
 from notifications.models import Notification
-from .models import Order
+from .models import Order, OrderItem, ComboOrderItem
 from users.models import CustomUser
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
+from .statistics import schedule_refresh
+from . import rollups
+
+@receiver(post_save, sender=Order)
+def update_order_rollups(sender, instance, created, **kwargs):
+    rollups.order_saved(instance, created)
+
+
+@receiver(post_delete, sender=Order)
+def remove_order_rollups(sender, instance, **kwargs):
+    if rollups.suspended.get():
+        return
+    rollups.order_deleted(instance)
+
+
+@receiver(post_save, sender=OrderItem)
+@receiver(post_save, sender=ComboOrderItem)
+def add_item_rollups(sender, instance, created, **kwargs):
+    if created:
+        rollups.item_changed(instance, 1)
+
+
+@receiver(post_delete, sender=OrderItem)
+@receiver(post_delete, sender=ComboOrderItem)
+def remove_item_rollups(sender, instance, **kwargs):
+    if rollups.suspended.get():
+        return
+    rollups.item_changed(instance, -1)
+
+
+@receiver(post_save, sender=Order)
+def refresh_order_statistics(sender, instance, **kwargs):
+    schedule_refresh()
+
 
 @receiver(post_save, sender=Order)
 def OrderStatusChangedNotification(sender, instance, created, **kwargs):
@@ -11,16 +11,17 @@ from orders.permissions import IsStaff
 from orders.models import Order, ComboOrderItem
 from khaja.models import Meals
 from users.models import CustomUser
-from orders.serializers import OrderSerializer, ComboOrderItemSerializer
+from orders.serializers import OrderSerializer, OrderSummarySerializer, ComboOrderItemSerializer
 from khaja.serializers import MealSerializer
-from khaja.pagination import MenuInfiniteScrollPagination
+from orders.pagination import OrderPagination, ComboOrderItemPagination
+from orders.loaders import order_summary_queryset, order_detail_queryset, order_context
 
 
 class StaffOrderListView(APIView):
     permission_classes = [IsAuthenticated, IsStaff]
 
     def get(self, request):
-        orders = Order.objects.exclude(status='CANCELLED').order_by('-created_at')
+        orders = order_summary_queryset(Order.objects.exclude(status='CANCELLED'))
         
         status_filter = request.query_params.get('status')
         today = request.query_params.get('today')
@@ -31,9 +32,9 @@ class StaffOrderListView(APIView):
         if today and today.lower() == 'true':
             orders = orders.filter(created_at__date=timezone.now().date())
         
-        paginator = MenuInfiniteScrollPagination()
+        paginator = OrderPagination()
         queryset = paginator.paginate_queryset(orders, request)
-        serializer = OrderSerializer(queryset, many=True)
+        serializer = OrderSummarySerializer(queryset, many=True)
         return paginator.get_paginated_response(serializer.data)
 
 
@@ -42,10 +43,10 @@ class StaffOrderDetailView(APIView):
 
     def get(self, request, order_id):
         try:
-            order = get_object_or_404(Order, id=order_id)
+            order = get_object_or_404(order_detail_queryset(), pk=order_id)
         except Http404:
             return Response(f"Order with id #{order_id} not found.", status=status.HTTP_404_NOT_FOUND)
-        serializer = OrderSerializer(order)
+        serializer = OrderSerializer(order, context=order_context([order]))
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def patch(self, request, order_id):
@@ -137,7 +138,7 @@ class StaffComboOrderItemListView(APIView):
     permission_classes = [IsAuthenticated, IsStaff]
 
     def get(self, request):
-        combo_items = ComboOrderItem.objects.all().order_by('delivery_from_date')
+        combo_items = ComboOrderItem.objects.all()
         
         date_from = request.query_params.get('date_from')
         date_to = request.query_params.get('date_to')
@@ -157,8 +158,10 @@ class StaffComboOrderItemListView(APIView):
         if subscription_plan:
             combo_items = combo_items.filter(subscription_plan=subscription_plan.upper())
         
-        serializer = ComboOrderItemSerializer(combo_items, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        paginator = ComboOrderItemPagination()
+        queryset = paginator.paginate_queryset(combo_items, request)
+        serializer = ComboOrderItemSerializer(queryset, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class StaffComboOrderItemDetailView(APIView):
@@ -308,15 +311,15 @@ class StaffDeliveryScheduleView(APIView):
             order__status__in=['PENDING', 'PROCESSING', 'DELIVERING']
         ).select_related('order', 'combo', 'order__user')
         
-        regular_orders = Order.objects.filter(
+        regular_orders = order_detail_queryset(Order.objects.filter(
             created_at__date=today,
             status__in=['PENDING', 'PROCESSING', 'DELIVERING']
-        ).prefetch_related('order_items', 'order_items__meals')
+        ))
         
         schedule = {
             'date': today.strftime('%Y-%m-%d'),
             'combo_deliveries': ComboOrderItemSerializer(combo_deliveries, many=True).data,
-            'regular_orders': OrderSerializer(regular_orders, many=True).data,
+            'regular_orders': OrderSerializer(regular_orders, many=True, context=order_context(regular_orders)).data,
             'total_combo_deliveries': combo_deliveries.count(),
             'total_regular_orders': regular_orders.count()
         }
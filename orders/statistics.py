@@ -0,0 +1,130 @@
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Sum, Q
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+from khaja.models import Meals, CustomMeal
+from users.models import CustomUser, UserSubscription
+from .models import Order, ArchivedOrder, DailyOrderRollup
+
+STATISTICS_KEY = "admin:statistics"
+REFRESH_LOCK_KEY = "admin:statistics:refresh"
+STATISTICS_TTL = 60 * 10
+REFRESH_DEBOUNCE = 30
+DAILY_SERIES_DAYS = 30
+HOURLY_SERIES_WINDOW = timedelta(hours=48)
+
+
+def _count(**filters):
+    return Count('pk', filter=Q(**filters))
+
+
+def compute_statistics():
+    users = CustomUser.objects.aggregate(
+        total=Count('pk'),
+        active=_count(is_active=True),
+        subscribed=_count(status=True),
+    )
+
+    order_totals = dict(
+        total=Count('pk'),
+        **{status.lower(): _count(status=status) for status, _ in Order.STATUS_CHOICES},
+        revenue=Sum('total_price', filter=Q(status='DELIVERED')),
+    )
+    orders = Order.objects.aggregate(**order_totals)
+    archived = ArchivedOrder.objects.aggregate(**order_totals)
+    orders = {key: (orders[key] or 0) + (archived[key] or 0) for key in orders}
+    revenue = orders.pop('revenue')
+
+    meals = Meals.objects.aggregate(
+        total=Count('pk'),
+        veg=_count(type__slug='veg'),
+        non_veg=_count(type__slug='non-veg'),
+    )
+    custom_meals = CustomMeal.objects.aggregate(
+        total=Count('pk'),
+        active=_count(is_active=True),
+    )
+    subscriptions = UserSubscription.objects.aggregate(
+        active=_count(is_active=True),
+        expired=_count(is_active=False),
+    )
+
+    return {
+        'users': users,
+        'orders': orders,
+        'revenue': {
+            'total': str(revenue),
+        },
+        'meals': meals,
+        'custom_meals': custom_meals,
+        'subscriptions': subscriptions,
+    }
+
+
+def compute_daily_series():
+    since = timezone.localdate() - timedelta(days=DAILY_SERIES_DAYS - 1)
+    rows = (
+        DailyOrderRollup.objects.filter(day__gte=since)
+        .values('day')
+        .annotate(
+            total_orders=Sum('orders'),
+            delivered_revenue=Sum('revenue', filter=Q(status='DELIVERED')),
+        )
+        .order_by('day')
+    )
+    return [
+        {
+            'bucket': row['day'].isoformat(),
+            'orders': row['total_orders'],
+            'revenue': str(row['delivered_revenue'] or 0),
+        }
+        for row in rows
+    ]
+
+
+def compute_hourly_series():
+    rows = (
+        Order.objects.filter(created_at__gte=timezone.now() - HOURLY_SERIES_WINDOW)
+        .annotate(bucket=TruncHour('created_at'))
+        .values('bucket')
+        .annotate(
+            orders=Count('pk'),
+            revenue=Sum('total_price', filter=Q(status='DELIVERED')),
+        )
+        .order_by('bucket')
+    )
+    return [
+        {
+            'bucket': row['bucket'].isoformat(),
+            'orders': row['orders'],
+            'revenue': str(row['revenue'] or 0),
+        }
+        for row in rows
+    ]
+
+
+def refresh_statistics():
+    statistics = compute_statistics()
+    statistics['series'] = {
+        'daily': compute_daily_series(),
+        'hourly': compute_hourly_series(),
+    }
+    statistics['generated_at'] = timezone.now().isoformat()
+    cache.set(STATISTICS_KEY, statistics, timeout=STATISTICS_TTL)
+    return statistics
+
+
+def get_statistics():
+    statistics = cache.get(STATISTICS_KEY)
+    if statistics is None:
+        statistics = refresh_statistics()
+    return statistics
+
+
+def schedule_refresh():
+    if not cache.add(REFRESH_LOCK_KEY, True, timeout=REFRESH_DEBOUNCE):
+        return
+    from .tasks import refresh_admin_statistics
+    transaction.on_commit(lambda: refresh_admin_statistics.apply_async(countdown=REFRESH_DEBOUNCE))
@@ -0,0 +1,37 @@
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+from datetime import timedelta
+from .statistics import refresh_statistics
+from .archive import archive_batch
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def refresh_admin_statistics():
+    try:
+        statistics = refresh_statistics()
+        return statistics['orders']['total']
+    except Exception as e:
+        logger.error(f"Error in refresh_admin_statistics: {e}", exc_info=True)
+        return 0
+
+
+@shared_task
+def archive_orders():
+    try:
+        cutoff = timezone.now() - timedelta(days=settings.ORDER_ARCHIVE_AFTER_DAYS)
+        batch_size = settings.ORDER_ARCHIVE_BATCH_SIZE
+        archived = 0
+        while True:
+            moved = archive_batch(cutoff, batch_size)
+            archived += moved
+            if moved < batch_size:
+                break
+        logger.info(f"Archived {archived} orders created before {cutoff}")
+        return archived
+    except Exception as e:
+        logger.error(f"Error in archive_orders: {e}", exc_info=True)
+        return 0
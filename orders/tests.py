@@ -1,3 +1,149 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+from unittest import skipUnless
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+from officekhaja.pagination import KeysetPagination
+from officekhaja.replicas import replica_configured
+from officekhaja.testing import QueryBudgetTestCase
+from users.models import CustomUser
+from .admin_views import AdminOrderRollupView, AdminSlotRollupView, AdminMealRollupView
+from .loaders import order_summary_queryset
+from .models import Order, Cart
+from .pagination import OrderPagination
 
-# Create your tests here.
+
+@override_settings(REPLICA_READS_ENABLED=False)
+class RollupPermissionTests(TestCase):
+    views = [AdminOrderRollupView, AdminSlotRollupView, AdminMealRollupView]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = CustomUser.objects.create_user(
+            phone_number='9800000001', password='x', email='customer@example.com'
+        )
+        cls.staff = CustomUser.objects.create_user(
+            phone_number='9800000002', password='x', email='staff@example.com', is_staff=True
+        )
+
+    def get(self, view, user):
+        request = APIRequestFactory().get('/rollups/')
+        force_authenticate(request, user=user)
+        return view.as_view()(request)
+
+    def test_customer_cannot_read_rollups(self):
+        for view in self.views:
+            with self.subTest(view=view.__name__):
+                self.assertEqual(self.get(view, self.customer).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_staff_can_read_rollups(self):
+        for view in self.views:
+            with self.subTest(view=view.__name__):
+                self.assertEqual(self.get(view, self.staff).status_code, status.HTTP_200_OK)
+
+
+@skipUnless(replica_configured(), "No replica database configured; set DB_REPLICA_HOST")
+class ReplicaRoutingTests(TransactionTestCase):
+    # The replica is a test mirror of default; rows must be committed for its connection to see them.
+    databases = '__all__'
+
+    def test_writer_is_pinned_to_primary(self):
+        user = CustomUser.objects.create_user(
+            phone_number='9800000003', password='x', email='writer@example.com'
+        )
+        call_command('check_replica_routing', email=user.email, stdout=StringIO())
+
+
+class OrderQueryBudgetTests(QueryBudgetTestCase):
+    def test_order_list(self):
+        order = Order.objects.filter(user__user_subscription__is_active=True).first()
+        self.client.force_authenticate(order.user)
+        self.assertWithinQueryBudget('orders:my-orders')
+
+    def test_order_detail(self):
+        order = Order.objects.filter(user__user_subscription__is_active=True, order_items__isnull=False).first()
+        self.client.force_authenticate(order.user)
+        self.assertWithinQueryBudget('orders:order-detail', pk=order.pk)
+
+    def test_cart(self):
+        cart = Cart.objects.filter(user__user_subscription__is_active=True, cart_items__isnull=False).first()
+        self.client.force_authenticate(cart.user)
+        self.assertWithinQueryBudget('orders:my-cart')
+
+
+class StatusPagination(KeysetPagination):
+    page_size = 4
+    ordering = ('status', '-created_at', 'pk')
+
+
+class ItemCountPagination(KeysetPagination):
+    page_size = 6
+    ordering = ('-item_count', '-pk')
+
+
+@override_settings(REPLICA_READS_ENABLED=False)
+class KeysetPaginationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            phone_number='9800000004', password='x', email='pager@example.com', is_staff=True
+        )
+        statuses = [choice for choice, _ in Order.STATUS_CHOICES]
+        Order.objects.bulk_create([
+            Order(user=cls.user, payment_method='CARD', delivery_address='Office', status=statuses[index % len(statuses)])
+            for index in range(25)
+        ])
+        # Most rows share one created_at so page boundaries fall inside the tie.
+        now = timezone.now()
+        pks = list(Order.objects.values_list('pk', flat=True))
+        Order.objects.update(created_at=now)
+        Order.objects.filter(pk__in=pks[:3]).update(created_at=now + timedelta(minutes=1))
+        Order.objects.filter(pk__in=pks[-3:]).update(created_at=now - timedelta(minutes=1))
+
+    def page(self, paginator_class, queryset, url):
+        paginator = paginator_class()
+        rows = paginator.paginate_queryset(queryset, Request(APIRequestFactory().get(url)))
+        return paginator, [row.pk for row in rows]
+
+    def assertWalksWithoutGaps(self, paginator_class, queryset):
+        expected = list(queryset.order_by(*paginator_class.ordering).values_list('pk', flat=True))
+        self.assertGreater(len(expected), paginator_class.page_size * 2)
+
+        forward, url = [], '/orders/'
+        while url:
+            paginator, pks = self.page(paginator_class, queryset, url)
+            forward.append(pks)
+            url = paginator.get_next_link()
+        self.assertEqual([pk for pks in forward for pk in pks], expected)
+
+        backward, url = [], paginator.get_previous_link()
+        while url:
+            paginator, pks = self.page(paginator_class, queryset, url)
+            backward.insert(0, pks)
+            url = paginator.get_previous_link()
+        self.assertEqual(backward, forward[:-1])
+
+    def test_walks_ties_on_created_at(self):
+        self.assertWalksWithoutGaps(OrderPagination, order_summary_queryset(Order.objects.all()))
+
+    def test_walks_mixed_directions(self):
+        self.assertWalksWithoutGaps(StatusPagination, Order.objects.all())
+
+    def test_walks_annotation_key(self):
+        self.assertWalksWithoutGaps(ItemCountPagination, order_summary_queryset(Order.objects.all()))
+
+    def test_malformed_cursor_is_not_found(self):
+        for cursor in ['not-base64!', 'bm90IGpzb24=', 'eyJyIjogMH0=', 'eyJyIjowLCJwIjp7ImNyZWF0ZWRfYXQiOiJ4IiwicGsiOiJ5In19']:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(NotFound):
+                    self.page(OrderPagination, Order.objects.all(), f'/orders/?cursor={cursor}')
+
+        self.client.force_authenticate(self.user)
+        response = self.client.get(reverse('orders:my-orders'), {'cursor': 'not-base64!'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -1,4 +1,5 @@
 from rest_framework.views import APIView
+from officekhaja.replicas import ReplicaReadMixin
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -9,15 +10,17 @@ from django.http import Http404
 from datetime import timedelta, datetime
 from decimal import Decimal
 from khaja.models import Meals, CustomMeal
+from khaja.loaders import custom_meal_queryset
 from users.models import UserSubscription, CustomUser
-from .pagination import MenuInfiniteScrollPagination
+from .pagination import CartItemPagination, OrderPagination
+from .loaders import order_summary_queryset, order_detail_queryset, order_context
 from users.views import check_subscription
 from drf_spectacular.utils import extend_schema
-from orders.models import Order, Cart, CartItem, OrderItem, ComboOrderItem
+from orders.models import Order, ArchivedOrder, Cart, CartItem, OrderItem, ComboOrderItem
 from rest_framework.permissions import AllowAny
 from .permissions import IsStaff, IsSubscribedUser
 from .serializers import (
-    OrderSerializer, CartItemSerializer, CartItemDetialSerializer
+    OrderSerializer, OrderSummarySerializer, ArchivedOrderSerializer, CartItemSerializer, CartItemDetialSerializer
 )
 
 @extend_schema(
@@ -34,8 +37,10 @@ class CartListView(APIView):
 
     def get(self, request):
         cart, created = Cart.objects.get_or_create(user=request.user)
-        cart_items = cart.cart_items.all() 
-        paginator = MenuInfiniteScrollPagination()
+        cart_items = custom_meal_queryset(
+            cart.cart_items.select_related('meals__nutrition'), prefix='custom_meal__'
+        )
+        paginator = CartItemPagination()
         queryset = paginator.paginate_queryset(cart_items, request)
         serializer = CartItemSerializer(queryset, many=True)
         return paginator.get_paginated_response(serializer.data)
@@ -307,7 +312,7 @@ class OrderPreviewView(APIView):
     request=OrderSerializer,
     responses={200: OrderSerializer}
 )
-class OrderListView(APIView):
+class OrderListView(ReplicaReadMixin, APIView):
     def get_permissions(self):
         if self.request.method in ['GET']:
             permission_classes = [IsSubscribedUser]
@@ -317,18 +322,27 @@ class OrderListView(APIView):
 
     def get(self, request):
         status_filter = request.query_params.get('status', None)
-        orders = Order.objects.filter(user=request.user)
+        archived = request.query_params.get('archived', '').lower() == 'true'
+        if archived:
+            orders = ArchivedOrder.objects.filter(user=request.user)
+        else:
+            orders = order_summary_queryset(Order.objects.filter(user=request.user))
         
         if status_filter:
             orders = orders.filter(status=status_filter.upper())
-        serializer = OrderSerializer(orders, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        paginator = OrderPagination()
+        queryset = paginator.paginate_queryset(orders, request)
+        if archived:
+            serializer = ArchivedOrderSerializer(queryset, many=True)
+        else:
+            serializer = OrderSummarySerializer(queryset, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 @extend_schema(
     request=OrderSerializer,
     responses={200: OrderSerializer}
 )
-class OrderDetailView(APIView):
+class OrderDetailView(ReplicaReadMixin, APIView):
     def get_permissions(self):
         if self.request.method in ['GET']:
             permission_classes = [IsAuthenticated, IsSubscribedUser]
@@ -338,7 +352,7 @@ class OrderDetailView(APIView):
 
     
     def get_object(self, pk, user):
-        return get_object_or_404(Order, pk=pk, user=user)
+        return get_object_or_404(order_detail_queryset(), pk=pk, user=user)
 
 
     def get(self, request, pk):
@@ -346,7 +360,7 @@ class OrderDetailView(APIView):
             order = self.get_object(pk, request.user)
         except Http404:
             return Response({"error": "Order not found"}, status=status.HTTP_404_NOT_FOUND)
-        serializer = OrderSerializer(order)
+        serializer = OrderSerializer(order, context=order_context([order]))
         return Response(serializer.data, status=status.HTTP_200_OK)
     
     def patch(self, request, pk):
@@ -391,6 +405,8 @@ class OrderCancelView(APIView):
     responses={200: OrderSerializer}
 )
 class OrderCreateView(APIView):
+    throttle_scope = 'order_create'
+
     permission_classes = [IsSubscribedUser]
 
     def post(self, request):
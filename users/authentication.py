@@ -0,0 +1,75 @@
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from .models import CustomUser
+
+IDENTITY_TTL = 5 * 60
+IDENTITY_FIELDS = [
+    field.attname for field in CustomUser._meta.concrete_fields
+    if field.attname != 'password'
+]
+
+
+def identity_key(user_id):
+    return f"user:{user_id}:identity"
+
+
+def get_cached_user(user_id):
+    key = identity_key(user_id)
+    values = cache.get(key)
+    if values is None:
+        values = CustomUser.objects.filter(pk=user_id).values_list(*IDENTITY_FIELDS).first()
+        if values is None:
+            return None
+        cache.set(key, values, timeout=IDENTITY_TTL)
+    return CustomUser.from_db('default', IDENTITY_FIELDS, values)
+
+
+async def aget_cached_user(user_id):
+    key = identity_key(user_id)
+    values = await cache.aget(key)
+    if values is None:
+        values = await CustomUser.objects.filter(pk=user_id).values_list(*IDENTITY_FIELDS).afirst()
+        if values is None:
+            return None
+        await cache.aset(key, values, timeout=IDENTITY_TTL)
+    return CustomUser.from_db('default', IDENTITY_FIELDS, values)
+
+
+def invalidate_cached_user(*user_ids):
+    cache.delete_many([identity_key(user_id) for user_id in user_ids])
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def get_user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+    def check_user(self, user):
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
+
+    def get_user(self, validated_token):
+        return self.check_user(get_cached_user(self.get_user_id(validated_token)))
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        user = await aget_cached_user(self.get_user_id(validated_token))
+        return self.check_user(user), validated_token
@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, BCryptSHA256PasswordHasher
+
+ARGON2_PARAMS = getattr(settings, 'ARGON2_PARAMS', {})
+BCRYPT_ROUNDS = getattr(settings, 'BCRYPT_ROUNDS', BCryptSHA256PasswordHasher.rounds)
+
+
+class ConfigurableArgon2PasswordHasher(Argon2PasswordHasher):
+    time_cost = ARGON2_PARAMS.get('time_cost', Argon2PasswordHasher.time_cost)
+    memory_cost = ARGON2_PARAMS.get('memory_cost', Argon2PasswordHasher.memory_cost)
+    parallelism = ARGON2_PARAMS.get('parallelism', Argon2PasswordHasher.parallelism)
+
+
+class ConfigurableBCryptSHA256PasswordHasher(BCryptSHA256PasswordHasher):
+    rounds = BCRYPT_ROUNDS
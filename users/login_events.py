@@ -0,0 +1,65 @@
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    redis_instance = cache.client.get_client(write=True)
+except Exception as e:
+    logger.error(f"Redis connection error: {e}")
+    redis_instance = None
+
+LOGIN_EVENTS_KEY = "login_events"
+# Batch being flushed; it is only deleted once its rows have committed.
+LOGIN_EVENTS_PROCESSING_KEY = "login_events:processing"
+
+# Retries a batch left behind by a failed flush before claiming new entries.
+CLAIM_SCRIPT = """
+if redis.call('LLEN', KEYS[2]) == 0 then
+    for i = 1, tonumber(ARGV[1]) do
+        if not redis.call('LMOVE', KEYS[1], KEYS[2], 'LEFT', 'RIGHT') then
+            break
+        end
+    end
+end
+return redis.call('LRANGE', KEYS[2], 0, -1)
+"""
+
+claim = redis_instance.register_script(CLAIM_SCRIPT) if redis_instance else None
+
+
+def record_login(user_id, logged_in_at=None):
+    logged_in_at = logged_in_at or timezone.now()
+    entry = f"{user_id}|{logged_in_at.isoformat()}"
+    try:
+        if redis_instance:
+            redis_instance.rpush(LOGIN_EVENTS_KEY, entry)
+            return
+    except Exception as e:
+        logger.error(f"Error buffering login event: {e}")
+
+    from .tasks import save_login_events
+    save_login_events.delay([entry])
+
+
+def parse_events(entries):
+    events = []
+    for entry in entries:
+        if isinstance(entry, bytes):
+            entry = entry.decode()
+        user_id, _, logged_in_at = entry.partition("|")
+        events.append((int(user_id), parse_datetime(logged_in_at)))
+    return events
+
+
+def claim_login_events(limit):
+    if not claim:
+        return []
+    return parse_events(claim(keys=[LOGIN_EVENTS_KEY, LOGIN_EVENTS_PROCESSING_KEY], args=[limit]))
+
+
+def release_login_events():
+    if redis_instance:
+        redis_instance.delete(LOGIN_EVENTS_PROCESSING_KEY)
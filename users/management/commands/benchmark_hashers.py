@@ -0,0 +1,52 @@
+import statistics
+import time
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Measure password hashing throughput for a single worker at the configured cost"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--algorithm', default='default', help="Hasher algorithm, e.g. argon2, bcrypt_sha256, pbkdf2_sha256")
+        parser.add_argument('--samples', type=int, default=50)
+        parser.add_argument('--time-cost', type=int)
+        parser.add_argument('--memory-cost', type=int)
+        parser.add_argument('--parallelism', type=int)
+        parser.add_argument('--rounds', type=int)
+        parser.add_argument('--iterations', type=int)
+        parser.add_argument('--budget-ms', type=float, help="p99 verification budget to compare against")
+
+    def handle(self, *args, **options):
+        hasher = get_hasher(options['algorithm'])
+        for name in ['time_cost', 'memory_cost', 'parallelism', 'rounds', 'iterations']:
+            if options[name] is not None:
+                setattr(hasher, name, options[name])
+
+        password = "benchmark-password"
+        encoded = hasher.encode(password, hasher.salt())
+
+        timings = []
+        for _ in range(options['samples']):
+            start = time.perf_counter()
+            hasher.verify(password, encoded)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        timings.sort()
+        mean = statistics.mean(timings)
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        params = {
+            name: getattr(hasher, name)
+            for name in ['time_cost', 'memory_cost', 'parallelism', 'rounds', 'iterations']
+            if hasattr(hasher, name)
+        }
+
+        self.stdout.write(f"algorithm: {hasher.algorithm} {params}")
+        self.stdout.write(f"mean: {mean:.2f} ms  p50: {timings[len(timings) // 2]:.2f} ms  p99: {p99:.2f} ms")
+        self.stdout.write(f"hashes/sec per worker: {1000 / mean:.1f}")
+
+        if options['budget_ms'] is not None:
+            if p99 <= options['budget_ms']:
+                self.stdout.write(self.style.SUCCESS(f"p99 is within the {options['budget_ms']} ms budget"))
+            else:
+                self.stdout.write(self.style.WARNING(f"p99 exceeds the {options['budget_ms']} ms budget"))
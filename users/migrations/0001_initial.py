@@ -0,0 +1,136 @@
+# Generated by Django 5.2.9 on 2026-10-19 04:20
+
+import django.contrib.postgres.indexes
+import django.core.validators
+import django.db.models.deletion
+import django.db.models.functions.text
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        # The gin_trgm_ops indexes on CustomUser need pg_trgm.
+        TrigramExtension(),
+        migrations.CreateModel(
+            name='Subscription',
+            fields=[
+                ('sid', models.AutoField(primary_key=True, serialize=False)),
+                ('subscription', models.CharField(max_length=8)),
+                ('rate', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('duration_days', models.IntegerField(default=7, help_text='Duration in days')),
+            ],
+            options={
+                'verbose_name_plural': 'Subscriptions',
+            },
+        ),
+        migrations.CreateModel(
+            name='CustomUser',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('password', models.CharField(max_length=128, verbose_name='password')),
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
+                ('phone_number', models.CharField(max_length=13, unique=True, validators=[django.core.validators.RegexValidator(message='Enter a valid Nepal phone number.', regex='^(?:\\+977[- ]?)?(?:9[78]\\d{8}|1\\d{7})$')])),
+                ('first_name', models.CharField(blank=True, max_length=30, null=True)),
+                ('last_name', models.CharField(blank=True, max_length=30, null=True)),
+                ('organization_name', models.CharField(blank=True, max_length=50, null=True)),
+                ('email', models.EmailField(max_length=254, unique=True, validators=[django.core.validators.RegexValidator(message='Enter a valid email address.', regex='^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}$')])),
+                ('image', models.ImageField(blank=True, null=True, upload_to='profile/')),
+                ('user_type', models.CharField(choices=[('INDIVIDUAL', 'Individual'), ('ORGANIZATION', 'Organization')], default='INDIVIDUAL', max_length=20)),
+                ('no_of_peoples', models.IntegerField(default=1)),
+                ('payment_method', models.CharField(choices=[('ESEWA', 'E-Sewa'), ('KHALTI', 'Khalti'), ('CARD', 'Card')], default='ESEWA', max_length=255)),
+                ('street_address', models.CharField(blank=True, max_length=255, null=True)),
+                ('city', models.CharField(default='Kathmandu', max_length=20)),
+                ('status', models.BooleanField(default=False)),
+                ('meal_preferences', models.TextField(blank=True, null=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_staff', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('groups', models.ManyToManyField(blank=True, help_text='The groups this user belongs to. A user will get all permissions granted to each of their groups.', related_name='user_set', related_query_name='user', to='auth.group', verbose_name='groups')),
+                ('user_permissions', models.ManyToManyField(blank=True, help_text='Specific permissions for this user.', related_name='user_set', related_query_name='user', to='auth.permission', verbose_name='user permissions')),
+            ],
+            options={
+                'verbose_name': 'User',
+                'verbose_name_plural': 'Users',
+            },
+        ),
+        migrations.CreateModel(
+            name='LoginEvent',
+            fields=[
+                ('event_id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('logged_in_at', models.DateTimeField()),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='login_events', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Login Event',
+                'verbose_name_plural': 'Login Events',
+            },
+        ),
+        migrations.CreateModel(
+            name='UserSubscription',
+            fields=[
+                ('sub_id', models.AutoField(primary_key=True, serialize=False)),
+                ('activated_from', models.DateField(blank=True, null=True)),
+                ('expires_on', models.DateField(blank=True, null=True)),
+                ('is_active', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('plan', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='users.subscription')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='user_subscription', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'User Subscription',
+                'verbose_name_plural': 'User Subscriptions',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['-created_at', '-id'], name='user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['user_type', 'is_active', 'status', '-created_at'], name='user_directory_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(condition=models.Q(('is_active', False)), fields=['-created_at'], name='user_inactive_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('first_name'), name='gin_trgm_ops'), name='user_first_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('last_name'), name='gin_trgm_ops'), name='user_last_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('email'), name='gin_trgm_ops'), name='user_email_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('phone_number'), name='gin_trgm_ops'), name='user_phone_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('organization_name'), name='gin_trgm_ops'), name='user_org_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='loginevent',
+            index=models.Index(fields=['user', '-logged_in_at'], name='login_event_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usersubscription',
+            index=models.Index(fields=['-created_at', '-sub_id'], name='subscription_created_idx'),
+        ),
+    ]
@@ -1,5 +1,8 @@
 
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.core.validators import RegexValidator
 from datetime import timedelta, datetime
@@ -100,6 +103,16 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='user_created_idx'),
+            models.Index(fields=['user_type', 'is_active', 'status', '-created_at'], name='user_directory_idx'),
+            models.Index(fields=['-created_at'], condition=Q(is_active=False), name='user_inactive_idx'),
+            GinIndex(OpClass(Upper('first_name'), name='gin_trgm_ops'), name='user_first_name_trgm'),
+            GinIndex(OpClass(Upper('last_name'), name='gin_trgm_ops'), name='user_last_name_trgm'),
+            GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'), name='user_email_trgm'),
+            GinIndex(OpClass(Upper('phone_number'), name='gin_trgm_ops'), name='user_phone_trgm'),
+            GinIndex(OpClass(Upper('organization_name'), name='gin_trgm_ops'), name='user_org_trgm'),
+        ]
 
 class UserSubscription(models.Model):
     sub_id = models.AutoField(primary_key=True)
@@ -140,3 +153,22 @@ class UserSubscription(models.Model):
     class Meta:
         verbose_name = "User Subscription"
         verbose_name_plural = "User Subscriptions"
+        indexes = [
+            models.Index(fields=['-created_at', '-sub_id'], name='subscription_created_idx'),
+        ]
+
+
+class LoginEvent(models.Model):
+    event_id = models.BigAutoField(primary_key=True)
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='login_events')
+    logged_in_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.user_id} - {self.logged_in_at}"
+
+    class Meta:
+        verbose_name = "Login Event"
+        verbose_name_plural = "Login Events"
+        indexes = [
+            models.Index(fields=['user', '-logged_in_at'], name='login_event_user_idx'),
+        ]
@@ -0,0 +1,138 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from redis.exceptions import RedisError
+from rest_framework import status
+from rest_framework.exceptions import APIException, Throttled
+from rest_framework.throttling import BaseThrottle
+from officekhaja.ratelimit import consume
+import hashlib
+import hmac
+import logging
+import secrets
+
+logger = logging.getLogger(__name__)
+
+try:
+    redis_instance = cache.client.get_client(write=True)
+except Exception as e:
+    logger.error(f"Redis connection error: {e}")
+    redis_instance = None
+
+OTP_TTL = getattr(settings, 'OTP_TTL', 300)
+OTP_MAX_ATTEMPTS = getattr(settings, 'OTP_MAX_ATTEMPTS', 5)
+OTP_RATE_LIMITS = getattr(settings, 'OTP_RATE_LIMITS', {
+    'email': {'capacity': 3, 'per_seconds': 600},
+    'ip': {'capacity': 10, 'per_seconds': 600},
+})
+OTP_TYPES = ["register", "reset_password", "authenticate", "activate"]
+OTP_SUBJECTS = {
+    "register": "Registration Confirmation OTP",
+    "activate": "Account activation OTP",
+    "reset_password": "Reset Password OTP",
+}
+
+OTP_EXPIRED = -1
+OTP_LOCKED = -2
+
+VERIFY_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+local attempts = redis.call('HINCRBY', KEYS[1], 'attempts', 1)
+if attempts > tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1])
+    return -2
+end
+if redis.call('HGET', KEYS[1], 'code') ~= ARGV[1] then
+    return 0
+end
+local flow = redis.call('HMGET', KEYS[1], 'user_id', 'otp_type')
+redis.call('DEL', KEYS[1])
+return flow
+"""
+
+verify_script = redis_instance.register_script(VERIFY_SCRIPT) if redis_instance else None
+
+
+class OtpUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "OTP service is temporarily unavailable. Please try again later."
+    default_code = "otp_unavailable"
+
+
+def require_redis():
+    if not redis_instance:
+        raise OtpUnavailable()
+
+
+def otp_key(email):
+    return f"otp_flow:{email}"
+
+
+def hash_code(email, code):
+    return hmac.new(settings.SECRET_KEY.encode(), f"{email}:{code}".encode(), hashlib.sha256).hexdigest()
+
+
+def check_rate_limits(email, request=None):
+    idents = [('email', email)]
+    if request is not None:
+        idents.append(('ip', BaseThrottle().get_ident(request)))
+    for scope, ident in idents:
+        policy = OTP_RATE_LIMITS[scope]
+        allowed, retry_after = consume(f"otp:{scope}", ident, policy['capacity'], policy['per_seconds'])
+        if not allowed:
+            raise Throttled(wait=retry_after, detail="Too many OTP requests. Please try again later.")
+
+
+def issue_otp(email, user_id, otp_type, request=None):
+    require_redis()
+    check_rate_limits(email, request)
+
+    code = f"{secrets.randbelow(1000000):06d}"
+    key = otp_key(email)
+    pipe = redis_instance.pipeline()
+    pipe.delete(key)
+    pipe.hset(key, mapping={
+        "user_id": user_id,
+        "otp_type": otp_type,
+        "code": hash_code(email, code),
+        "attempts": 0,
+        "created_at": timezone.now().isoformat(),
+    })
+    pipe.expire(key, OTP_TTL)
+    try:
+        pipe.execute()
+    except RedisError as e:
+        logger.error(f"Error storing OTP for {email}: {e}")
+        raise OtpUnavailable()
+
+    from .tasks import send_otp_email
+    subject = OTP_SUBJECTS.get(otp_type, "Your OTP Code")
+    transaction.on_commit(lambda: send_otp_email.delay(email, subject, code))
+
+
+def get_otp_flow(email):
+    require_redis()
+    try:
+        user_id, otp_type = redis_instance.hmget(otp_key(email), "user_id", "otp_type")
+    except RedisError as e:
+        logger.error(f"Error reading OTP flow for {email}: {e}")
+        raise OtpUnavailable()
+    if user_id is None:
+        return None
+    return {"user_id": int(user_id), "otp_type": otp_type.decode()}
+
+
+def verify_otp(email, code):
+    require_redis()
+    try:
+        result = verify_script(keys=[otp_key(email)], args=[hash_code(email, code), OTP_MAX_ATTEMPTS])
+    except RedisError as e:
+        logger.error(f"Error verifying OTP for {email}: {e}")
+        raise OtpUnavailable()
+    if isinstance(result, list):
+        user_id, otp_type = result
+        return {"user_id": int(user_id), "otp_type": otp_type.decode()}
+    return result
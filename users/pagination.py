@@ -0,0 +1,6 @@
+from officekhaja.pagination import KeysetPagination
+
+
+class UserDirectoryPagination(KeysetPagination):
+    page_size = 20
+    ordering = ('-created_at', '-id')
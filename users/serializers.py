@@ -1,12 +1,10 @@
 from rest_framework import serializers
-from django.contrib.auth import authenticate
-from django.core.mail import send_mail
 from django.utils.timezone import now, timedelta
 from .models import CustomUser, Subscription, UserSubscription
+from .otp import issue_otp, verify_otp, OTP_EXPIRED, OTP_LOCKED
 from django.conf import settings
-import random, secrets
+import secrets
 from django.utils import timezone
-from django.core.cache import cache
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -57,45 +55,17 @@ class UserLoginSerializer(serializers.Serializer):
         except CustomUser.DoesNotExist:
             raise serializers.ValidationError('Invalid phone number or password')
         
+        if not user.check_password(password):
+            raise serializers.ValidationError('Invalid phone number or password')
+
         if not user.is_active:
-            if not user.check_password(password):
-                raise serializers.ValidationError('Invalid phone number or password')
-            
-            otp = str(random.randint(100000, 999999))
-            flow_key = user.email
             request = self.context.get('request')
-            request.session['email'] = flow_key
-            
-            cache.set(
-                f"otp_flow:{flow_key}",
-                {
-                    "user_id": user.id,
-                    "otp_type": "activate",
-                    "otp": otp,
-                    "created_at": timezone.now().isoformat()
-                },
-                timeout=300
-            )
-            
-            send_mail(
-                'Account activation OTP',
-                f'Your OTP code is {otp}',
-                settings.DEFAULT_FROM_EMAIL,
-                [user.email],
-                fail_silently=False
-            )
+            issue_otp(user.email, user.id, "activate", request)
+            request.session['email'] = user.email
             
             return False 
-        
-        authenticated_user = authenticate(phone_number=phone_number, password=password)
-        
-        if not authenticated_user:
-            raise serializers.ValidationError('Invalid phone number or password')
-        
-        authenticated_user.last_login = timezone.now()
-        authenticated_user.save()
-        
-        return authenticated_user
+
+        return user
 
 
 class SubscriptionSerializer(serializers.ModelSerializer):
@@ -131,6 +101,16 @@ class UserSubscriptionSerializer(serializers.ModelSerializer):
         return True
 
 
+class UserListSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CustomUser
+        fields = [
+            'id', 'phone_number', 'email', 'first_name', 'last_name', 'organization_name',
+            'user_type', 'status', 'is_active', 'created_at'
+        ]
+        read_only_fields = fields
+
+
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = CustomUser
@@ -198,20 +178,20 @@ class OTPSerializer(serializers.Serializer):
         if not otp_input:
             raise serializers.ValidationError("OTP is required")
 
-        cache_key = f"otp_flow:{email}"
-        cached_data = cache.get(cache_key)
+        result = verify_otp(email, otp_input)
 
-        if not cached_data:
+        if result == OTP_EXPIRED:
             raise serializers.ValidationError("OTP expired or not found")
 
-        if cached_data['otp'] != otp_input:
+        if result == OTP_LOCKED:
+            raise serializers.ValidationError("Too many invalid attempts. Please request a new OTP.")
+
+        if not result:
             raise serializers.ValidationError("Invalid OTP")
         
-        cache.delete(cache_key)
-        
         data['verified'] = True
-        data['user_id'] = cached_data['user_id']
-        data['otp_type'] = cached_data['otp_type']
+        data['user_id'] = result['user_id']
+        data['otp_type'] = result['otp_type']
         
         return data
 
@@ -225,31 +205,11 @@ class ResetPasswordRequestSerializer(serializers.Serializer):
         except CustomUser.DoesNotExist:
             raise serializers.ValidationError("User with this email does not exist.")
         
-        otp = str(random.randint(100000, 999999))
-
         request = self.context.get('request')
         flow_key = value
+        issue_otp(value, user.id, "reset_password", request)
         request.session['email'] = value
         
-        cache.set(
-            f"otp_flow:{flow_key}",
-            {
-                "user_id": user.id,
-                "otp_type": "reset_password",
-                "otp": otp,
-                "created_at": timezone.now().isoformat()
-            },
-            timeout=300
-        )
-
-        send_mail(
-            'Reset Password OTP',
-            f'Your OTP code is {otp}',
-            settings.DEFAULT_FROM_EMAIL,
-            [user.email],
-            fail_silently=False
-        )
-        
         self.user_id = user.id
         self.flow_key = flow_key
         return value
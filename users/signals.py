@@ -1,20 +1,28 @@
 from notifications.models import Notification
 from .models import CustomUser, UserSubscription
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from django.db import transaction
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
+from .subscription import invalidate_entitlement
+from .authentication import invalidate_cached_user
 import logging
 
 logger = logging.getLogger(__name__)
 
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_user_identity(sender, instance, **kwargs):
+    transaction.on_commit(lambda: invalidate_cached_user(instance.id))
+
+
 @receiver(post_save, sender=CustomUser)
 def user_registration_notification(sender, instance, created, **kwargs):
+    if not created:
+        return
     try:
-        if created:
-            message = f"Welcome to Office Khaja {instance.email}. Thanks for Registration. Hope you will enjoy the services."
-        else:
-            message = f"Dear {instance.first_name} {instance.last_name}, you have logged in at {instance.last_login}."
+        message = f"Welcome to Office Khaja {instance.email}. Thanks for Registration. Hope you will enjoy the services."
 
         Notification.objects.create(
             user=instance,
@@ -35,6 +43,12 @@ def user_registration_notification(sender, instance, created, **kwargs):
 
 
 
+@receiver(post_save, sender=UserSubscription)
+@receiver(post_delete, sender=UserSubscription)
+def invalidate_subscription_entitlement(sender, instance, **kwargs):
+    transaction.on_commit(lambda: invalidate_entitlement(instance.user_id))
+
+
 @receiver(post_save, sender=UserSubscription)
 def UserSubscriptionNotification(sender, instance, created, **kwargs):
     try:
@@ -0,0 +1,34 @@
+from django.core.cache import cache
+from django.utils import timezone
+from .models import UserSubscription
+
+ENTITLEMENT_TTL = 60 * 60
+
+
+def entitlement_key(user_id):
+    return f"user:{user_id}:entitlement"
+
+
+def get_entitlement(user_id):
+    key = entitlement_key(user_id)
+    entitlement = cache.get(key)
+    if entitlement is None:
+        entitlement = UserSubscription.objects.filter(user_id=user_id).values('is_active', 'expires_on').first()
+        if entitlement is None:
+            entitlement = {'is_active': False, 'expires_on': None}
+        cache.set(key, entitlement, timeout=ENTITLEMENT_TTL)
+    return entitlement
+
+
+def has_active_subscription(user):
+    if user.is_staff:
+        return True
+    entitlement = get_entitlement(user.id)
+    expires_on = entitlement['expires_on']
+    if not entitlement['is_active'] or expires_on is None:
+        return False
+    return expires_on >= timezone.now().date()
+
+
+def invalidate_entitlement(*user_ids):
+    cache.delete_many([entitlement_key(user_id) for user_id in user_ids])
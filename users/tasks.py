@@ -0,0 +1,231 @@
+from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import send_mail, send_mass_mail
+from django.db import transaction
+from django.db.models import Case, When, Value, DateTimeField
+from django.utils import timezone
+from datetime import timedelta
+from channels.layers import get_channel_layer
+from asgiref.sync import async_to_sync
+from notifications.models import Notification
+from notifications.presence import NOTIFICATION_CONNECTIONS_KEY
+from .models import CustomUser, UserSubscription, LoginEvent
+from .subscription import invalidate_entitlement
+from .authentication import invalidate_cached_user
+from .login_events import claim_login_events, release_login_events, parse_events
+import logging
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 5000
+EMAIL_BATCH_SIZE = 500
+FLUSH_LOCK_KEY = "login_events:flush_lock"
+FLUSH_LOCK_SECONDS = 300
+
+try:
+    redis_instance = cache.client.get_client(write=True)
+except Exception as e:
+    logger.error(f"Redis connection error: {e}")
+    redis_instance = None
+
+
+def _batches(values, size):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def notify_users(messages):
+    if not messages:
+        return
+    Notification.objects.bulk_create(
+        [Notification(user_id=user_id, notification=message) for user_id, message in messages.items()],
+        batch_size=BATCH_SIZE
+    )
+
+    if not redis_instance:
+        return
+    # Chat presence plus users with an open notification socket.
+    online_ids = {
+        int(raw.decode() if isinstance(raw, bytes) else raw)
+        for raw in [*redis_instance.smembers("online_users"), *redis_instance.hkeys(NOTIFICATION_CONNECTIONS_KEY)]
+    }
+    channel_layer = get_channel_layer()
+    if not channel_layer:
+        return
+    for user_id in online_ids.intersection(messages):
+        async_to_sync(channel_layer.group_send)(
+            f"user_{user_id}",
+            {
+                "type": "notify",
+                "notification": messages[user_id]
+            }
+        )
+
+
+@shared_task
+def expire_subscriptions():
+    try:
+        today = timezone.now().date()
+        user_ids = list(
+            UserSubscription.objects.filter(is_active=True, expires_on__lt=today)
+            .values_list('user_id', flat=True)
+        )
+        expired = 0
+        for batch in _batches(user_ids, BATCH_SIZE):
+            # Re-check under lock: a renewal since the scan moved expires_on or holds the row.
+            with transaction.atomic():
+                expired_ids = list(
+                    UserSubscription.objects.select_for_update(skip_locked=True)
+                    .filter(user_id__in=batch, is_active=True, expires_on__lt=today)
+                    .values_list('user_id', flat=True)
+                )
+                if expired_ids:
+                    UserSubscription.objects.filter(user_id__in=expired_ids).update(
+                        is_active=False, updated_at=timezone.now()
+                    )
+                    CustomUser.objects.filter(id__in=expired_ids, status=True).update(status=False)
+            if not expired_ids:
+                continue
+
+            expired += len(expired_ids)
+            invalidate_entitlement(*expired_ids)
+            invalidate_cached_user(*expired_ids)
+            notify_users({
+                user_id: f"Your Subscription has expired from {today}. Please feel free to renew the application."
+                for user_id in expired_ids
+            })
+
+        logger.info(f"Expired {expired} subscriptions")
+        return expired
+    except Exception as e:
+        logger.error(f"Error in expire_subscriptions: {e}", exc_info=True)
+        return 0
+
+
+@shared_task
+def send_renewal_reminders():
+    try:
+        today = timezone.now().date()
+        reminder_days = getattr(settings, 'SUBSCRIPTION_REMINDER_DAYS', [3])
+        messages = {}
+        for days in sorted(reminder_days, reverse=True):
+            expires_on = today + timedelta(days=days)
+            rows = UserSubscription.objects.filter(
+                is_active=True, expires_on=expires_on
+            ).values_list('user_id', 'plan__subscription')
+            for user_id, plan in rows.iterator():
+                messages[user_id] = (
+                    f"Your {plan} subscription expires on {expires_on} ({days} days left). "
+                    f"Renew now to keep your meals coming."
+                )
+
+        notify_users(messages)
+        user_ids = list(messages)
+        for batch in _batches(user_ids, EMAIL_BATCH_SIZE):
+            send_renewal_reminder_emails.delay({str(user_id): messages[user_id] for user_id in batch})
+
+        logger.info(f"Queued renewal reminders for {len(user_ids)} users")
+        return len(user_ids)
+    except Exception as e:
+        logger.error(f"Error in send_renewal_reminders: {e}", exc_info=True)
+        return 0
+
+
+@shared_task
+def send_renewal_reminder_emails(messages):
+    try:
+        emails = CustomUser.objects.filter(id__in=messages.keys()).values_list('id', 'email')
+        datatuple = [
+            ('Subscription Renewal Reminder', messages[str(user_id)], settings.DEFAULT_FROM_EMAIL, [email])
+            for user_id, email in emails
+        ]
+        return send_mass_mail(datatuple, fail_silently=True)
+    except Exception as e:
+        logger.error(f"Error in send_renewal_reminder_emails: {e}", exc_info=True)
+        return 0
+
+
+def record_login_events(events):
+    latest = {}
+    for user_id, logged_in_at in events:
+        if user_id not in latest or logged_in_at > latest[user_id]:
+            latest[user_id] = logged_in_at
+    with transaction.atomic():
+        LoginEvent.objects.bulk_create(
+            [LoginEvent(user_id=user_id, logged_in_at=logged_in_at) for user_id, logged_in_at in events],
+            batch_size=BATCH_SIZE
+        )
+        CustomUser.objects.filter(id__in=latest).update(
+            last_login=Case(
+                *[When(id=user_id, then=Value(logged_in_at)) for user_id, logged_in_at in latest.items()],
+                output_field=DateTimeField()
+            )
+        )
+    return latest
+
+
+def announce_logins(latest):
+    invalidate_cached_user(*latest)
+    names = dict(
+        (user_id, f"{first_name} {last_name}")
+        for user_id, first_name, last_name in CustomUser.objects.filter(
+            id__in=latest
+        ).values_list('id', 'first_name', 'last_name')
+    )
+    notify_users({
+        user_id: f"Dear {names[user_id]}, you have logged in at {logged_in_at}."
+        for user_id, logged_in_at in latest.items() if user_id in names
+    })
+
+
+@shared_task
+def flush_login_events():
+    # A second flush would claim the same unreleased batch and insert it twice.
+    if not cache.add(FLUSH_LOCK_KEY, True, timeout=FLUSH_LOCK_SECONDS):
+        return 0
+    try:
+        flushed = 0
+        while True:
+            events = claim_login_events(BATCH_SIZE)
+            if not events:
+                break
+            latest = record_login_events(events)
+            release_login_events()
+            flushed += len(events)
+            announce_logins(latest)
+        return flushed
+    except Exception as e:
+        # An unrecorded batch stays claimed and is retried by the next flush.
+        logger.error(f"Error in flush_login_events: {e}", exc_info=True)
+        return 0
+    finally:
+        cache.delete(FLUSH_LOCK_KEY)
+
+
+@shared_task
+def save_login_events(entries):
+    try:
+        events = parse_events(entries)
+        if not events:
+            return 0
+        announce_logins(record_login_events(events))
+        return len(events)
+    except Exception as e:
+        logger.error(f"Error in save_login_events: {e}", exc_info=True)
+        return 0
+
+
+@shared_task
+def send_otp_email(email, subject, code):
+    try:
+        return send_mail(
+            subject,
+            f"Your OTP code is {code}",
+            settings.DEFAULT_FROM_EMAIL,
+            [email],
+            fail_silently=False
+        )
+    except Exception as e:
+        logger.error(f"Error in send_otp_email: {e}", exc_info=True)
+        return 0
@@ -4,12 +4,15 @@ from rest_framework import status, generics
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework_simplejwt.tokens import RefreshToken, TokenError
 from django.utils import timezone
+from django.db import transaction
 from datetime import timedelta
 from .models import CustomUser, UserSubscription, Subscription
 from orders.permissions import IsStaff, IsSubscribedUser
-import random
+from .subscription import has_active_subscription
+from .authentication import invalidate_cached_user
+from .login_events import record_login
+from .otp import issue_otp, get_otp_flow, OTP_TYPES
 from drf_spectacular.utils import extend_schema
-from django.core.mail import send_mail
 from django.conf import settings
 from django.core.cache import cache
 from .serializers import (
@@ -33,25 +36,7 @@ def get_tokens_for_user(user):
 
 
 def check_subscription(user):
-    if user.is_staff:
-        return False  
-    
-    try:
-        subscription = UserSubscription.objects.get(user=user)
-    except UserSubscription.DoesNotExist:
-        return True
-    
-    if subscription.expires_on < timezone.now().date():
-        subscription.is_active = False
-        subscription.save()
-        user.status = False
-        user.save()
-        return True
-    
-    if not subscription.is_active:
-        return True
-    
-    return False 
+    return not has_active_subscription(user)
 
 
 @extend_schema(
@@ -64,30 +49,10 @@ class UserRegistrationView(APIView):
     def post(self, request):
         serializer = UserRegistrationSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = serializer.save()
-
-        otp = str(random.randint(100000, 999999))
-
-        flow_key = user.email
-        cache.set(
-            f"otp_flow:{flow_key}",
-            {
-                "user_id": user.id,
-                "otp_type": "register",
-                "otp": otp,
-                "created_at": timezone.now().isoformat(),
-            },
-            timeout=300 
-        )
-        request.session['email'] = flow_key
-
-        send_mail(
-            subject='Registration Confirmation OTP',
-            message=f'Your OTP code is {otp}',
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            fail_silently=False
-        )
+        with transaction.atomic():
+            user = serializer.save()
+            issue_otp(user.email, user.id, "register", request)
+        request.session['email'] = user.email
 
         tokens = get_tokens_for_user(user)
 
@@ -121,6 +86,8 @@ class UserLoginView(APIView):
             }, status=status.HTTP_401_UNAUTHORIZED)
         
         tokens = get_tokens_for_user(user)
+        user.last_login = timezone.now()
+        record_login(user.id, user.last_login)
         return Response({
             'user': UserSerializer(user).data,
             'tokens': tokens,
@@ -142,6 +109,7 @@ class UserLogoutView(APIView):
         try:
             token = RefreshToken(refresh_token)
             token.blacklist()
+            invalidate_cached_user(request.user.id)
             return Response(
                 {"message": "Successfully logged out"},
                 status=status.HTTP_200_OK
@@ -427,51 +395,19 @@ class ResendOTPView(APIView):
                 'error': 'OTP session not found. Please start the process again.'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        flow_key = f"otp_flow:{otp_token}"
-        flow_data = cache.get(flow_key)
-        
+        flow_data = get_otp_flow(otp_token)
         if not flow_data:
             return Response({
                 'error': 'OTP session expired or invalid'
             }, status=status.HTTP_400_BAD_REQUEST)
         
-        user_id = flow_data.get("user_id")
-        otp_type = flow_data.get("otp_type")
-        
-        if otp_type not in ["register", "reset_password", "authenticate", "activate"]:
+        otp_type = flow_data["otp_type"]
+        if otp_type not in OTP_TYPES:
             return Response({
                 'error': 'Invalid OTP flow'
             }, status=status.HTTP_400_BAD_REQUEST)
-        
-        try:
-            user = CustomUser.objects.get(id=user_id)
-        except CustomUser.DoesNotExist:
-            return Response({
-                'error': 'User not found'
-            }, status=status.HTTP_404_NOT_FOUND)
-        
-        cache.delete(flow_key)
-
-        otp = str(random.randint(100000, 999999))
-
-        cache.set(
-            flow_key,
-            {
-                "user_id": user.id,
-                "otp_type": otp_type,
-                "otp": otp,
-                "created_at": timezone.now().isoformat()
-            },
-            timeout=300
-        )
 
-        send_mail(
-            subject="Your OTP Code",
-            message=f"Your OTP code is {otp}",
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
+        issue_otp(otp_token, flow_data["user_id"], otp_type, request)
 
         return Response({
             'detail': f"{otp_type.replace('_', ' ').title()} OTP resent successfully"